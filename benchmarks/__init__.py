@@ -0,0 +1 @@
+"""Benchmarks of our little unpacking stunt, to be run as modules (`python -m ...`)."""
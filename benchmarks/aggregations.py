@@ -0,0 +1,100 @@
+"""Compare ways of computing per-object aggregates over lists from JSON text.
+
+```shell
+$ python -m benchmarks.aggregations
+```
+
+The data is made of copies of the line in `tests/samples/complex.ndjson`, its `lines`
+list repeated to hold `200` items. The setups timed are:
+
+* Full unpacking (one row per line item and discount), followed by a `group_by()` per
+  JSON object on the row index.
+* Aggregations declared in the schema (`quantity: Sum(Int64)` for instance): values
+  aggregated within each list, which is not exploded.
+"""
+
+import json
+import pathlib
+import tempfile
+import time
+from collections.abc import Callable
+
+import polars as pl
+
+from polars_unpack import SchemaParser, unpack_text
+
+ITEMS: int = 200
+SCHEMA: str = """
+headers: Struct(timestamp: Int64)
+payload: Struct(
+    lines: List(
+        Struct(
+            product=products: Count(Int64)
+            quantity: Sum(Int64)
+            vatRate=vat_rate: Max(Float64)
+            amount: Struct(includingVat=amount: Sum(Float64))
+            discounts: List(Struct(promotion=discounts: Count(Int64)))
+        )
+    )
+)
+"""
+SIZE: int = 5000
+
+
+def timeit(label: str, func: Callable[[], pl.DataFrame]) -> None:
+    """Time a single run of a function.
+
+    Parameters
+    ----------
+    label : str
+        Name of the setup.
+    func : collections.abc.Callable[[], polars.DataFrame]
+        Function to time.
+
+    """
+    start = time.perf_counter()
+    df = func()
+    elapsed = time.perf_counter() - start
+
+    print(f"{label:<30} {df.height:>8} rows {elapsed:>8.2f}s")
+
+
+if __name__ == "__main__":
+    s = SchemaParser(SCHEMA)
+    s.to_struct()
+    record = json.loads(pathlib.Path("tests/samples/complex.ndjson").read_text())
+    lines = record["payload"]["lines"]
+    record["payload"]["lines"] = lines * (ITEMS // len(lines))
+
+    # each line item is repeated once per discount when exploded
+    line = pl.col("payload.lines.discounts_i").fill_null(0) == 0
+
+    with tempfile.NamedTemporaryFile(suffix=".ndjson") as f:
+        f.write("\n".join([json.dumps(record)] * SIZE).encode())
+        f.flush()
+
+        timeit(
+            "unpack + group_by",
+            lambda: (
+                unpack_text(
+                    "tests/samples/complex.schema",
+                    f.name,
+                    row_index="row",
+                    list_index="_i",
+                )
+                .group_by("row", maintain_order=True)
+                .agg(
+                    pl.col("timestamp").first(),
+                    pl.col("product").filter(line).count().alias("products"),
+                    pl.col("quantity").filter(line).sum(),
+                    pl.col("vat_rate").filter(line).max(),
+                    pl.col("line_amount_including_vat")
+                    .filter(line)
+                    .sum()
+                    .alias("amount"),
+                    pl.col("promotion").count().alias("discounts"),
+                )
+                .collect()
+            ),
+        )
+        timeit("aggregations in schema", lambda: unpack_text(s, f.name).collect())
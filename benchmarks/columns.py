@@ -0,0 +1,80 @@
+"""Compare ways of extracting a few columns out of any list from JSON text.
+
+```shell
+$ python -m benchmarks.columns
+```
+
+The data is made of copies of the lines in `tests/samples/complex.ndjson`, and the
+requested columns are `timestamp`, `location` and `method`. The setups timed are:
+
+* Full unpacking, followed by the selection of the columns (rows still multiplied by
+  the exploded lists).
+* `unpack_text(..., columns=[...])`: schema pruned before decoding.
+* `str.json_path_match()`: one JSON path extraction per column on the raw text (not
+  used by this package, each call parsing the whole JSON object again).
+"""
+
+import pathlib
+import tempfile
+import time
+from collections.abc import Callable
+
+import polars as pl
+
+from polars_unpack import parse_schema, scan_text, unpack_text
+
+COLUMNS: dict[str, pl.DataType] = {
+    "headers.timestamp": pl.Int64,
+    "payload.location": pl.Int64,
+    "payload.payment.method": pl.String,
+}
+SIZE: int = 200000
+
+
+def timeit(label: str, func: Callable[[], pl.DataFrame]) -> None:
+    """Time a single run of a function.
+
+    Parameters
+    ----------
+    label : str
+        Name of the setup.
+    func : collections.abc.Callable[[], polars.DataFrame]
+        Function to time.
+
+    """
+    start = time.perf_counter()
+    df = func()
+    elapsed = time.perf_counter() - start
+
+    print(f"{label:<30} {df.height:>8} rows {elapsed:>8.2f}s")
+
+
+if __name__ == "__main__":
+    s = parse_schema("tests/samples/complex.schema")
+    lines = pathlib.Path("tests/samples/complex.ndjson").read_text().split("\n")
+    lines = [line for line in lines if line.strip()]
+    columns = [s.json_paths[p] for p in COLUMNS]
+
+    with tempfile.NamedTemporaryFile(suffix=".ndjson") as f:
+        f.write("\n".join(lines * (SIZE // len(lines))).encode())
+        f.flush()
+
+        timeit(
+            "unpack + select",
+            lambda: unpack_text(s, f.name).select(columns).collect(),
+        )
+        timeit(
+            "unpack_text(columns=...)",
+            lambda: unpack_text(s, f.name, columns=columns).collect(),
+        )
+        timeit(
+            "str.json_path_match()",
+            lambda: (
+                scan_text(f.name)
+                .select(
+                    pl.col("raw").str.json_path_match(f"$.{p}").cast(d).alias(c)
+                    for (p, d), c in zip(COLUMNS.items(), columns, strict=True)
+                )
+                .collect()
+            ),
+        )
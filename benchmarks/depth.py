@@ -0,0 +1,66 @@
+"""Time the construction of unpacking plans against the nesting depth of the schema.
+
+```shell
+$ python -m benchmarks.depth
+```
+
+Generated schemas nest the same object over and over (tree-shaped configurations for
+instance), either as a `Struct` (an attribute and the next level) or as a `List` of
+`Struct` (the next level only, exploded). Only the construction of the lazy plan by
+`UnpackFrame.unpack()` is timed (including the one-off resolution of the schema of the
+input by `Polars`, most of it at depth); optimizing and running plans that deep is up to
+`Polars`.
+"""
+
+import time
+
+import polars as pl
+
+from polars_unpack import UnpackFrame
+
+DEPTHS: tuple[int, ...] = (10, 50, 100, 200, 500, 1000)
+
+
+def nest(kind: str, depth: int) -> pl.Struct:
+    """Generate a schema nesting the same object over and over.
+
+    Parameters
+    ----------
+    kind : str
+        `struct` for nested `Struct`, `list` for nested `List` of `Struct`.
+    depth : int
+        Number of nesting levels.
+
+    Returns
+    -------
+    : polars.Struct
+        Generated schema, a single `root` field.
+
+    """
+    dtype = pl.Int64
+    for _ in range(depth):
+        if kind == "struct":
+            dtype = pl.Struct({"attr": pl.Int64, "next": dtype})
+        else:
+            dtype = pl.List(pl.Struct({"next": dtype}))
+
+    return pl.Struct({"root": dtype})
+
+
+if __name__ == "__main__":
+    for kind in ("struct", "list"):
+        for depth in DEPTHS:
+            dtype = nest(kind, depth)
+            # cast from a null column, cheaper than building an empty frame that deep
+            df = pl.LazyFrame({"root": [None]}).select(
+                pl.col("root").cast(dtype.fields[0].dtype)
+            )
+
+            start = time.perf_counter()
+            UnpackFrame(df).unpack(dtype, list_index="_i")
+            elapsed = time.perf_counter() - start
+
+            print(
+                f"{kind:<6} depth {depth:>5} {elapsed * 1000:>9.2f}ms "
+                f"{elapsed * 1e6 / depth:>7.1f}us per level",
+            )
@@ -0,0 +1,50 @@
+"""Compare the latency of unpacking a handful of records, flattened in Python or not.
+
+```shell
+$ python -m benchmarks.latency
+```
+
+The records are copies of the ones in `tests/samples/complex.ndjson`; the schema is
+parsed (and compiled) once, as a request-time enrichment service would do. The two
+setups timed are:
+
+* `RecordFlattener`: the default for small batches in `unpack_records()`.
+* `Polars` pipeline: forced by setting `small_batch=0`.
+
+Measured on a laptop: about 60-90 us per record flattened in Python (0.3 ms for a
+single record), against 7-9 ms per batch for the `Polars` pipeline, hence a break-even
+point of about 100 records.
+"""
+
+import json
+import pathlib
+import time
+
+from polars_unpack import parse_schema, unpack_records
+
+REPEAT: int = 200
+SIZES: tuple[int, ...] = (1, 10, 50, 100, 200)
+
+if __name__ == "__main__":
+    s = parse_schema("tests/samples/complex.schema")
+    sample = [
+        json.loads(line)
+        for line in pathlib.Path("tests/samples/complex.ndjson").read_text().split("\n")
+        if line.strip()
+    ]
+
+    for n in SIZES:
+        records = (sample * (n // len(sample) + 1))[:n]
+
+        for label, small_batch in (("RecordFlattener", n), ("Polars pipeline", 0)):
+            unpack_records(records, s, small_batch=small_batch)
+
+            start = time.perf_counter()
+            for _ in range(REPEAT):
+                unpack_records(records, s, small_batch=small_batch)
+            elapsed = (time.perf_counter() - start) / REPEAT
+
+            print(
+                f"{label:<16} {n:>4} records {elapsed * 1e6:>10,.0f} us/batch "
+                f"{elapsed * 1e6 / n:>8,.0f} us/record",
+            )
@@ -0,0 +1,109 @@
+"""Compare ways of packing unpacked content back into nested JSON objects.
+
+```shell
+$ python -m benchmarks.pack
+```
+
+The data is made of copies of the line in `tests/samples/complex.ndjson`, unpacked
+with its lineage columns (row index and list positions). The setups timed are:
+
+* Python objects built row by row, grouping rows per JSON object (row index) and
+  items per list (positions), before serializing each object via `json.dumps()`.
+* `pack()`: lists rebuilt with vectorized `group_by()` operations from the deepest
+  up, the nested content written as newline-delimited JSON in bulk.
+"""
+
+import json
+import pathlib
+import time
+from collections.abc import Callable
+
+import polars as pl
+
+from polars_unpack import SchemaParser, pack, parse_schema, unpack_text
+
+SIZE: int = 20000
+
+
+def by_row(df: pl.DataFrame, s: SchemaParser) -> list[str]:
+    """Pack unpacked content into JSON objects row by row, in Python.
+
+    Parameters
+    ----------
+    df : polars.DataFrame
+        Unpacked content, including its lineage columns.
+    s : SchemaParser
+        Parsed schema.
+
+    Returns
+    -------
+    : list[str]
+        Serialized JSON objects.
+
+    """
+    objects: dict[int, dict] = {}
+
+    for row in df.iter_rows(named=True):
+        o = objects.setdefault(row["row"], {})
+
+        def _fill(target: dict, dtype: pl.DataType, json_path: str) -> None:
+            """Fill an object with the values of the row."""
+            # quick work
+            for f in dtype.fields:
+                jp = f"{json_path}.{f.name}".lstrip(".")
+                if type(f.dtype) == pl.List:
+                    items = target.setdefault(f.name, {})
+                    if (i := row[f"{jp}_i"]) is not None:  # noqa: B023
+                        _fill(items.setdefault(i, {}), f.dtype.inner, jp)
+                elif type(f.dtype) == pl.Struct:
+                    _fill(target.setdefault(f.name, {}), f.dtype, jp)
+                else:
+                    target[f.name] = row[s.json_paths.get(jp, jp)]  # noqa: B023
+
+        _fill(o, s.struct, "")
+
+    def _lists(value: object) -> object:
+        """Turn the dictionaries of items into lists, sorted by position."""
+        # quick work
+        if isinstance(value, dict):
+            if value and all(isinstance(k, int) for k in value):
+                return [_lists(value[k]) for k in sorted(value)]
+            return {k: _lists(v) for k, v in value.items()}
+        return value
+
+    return [json.dumps(_lists(objects[k])) for k in sorted(objects)]
+
+
+def timeit(label: str, func: Callable[[], object]) -> None:
+    """Time a single run of a function.
+
+    Parameters
+    ----------
+    label : str
+        Name of the setup.
+    func : collections.abc.Callable[[], object]
+        Function to time.
+
+    """
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+
+    print(f"{label:<30} {SIZE:>8} objects {elapsed:>8.2f}s")
+
+
+if __name__ == "__main__":
+    s = parse_schema("tests/samples/complex.schema")
+    line = pathlib.Path("tests/samples/complex.ndjson").read_text().strip()
+    df = unpack_text(
+        s,
+        f"{line}\n".encode() * SIZE,
+        row_index="row",
+        list_index="_i",
+    ).collect()
+
+    timeit("python objects row by row", lambda: by_row(df, s))
+    timeit(
+        "pack()",
+        lambda: pack(df, s, "row", "_i").collect().write_ndjson(),
+    )
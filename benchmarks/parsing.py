@@ -0,0 +1,38 @@
+"""Time the parsing of plain text schemas against their width and nesting depth.
+
+```shell
+$ python -m benchmarks.parsing
+```
+
+Generated schemas group leaves by a hundred under a chain of nested objects; the time and
+peak memory allocated are reported from 1k to 100k leaves, nesting depth from 1 to 50,
+for the three setups also gated (on a reduced set of sizes) by `tests/test_scaling.py`:
+
+* `parse_text`: `SchemaParser.to_struct()` on the plain text schema.
+* `parse_file`: `parse_schema()` on a file.
+* `parse_error`: formatting the error raised by a schema faulty on its end.
+"""
+
+import pathlib
+import tempfile
+
+from tests.test_scaling import (
+    generate_schema,
+    measure,
+    parse_error,
+    parse_file,
+    parse_text,
+)
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as tmp:
+        for parse in (parse_text, parse_file, parse_error):
+            print(f"\n{parse.__name__}\n")
+            print(f"{'leaves':>8} {'depth':>6} {'time (s)':>10} {'peak (MB)':>10}")
+            for depth in (1, 10, 50):
+                for leaves in (1000, 10000, 100000):
+                    t, m = measure(
+                        parse(generate_schema(leaves, depth), pathlib.Path(tmp)),
+                        repeat=1,
+                    )
+                    print(f"{leaves:>8} {depth:>6} {t:>10.3f} {m / 1024**2:>10.1f}")
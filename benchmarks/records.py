@@ -0,0 +1,67 @@
+"""Compare unpacking Python records directly, or serialized back to JSON text first.
+
+```shell
+$ python -m benchmarks.records
+```
+
+The records are copies of the ones in `tests/samples/complex.ndjson`; the two setups
+timed are:
+
+* `unpack_records()`: records converted straight to `Polars` objects, chunk by chunk.
+* `json.dumps() + unpack_text()`: records serialized back to newline-delimited JSON in
+  memory, then decoded by `Polars`.
+"""
+
+import json
+import pathlib
+import time
+from collections.abc import Callable
+
+from polars_unpack import parse_schema, unpack_records, unpack_text
+
+SIZES: tuple[int, ...] = (1000, 10000, 100000)
+
+
+def timeit(label: str, func: Callable[[], object], n: int) -> None:
+    """Time a single run of a function.
+
+    Parameters
+    ----------
+    label : str
+        Name of the setup.
+    func : collections.abc.Callable
+        Function to time.
+    n : int
+        Number of records processed by the function.
+
+    """
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+
+    print(f"{label:<30} {n:>8} records {n / elapsed:>12,.0f} records/s")
+
+
+if __name__ == "__main__":
+    s = parse_schema("tests/samples/complex.schema")
+    sample = [
+        json.loads(line)
+        for line in pathlib.Path("tests/samples/complex.ndjson").read_text().split("\n")
+        if line.strip()
+    ]
+
+    # warm up (imports, thread pool)
+    unpack_records(sample, s)
+
+    for n in SIZES:
+        records = (sample * (n // len(sample) + 1))[:n]
+
+        timeit("unpack_records()", lambda: unpack_records(records, s), n)  # noqa: B023
+        timeit(
+            "json.dumps() + unpack_text()",
+            lambda: unpack_text(
+                s,
+                "\n".join(json.dumps(r) for r in records).encode(),  # noqa: B023
+            ).collect(),
+            n,
+        )
@@ -0,0 +1,79 @@
+"""Compare the latency of unpacking small files via the cold CLI or the warm server.
+
+```shell
+$ python -m benchmarks.startup
+```
+
+Three setups are timed, each unpacking the same small file into a Parquet file:
+
+* `cold cli`: a new `polars-unpack unpack` process per file, paying for the interpreter,
+  the import of `Polars` and the parsing of the schema each time.
+* `warm server (client script)`: a new `client.py` process per file (standard library
+  only) talking to a running server.
+* `warm server (in-process)`: a request per file sent from an already running
+  interpreter, the lower bound of the server latency.
+"""
+
+import pathlib
+import subprocess
+import sys
+import tempfile
+import time
+
+from polars_unpack.client import request_unpack
+
+ROUNDS: int = 20
+SCHEMA: str = "tests/samples/complex.schema"
+DATA: str = "tests/samples/complex.ndjson"
+CLIENT: str = str(pathlib.Path("polars_unpack/client.py").resolve())
+
+
+def timeit(label: str, command: list[str] | None = None, **kwargs) -> None:
+    """Time a number of rounds of a command (subprocess) or a request (in-process).
+
+    Parameters
+    ----------
+    label : str
+        Name of the setup.
+    command : list[str] | None
+        Command to run as a subprocess; defaults to `None`, in which case the request
+        is sent from this very interpreter.
+
+    """
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        if command is None:
+            request_unpack(SCHEMA, DATA, **kwargs)
+        else:
+            subprocess.run(command, check=True, capture_output=True)
+    elapsed = (time.perf_counter() - start) / ROUNDS
+
+    print(f"{label:<30} {elapsed * 1000:>10.1f} ms/file")
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as tmp:
+        socket = f"{tmp}/polars-unpack.sock"
+        output = f"{tmp}/unpacked.parquet"
+
+        server = subprocess.Popen(
+            [sys.executable, "-m", "polars_unpack", "serve", "--socket", socket],
+        )
+        while not pathlib.Path(socket).exists():
+            time.sleep(0.1)
+
+        try:
+            timeit(
+                "cold cli",
+                [sys.executable, "-m", "polars_unpack", "unpack", SCHEMA, DATA]
+                + ["--output", output],
+            )
+            timeit(
+                "warm server (client script)",
+                [sys.executable, CLIENT, SCHEMA, DATA, "--output", output]
+                + ["--socket", socket],
+            )
+            timeit("warm server (in-process)", output=output, socket=socket)
+        finally:
+            server.terminate()
+            server.wait()
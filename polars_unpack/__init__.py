@@ -2,14 +2,37 @@
 
 from .unpack import (
     POLARS_DATATYPES,
+    ColumnStatistics,
     DuplicateColumnError,
+    ErrorRateExceededError,
+    LineageError,
+    PartitionWriter,
     PathRenamingError,
+    RecordFlattener,
     SchemaParser,
     SchemaParsingError,
     UnknownDataTypeError,
+    UnknownFormatError,
     UnpackFrame,
+    UnpackReport,
+    explain_unpack,
     infer_schema,
+    iter_array,
+    iter_batches,
+    pack,
     parse_schema,
+    preview,
+    scan_text,
+    sink,
+    unpack_columnar,
+    unpack_ipc,
     unpack_ndjson,
+    unpack_parquet,
+    unpack_raw,
+    unpack_records,
+    unpack_routes,
     unpack_text,
+    unpack_tolerant,
+    unpack_versions,
+    validate,
 )
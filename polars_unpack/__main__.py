@@ -0,0 +1,7 @@
+"""Allow running the command line interface via `python -m polars_unpack`."""
+
+import sys
+
+from .cli import main
+
+sys.exit(main())
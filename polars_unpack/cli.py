@@ -0,0 +1,467 @@
+"""Command line interface to infer schemas, and unpack or convert JSON content.
+
+Once the package is installed, the following are equivalent:
+
+```shell
+$ polars-unpack --help
+$ python -m polars_unpack --help
+```
+
+Seven subcommands are available:
+
+* `infer` prints the schema inferred by `Polars` from some newline-delimited JSON data,
+  to be used as a starting point when writing a schema by hand.
+* `preview` prints the first unpacked rows of JSON data, reading only as much of it as
+  necessary (interactive even on very large files).
+* `unpack` unpacks JSON data given a schema, and writes the result to Parquet, IPC, CSV
+  or newline-delimited JSON files (streaming whenever possible).
+* `convert` decodes JSON data given a schema, and writes the result _without_ unpacking
+  it (nested `Struct` and `List` columns are kept as such).
+* `ingest` unpacks only the new files (or the content appended to files) since the last
+  run, as recorded in a checkpoint file (see the `ingest` module).
+* `follow` follows a growing file, unpacking new lines in micro-batches written to an
+  output directory (one file per batch) or `stdout` (see the `ingest` module).
+* `serve` starts a long-running server keeping `Polars` loaded and parsed schemas in
+  memory, to avoid paying for these for each file (see the `server` module).
+
+For instance (the Arrow IPC stream written on `stdout` in the last line could be piped
+to any consumer reading Arrow):
+
+```shell
+$ polars-unpack infer --sample 1000 tests/samples/complex.ndjson
+$ polars-unpack preview tests/samples/complex.schema tests/samples/complex.ndjson -n 3
+$ polars-unpack unpack tests/samples/complex.schema tests/samples/*.ndjson \\
+>   --output /tmp/unpacked --format parquet --columns timestamp,product \\
+>   --filter "quantity > 1" --jobs 4 --threads 8 --progress
+$ polars-unpack unpack tests/samples/complex.schema tests/samples/complex.ndjson \
+>   --output - --format ipc_stream
+```
+
+When multiple input files are provided, the output is a directory in which one file per
+input is written (named after the path of the input file relative to the directory
+common to all inputs, such that `a/x.ndjson` and `b/x.ndjson` do not overwrite each
+other); input files are processed in parallel.
+"""
+
+import argparse
+import os
+import pathlib
+import sys
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import polars as pl
+
+from .ingest import follow, ingest
+from .server import serve
+from .unpack import (
+    SINK_FORMATS,
+    infer_schema,
+    parse_schema,
+    preview,
+    scan_text,
+    sink,
+    unpack_ndjson,
+    unpack_text,
+)
+
+
+def convert(args: argparse.Namespace, path_data: str) -> pl.LazyFrame:
+    """Decode JSON data given a schema, without unpacking it.
+
+    Parameters
+    ----------
+    args : argparse.Namespace
+        Parsed command line arguments.
+    path_data : str
+        Path to the JSON file (or multiple files via glob patterns).
+
+    Returns
+    -------
+    : polars.LazyFrame
+        Decoded, nested JSON content.
+
+    """
+    s = parse_schema(args.schema)
+
+    if args.ndjson:
+        return pl.scan_ndjson(path_data, schema=s.struct.to_schema())
+
+    return (
+        scan_text(path_data, args.separator)
+        .select(pl.col("raw").str.json_decode(s.struct))
+        .unnest("raw")
+    )
+
+
+def follow_file(args: argparse.Namespace) -> int:
+    """Follow a growing file, and write each unpacked micro-batch.
+
+    Parameters
+    ----------
+    args : argparse.Namespace
+        Parsed command line arguments.
+
+    Returns
+    -------
+    : int
+        Exit code.
+
+    """
+    stem = pathlib.Path(args.data).stem
+    fmt = args.format or ("ndjson" if args.output == "-" else "parquet")
+
+    if args.output != "-":
+        pathlib.Path(args.output).mkdir(parents=True, exist_ok=True)
+
+    try:
+        for df in follow(
+            args.schema,
+            args.data,
+            None if args.from_end else 0,
+            args.interval,
+            idle_timeout=args.idle_timeout,
+            separator=args.separator,
+        ):
+            if args.output == "-":
+                path = "-"
+            else:
+                path = str(pathlib.Path(args.output) / f"{stem}-{time.time_ns()}.{fmt}")
+            sink(df.lazy(), path, fmt)
+    except KeyboardInterrupt:
+        pass
+
+    return 0
+
+
+def unpack(args: argparse.Namespace, path_data: str) -> pl.LazyFrame:
+    """Unpack JSON data given a schema, filter and select the resulting columns.
+
+    Parameters
+    ----------
+    args : argparse.Namespace
+        Parsed command line arguments.
+    path_data : str
+        Path to the JSON file (or multiple files via glob patterns).
+
+    Returns
+    -------
+    : polars.LazyFrame
+        Unpacked JSON content.
+
+    """
+    if args.ndjson:
+        df = unpack_ndjson(args.schema, path_data)
+    else:
+        df = unpack_text(args.schema, path_data, args.separator)
+
+    if args.filter is not None:
+        df = df.filter(pl.sql_expr(args.filter))
+    if args.columns is not None:
+        df = df.select(args.columns.split(","))
+
+    return df
+
+
+def output_path(
+    args: argparse.Namespace,
+    path_data: str,
+    root: pathlib.Path,
+) -> pathlib.Path:
+    """Determine the path of the output file associated with an input file.
+
+    Parameters
+    ----------
+    args : argparse.Namespace
+        Parsed command line arguments.
+    path_data : str
+        Path to the input file.
+    root : pathlib.Path
+        Directory common to all input files, the output file mirroring the path of the
+        input file relative to it.
+
+    Returns
+    -------
+    : pathlib.Path
+        Path to the output file.
+
+    """
+    output = pathlib.Path(args.output)
+
+    # single input and explicit output file, or stdout
+    if len(args.data) == 1 and (
+        args.output == "-" or output.suffix.lower() in SINK_FORMATS
+    ):
+        return output
+
+    # otherwise write in a directory, one file per input
+    path = output / pathlib.Path(path_data).resolve().relative_to(root)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    return path.with_suffix(f".{args.format or 'parquet'}")
+
+
+def process(
+    args: argparse.Namespace,
+    build: Callable[[argparse.Namespace, str], pl.LazyFrame],
+) -> int:
+    """Build and write the output for each input file, in parallel.
+
+    Parameters
+    ----------
+    args : argparse.Namespace
+        Parsed command line arguments.
+    build : collections.abc.Callable[[argparse.Namespace, str], polars.LazyFrame]
+        Function building the `LazyFrame` to write from the input file.
+
+    Returns
+    -------
+    : int
+        Exit code: `0` if all files were processed successfully, `1` otherwise.
+
+    """
+    code = 0
+    start = time.perf_counter()
+    root = pathlib.Path(
+        os.path.commonpath([pathlib.Path(p).resolve().parent for p in args.data]),
+    )
+
+    def _process(path_data: str) -> pathlib.Path:
+        """Build and write the output for a single input file."""
+        path = output_path(args, path_data, root)
+        sink(build(args, path_data), str(path), args.format)
+
+        return path
+
+    with ThreadPoolExecutor(max_workers=args.jobs) as executor:
+        futures = {executor.submit(_process, p): p for p in args.data}
+
+        for i, future in enumerate(as_completed(futures), start=1):
+            try:
+                path = future.result()
+            except Exception as e:  # noqa: BLE001
+                code = 1
+                sys.stderr.write(f"[{i}/{len(futures)}] {futures[future]}: {e}\n")
+            else:
+                if args.progress:
+                    sys.stderr.write(
+                        f"[{i}/{len(futures)}] {futures[future]} -> {path} "
+                        f"({time.perf_counter() - start:.2f}s)\n",
+                    )
+
+    return code
+
+
+def parser() -> argparse.ArgumentParser:
+    """Define the command line arguments.
+
+    Returns
+    -------
+    : argparse.ArgumentParser
+        Command line parser, including all subcommands.
+
+    """
+    p = argparse.ArgumentParser(
+        prog="polars-unpack",
+        description="Automated, schema-based JSON unpacking to Polars objects.",
+    )
+    sp = p.add_subparsers(dest="command", required=True)
+
+    # infer
+    pi = sp.add_parser("infer", help="print the schema inferred from ndjson data")
+    pi.add_argument("data", help="path to the ndjson file")
+    pi.add_argument(
+        "--sample",
+        type=int,
+        default=100,
+        help="number of lines used to infer the schema; 0 for all (default: 100)",
+    )
+
+    # preview
+    pp = sp.add_parser("preview", help="print the first unpacked rows of JSON data")
+    pp.add_argument("schema", help="path to the plain text schema")
+    pp.add_argument("data", help="path to the JSON file (or quoted glob pattern)")
+    pp.add_argument(
+        "-n",
+        "--rows",
+        type=int,
+        default=10,
+        help="number of unpacked rows to print (default: 10)",
+    )
+    pp.add_argument("--columns", help="comma-separated list of columns to print")
+    pp.add_argument(
+        "--separator",
+        default="|",
+        help="separator absent from the data when read as plain text (default: |)",
+    )
+
+    # unpack & convert
+    for command, help_ in (
+        ("unpack", "unpack JSON data given a schema"),
+        ("convert", "decode JSON data given a schema, without unpacking it"),
+    ):
+        pc = sp.add_parser(command, help=help_)
+        pc.add_argument("schema", help="path to the plain text schema")
+        pc.add_argument("data", nargs="+", help="path(s) to the JSON file(s)")
+        pc.add_argument(
+            "-o",
+            "--output",
+            required=True,
+            help="output file (- for stdout), or directory if multiple inputs",
+        )
+        pc.add_argument(
+            "-f",
+            "--format",
+            choices=sorted(set(SINK_FORMATS.values())),
+            help="output format (default: guessed from the output file, or parquet)",
+        )
+        pc.add_argument(
+            "--ndjson",
+            action="store_true",
+            help="read the data as JSON via scan_ndjson() instead of plain text",
+        )
+        pc.add_argument(
+            "--separator",
+            default="|",
+            help="separator absent from the data when read as plain text (default: |)",
+        )
+        pc.add_argument(
+            "-j",
+            "--jobs",
+            type=int,
+            default=1,
+            help="number of input files processed in parallel (default: 1)",
+        )
+        pc.add_argument("--threads", type=int, help="size of the Polars thread pool")
+        pc.add_argument(
+            "--progress",
+            action="store_true",
+            help="report progress on stderr",
+        )
+
+        if command == "unpack":
+            pc.add_argument("--columns", help="comma-separated list of columns to keep")
+            pc.add_argument("--filter", help="SQL expression to filter rows with")
+
+    # ingest
+    pg = sp.add_parser("ingest", help="unpack new content only (see ingest module)")
+    pg.add_argument("schema", help="path to the plain text schema")
+    pg.add_argument("data", help="path to the JSON files (quoted glob pattern)")
+    pg.add_argument("-o", "--output", required=True, help="output directory")
+    pg.add_argument("-c", "--checkpoint", required=True, help="checkpoint file")
+    pg.add_argument(
+        "-f",
+        "--format",
+        default="parquet",
+        choices=sorted(set(SINK_FORMATS.values()) - {"ipc_stream"}),
+        help="output format (default: parquet)",
+    )
+    pg.add_argument(
+        "--separator",
+        default="|",
+        help="separator absent from the data when read as plain text (default: |)",
+    )
+    pg.add_argument("--threads", type=int, help="size of the Polars thread pool")
+
+    # follow
+    pf = sp.add_parser("follow", help="follow a growing file (see ingest module)")
+    pf.add_argument("schema", help="path to the plain text schema")
+    pf.add_argument("data", help="path to the ndjson file")
+    pf.add_argument(
+        "-o",
+        "--output",
+        required=True,
+        help="output directory (one file per batch), or - for stdout",
+    )
+    pf.add_argument(
+        "-f",
+        "--format",
+        choices=sorted(set(SINK_FORMATS.values())),
+        help="output format (default: ndjson for stdout, parquet otherwise)",
+    )
+    pf.add_argument(
+        "--from-end",
+        action="store_true",
+        help="start from the end of the file instead of its beginning",
+    )
+    pf.add_argument(
+        "--interval",
+        type=float,
+        default=0.5,
+        help="seconds to wait for new lines once at the end of the file (default: 0.5)",
+    )
+    pf.add_argument(
+        "--idle-timeout",
+        type=float,
+        help="seconds without new lines after which to stop (default: never)",
+    )
+    pf.add_argument(
+        "--separator",
+        default="|",
+        help="separator absent from the data when read as plain text (default: |)",
+    )
+    pf.add_argument("--threads", type=int, help="size of the Polars thread pool")
+
+    # serve
+    ps = sp.add_parser("serve", help="serve unpacking requests (see server module)")
+    ps.add_argument("--host", default="127.0.0.1", help="(default: 127.0.0.1)")
+    ps.add_argument("--port", type=int, default=8765, help="(default: 8765)")
+    ps.add_argument("--socket", help="path to a Unix socket to listen to instead")
+    ps.add_argument("--threads", type=int, help="size of the Polars thread pool")
+
+    return p
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the command line interface.
+
+    Parameters
+    ----------
+    argv : list[str] | None
+        Command line arguments; defaults to `None`, in which case `sys.argv` is used.
+
+    Returns
+    -------
+    : int
+        Exit code.
+
+    """
+    args = parser().parse_args(argv)
+
+    if args.command == "infer":
+        sys.stdout.write(
+            f"{infer_schema(args.data, infer_schema_length=args.sample or None)}\n",
+        )
+        return 0
+
+    if args.command == "preview":
+        columns = None if args.columns is None else args.columns.split(",")
+        df = preview(args.schema, args.data, args.rows, args.separator, columns)
+        sys.stdout.write(f"{df}\n")
+        return 0
+
+    # the polars thread pool is only instantiated when first used
+    if args.threads is not None:
+        os.environ["POLARS_MAX_THREADS"] = str(args.threads)
+
+    if args.command == "ingest":
+        for path in ingest(
+            args.schema,
+            args.data,
+            args.output,
+            args.checkpoint,
+            args.format,
+            args.separator,
+        ):
+            sys.stdout.write(f"{path}\n")
+        return 0
+
+    if args.command == "follow":
+        return follow_file(args)
+
+    if args.command == "serve":
+        serve(args.host, args.port, args.socket)
+        return 0
+
+    return process(args, unpack if args.command == "unpack" else convert)
@@ -0,0 +1,185 @@
+"""Thin client talking to the unpacking server (see the `server` module).
+
+This module relies on the standard library only, such that it can be run as a script
+without paying for the import of `Polars` (nor of this package):
+
+```shell
+$ python polars_unpack/client.py --socket /tmp/polars-unpack.sock \\
+>   tests/samples/complex.schema tests/samples/complex.ndjson --output /tmp/out.parquet
+$ cat tests/samples/complex.ndjson | python polars_unpack/client.py --port 8765 \\
+>   tests/samples/complex.schema - > /tmp/out.arrow
+```
+
+When no output file is requested, the Arrow IPC stream returned by the server is written
+on `stdout`.
+"""
+
+import argparse
+import http.client
+import json
+import pathlib
+import socket
+import sys
+import urllib.parse
+
+
+class UnixHTTPConnection(http.client.HTTPConnection):
+    """HTTP connection over a Unix socket."""
+
+    def __init__(self, path: str, timeout: float | None = None) -> None:
+        """Instantiate the object.
+
+        Parameters
+        ----------
+        path : str
+            Path to the Unix socket.
+        timeout : float | None
+            Timeout of the connection in seconds; defaults to `None` (no timeout).
+
+        """
+        super().__init__("localhost", timeout=timeout)
+        self.path = path
+
+    def connect(self) -> None:
+        """Connect to the Unix socket."""
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(self.timeout)
+        self.sock.connect(self.path)
+
+
+class ServerError(Exception):
+    """When the server fails to process a request."""
+
+
+def request_unpack(
+    path_schema: str,
+    path_data: str | None = None,
+    data: bytes | None = None,
+    output: str | None = None,
+    fmt: str | None = None,
+    host: str = "127.0.0.1",
+    port: int = 8765,
+    socket: str | None = None,
+) -> bytes | str:
+    """Send an unpacking request to the server.
+
+    Parameters
+    ----------
+    path_schema : str
+        Path to the plain text schema, as seen by the server.
+    path_data : str | None
+        Path to the JSON file (or multiple files via glob patterns), as seen by the
+        server; defaults to `None`, in which case `data` is sent.
+    data : bytes | None
+        Inline newline-delimited JSON content; defaults to `None`.
+    output : str | None
+        Path to the output file to write on the server side; defaults to `None`, in
+        which case the result is returned as an Arrow IPC stream.
+    fmt : str | None
+        Output format; defaults to `None` (guessed from the extension of the file).
+    host : str
+        Host the server listens to; defaults to `127.0.0.1`.
+    port : int
+        Port the server listens to; defaults to `8765`.
+    socket : str | None
+        Path to the Unix socket the server listens to, if any; defaults to `None`.
+
+    Returns
+    -------
+    : bytes | str
+        Arrow IPC stream, or path to the output file.
+
+    Raises
+    ------
+    : ServerError
+        When the server fails to process the request.
+
+    """
+    query = {"schema": str(pathlib.Path(path_schema).resolve())}
+    if path_data is not None:
+        query["data"] = str(pathlib.Path(path_data).resolve())
+    if output is not None:
+        query["output"] = str(pathlib.Path(output).resolve())
+    if fmt is not None:
+        query["format"] = fmt
+
+    conn = (
+        http.client.HTTPConnection(host, port)
+        if socket is None
+        else UnixHTTPConnection(socket)
+    )
+
+    try:
+        # the server might respond (and close the connection) before reading the whole
+        # request, in which case its response still explains why
+        try:
+            conn.request("POST", f"/unpack?{urllib.parse.urlencode(query)}", body=data)
+        except OSError as e:
+            error = e
+        else:
+            error = None
+        try:
+            response = conn.getresponse()
+            body = response.read()
+        except (OSError, http.client.HTTPException):
+            if error is not None:
+                raise error from None
+            raise
+    finally:
+        conn.close()
+
+    if response.status != 200:
+        raise ServerError(body.decode())
+
+    return json.loads(body)["output"] if output is not None else body
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the thin client from the command line.
+
+    Parameters
+    ----------
+    argv : list[str] | None
+        Command line arguments; defaults to `None`, in which case `sys.argv` is used.
+
+    Returns
+    -------
+    : int
+        Exit code.
+
+    """
+    p = argparse.ArgumentParser(description="Send an unpacking request to the server.")
+    p.add_argument("schema", help="path to the plain text schema")
+    p.add_argument("data", help="path to the JSON file, or - to send stdin")
+    p.add_argument("-o", "--output", help="output file written by the server")
+    p.add_argument("-f", "--format", help="output format")
+    p.add_argument("--host", default="127.0.0.1", help="(default: 127.0.0.1)")
+    p.add_argument("--port", type=int, default=8765, help="(default: 8765)")
+    p.add_argument("--socket", help="path to the Unix socket of the server")
+    args = p.parse_args(argv)
+
+    try:
+        result = request_unpack(
+            args.schema,
+            None if args.data == "-" else args.data,
+            sys.stdin.buffer.read() if args.data == "-" else None,
+            args.output,
+            args.format,
+            args.host,
+            args.port,
+            args.socket,
+        )
+    except (ServerError, OSError) as e:
+        sys.stderr.write(f"{e}\n")
+        return 1
+
+    if isinstance(result, bytes):
+        sys.stdout.buffer.write(result)
+    else:
+        sys.stdout.write(f"{result}\n")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,428 @@
+"""Incremental ingestion of growing files and directories of JSON content.
+
+Landing directories (or append-only files) are unpacked over and over again by batch
+jobs; the functions below only unpack what was not yet:
+
+```shell
+$ polars-unpack ingest tests/samples/complex.schema "landing/*.ndjson" \\
+>   --output unpacked/ --checkpoint unpacked.checkpoint
+```
+
+A small JSON checkpoint keeps track of the files seen (byte offset up to which each was
+unpacked, size, modification time, inode, checksum of the bytes preceding the offset and
+number of lines) and of a hash of the schema:
+
+* New files are unpacked entirely, files grown since are unpacked from the last offset.
+* Only complete (newline-terminated) lines are unpacked, the last line of a file being
+  possibly still written.
+* Files shrunk (truncated), replaced or rewritten since are unpacked again from the
+  start; a file modified since is rewritten if the bytes preceding its offset changed
+  (truncated in place then written over past that offset, as after a `copytruncate`
+  rotation).
+* New content is appended to the output directory, one file per input file and range of
+  bytes; a modification of the schema removes all previous output files before
+  unpacking everything again.
+
+Files written around the clock can also be followed (_à la_ `tail -F`), the complete
+lines being unpacked in micro-batches as soon as they are written:
+
+```shell
+$ polars-unpack follow tests/samples/complex.schema producer.ndjson --output unpacked/
+```
+
+Partial lines are held back until complete, and the file is opened again when rotated
+(replaced or truncated).
+"""
+
+import glob
+import hashlib
+import json
+import os
+import pathlib
+import time
+from collections.abc import Iterator
+from typing import BinaryIO
+
+import polars as pl
+
+from .unpack import (
+    Buffer,
+    SchemaParser,
+    parse_schema,
+    sink,
+    unpack_records,
+    unpack_text,
+)
+
+
+class Checkpoint:
+    """Progress of the ingestion of a set of files, persisted as JSON."""
+
+    def __init__(self, path: str | pathlib.Path) -> None:
+        """Instantiate the object, loading the checkpoint file if it exists.
+
+        Parameters
+        ----------
+        path : str | pathlib.Path
+            Path to the checkpoint file.
+
+        Attributes
+        ----------
+        files : dict[str, dict[str, int | float | str]]
+            Dictionary of file path -> progress pairs; progress given as `offset` (in
+            bytes) up to which the file was unpacked, `size`, `mtime` and `inode` of
+            the file when last seen, `checksum` of the bytes preceding the offset, and
+            number of `lines` unpacked.
+        outputs : list[str]
+            Paths of the output files written so far.
+        path : pathlib.Path
+            Path to the checkpoint file.
+        schema : str | None
+            Hash of the schema the files were unpacked with.
+
+        """
+        self.path: pathlib.Path = pathlib.Path(path)
+
+        self.files: dict[str, dict[str, int | float | str]] = {}
+        self.outputs: list[str] = []
+        self.schema: str | None = None
+
+        if self.path.exists():
+            content = json.loads(self.path.read_text())
+            self.files = content["files"]
+            self.outputs = content["outputs"]
+            self.schema = content["schema"]
+
+    def reset(self, schema: str) -> None:
+        """Remove all output files and forget about the progress made so far.
+
+        Parameters
+        ----------
+        schema : str
+            Hash of the schema the files are going to be unpacked with.
+
+        """
+        for p in self.outputs:
+            pathlib.Path(p).unlink(missing_ok=True)
+
+        self.files = {}
+        self.outputs = []
+        self.schema = schema
+
+    def save(self) -> None:
+        """Write the checkpoint file, atomically."""
+        content = {"files": self.files, "outputs": self.outputs, "schema": self.schema}
+
+        tmp = self.path.with_name(f"{self.path.name}.tmp")
+        tmp.write_text(json.dumps(content, indent=2))
+        tmp.replace(self.path)
+
+
+def follow(
+    path_schema: "str | pathlib.Path | Buffer | SchemaParser",
+    path_data: str | pathlib.Path,
+    offset: int | None = 0,
+    interval: float = 0.5,
+    max_bytes: int = 16777216,
+    idle_timeout: float | None = None,
+    small_batch: int = 50,
+    separator: str = "|",
+) -> Iterator[pl.DataFrame]:
+    """Follow a growing file, unpacking new complete lines in micro-batches.
+
+    Parameters
+    ----------
+    path_schema : str | pathlib.Path | Buffer | SchemaParser
+        Path to the plain text schema describing the JSON content, its content, or an
+        already parsed schema; see `parse_schema()`.
+    path_data : str | pathlib.Path
+        Path to the JSON file, which might not exist yet.
+    offset : int | None
+        Byte offset to start reading the file from; defaults to `0`. `None` to start
+        from the end of the file (as `tail -F` would).
+    interval : float
+        Time (in seconds) to wait for new content once the end of the file is reached;
+        defaults to `0.5`. This bounds the latency between the writing of a line and
+        its unpacking.
+    max_bytes : int
+        Maximum number of bytes read (hence unpacked) at once; defaults to 16 MiB.
+    idle_timeout : float | None
+        Time (in seconds) without new content after which to stop; defaults to `None`,
+        in which case the file is followed until interrupted.
+    small_batch : int
+        Batches of up to that many lines are flattened in Python instead (see
+        `unpack_records()`); defaults to `50`.
+    separator : str
+        Separator to use when parsing the JSON file as a CSV; see `unpack_text()`.
+
+    Yields
+    ------
+    : polars.DataFrame
+        Unpacked content of the complete lines read since the previous batch.
+
+    Notes
+    -----
+    * Partial lines (not yet terminated by a newline) are held back until complete.
+    * When the file is replaced (different inode), removed or truncated, the rest of
+      the previous file is read before starting over at the beginning of the new one;
+      a partial last line of the previous file is dropped.
+
+    """
+    s = parse_schema(path_schema)
+    path = pathlib.Path(path_data)
+
+    def _unpack(content: bytes) -> pl.DataFrame:
+        """Unpack complete lines."""
+        # quick work
+        if content.count(b"\n") <= small_batch:
+            return unpack_records(
+                [json.loads(line) for line in content.splitlines() if line.strip()],
+                s,
+                small_batch=small_batch,
+            )
+        return unpack_text(s, content, separator).collect()
+
+    f = None
+    pending = b""
+    idle = time.monotonic()
+
+    try:
+        while True:
+            # (re)open the file once it exists
+            if f is None:
+                try:
+                    f = path.open("rb")
+                except FileNotFoundError:
+                    if (
+                        idle_timeout is not None
+                        and time.monotonic() > idle + idle_timeout
+                    ):
+                        return
+                    time.sleep(interval)
+                    continue
+                if offset is None:
+                    f.seek(0, os.SEEK_END)
+                else:
+                    f.seek(offset)
+
+            # complete lines only, the rest held back
+            chunk = f.read(max_bytes)
+            content = pending + chunk
+            if end := content.rfind(b"\n") + 1:
+                yield _unpack(content[:end])
+                idle = time.monotonic()
+            pending = content[end:]
+
+            # more to read already
+            if len(chunk) == max_bytes:
+                continue
+
+            # rotated: replaced, removed or truncated
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                stat = None
+            if (
+                stat is None
+                or stat.st_ino != os.fstat(f.fileno()).st_ino
+                or stat.st_size < f.tell()
+            ):
+                f.close()
+                f, pending, offset = None, b"", 0
+                continue
+
+            if idle_timeout is not None and time.monotonic() > idle + idle_timeout:
+                return
+            time.sleep(interval)
+
+    finally:
+        if f is not None:
+            f.close()
+
+
+def hash_schema(s: SchemaParser) -> str:
+    """Hash a parsed schema, to detect modifications.
+
+    Parameters
+    ----------
+    s : SchemaParser
+        Parsed schema.
+
+    Returns
+    -------
+    : str
+        Hexadecimal SHA-256 digest of the plain text schema.
+
+    """
+    return hashlib.sha256(s.source.encode()).hexdigest()
+
+
+def hash_tail(f: BinaryIO, offset: int, size: int = 4096) -> str:
+    """Hash the bytes preceding an offset of a file, to detect rewrites.
+
+    Parameters
+    ----------
+    f : typing.BinaryIO
+        File opened in binary mode; its position is left untouched.
+    offset : int
+        Byte offset the hashed bytes precede.
+    size : int
+        Maximum number of bytes hashed; defaults to `4096`.
+
+    Returns
+    -------
+    : str
+        Hexadecimal SHA-256 digest of the bytes preceding the offset.
+
+    """
+    position = f.tell()
+    f.seek(max(0, offset - size))
+    digest = hashlib.sha256(f.read(offset - f.tell())).hexdigest()
+    f.seek(position)
+    return digest
+
+
+def ingest(
+    path_schema: "str | pathlib.Path | Buffer | SchemaParser",
+    path_data: str | pathlib.Path,
+    output: str | pathlib.Path,
+    checkpoint: str | pathlib.Path,
+    fmt: str = "parquet",
+    separator: str = "|",
+    row_index: str | None = None,
+    file_name: str | None = None,
+    max_bytes: int = 16777216,
+    **kwargs,
+) -> list[pathlib.Path]:
+    """Unpack what was not yet unpacked of a set of files, appending to a directory.
+
+    Parameters
+    ----------
+    path_schema : str | pathlib.Path | Buffer | SchemaParser
+        Path to the plain text schema describing the JSON content, its content, or an
+        already parsed schema; see `parse_schema()`.
+    path_data : str | pathlib.Path
+        Path to the JSON file (or multiple files via glob patterns).
+    output : str | pathlib.Path
+        Path to the output directory, created if needed.
+    checkpoint : str | pathlib.Path
+        Path to the checkpoint file, created if needed.
+    fmt : str
+        Output format, see `sink()`; defaults to `parquet`.
+    separator : str
+        Separator to use when parsing the JSON file as a CSV; see `unpack_text()`.
+    row_index : str | None
+        Name of the column holding the 0-based index of the line (in its file) each row
+        was unpacked from; defaults to `None`, in which case no column is added.
+    file_name : str | None
+        Name of the column holding the path of the file each row was read from;
+        defaults to `None`, in which case no column is added.
+    max_bytes : int
+        Maximum number of bytes read (hence unpacked) at once; defaults to 16 MiB.
+    **kwargs
+        Keyword arguments forwarded to `unpack_text()`.
+
+    Returns
+    -------
+    : list[pathlib.Path]
+        Paths of the output files written during this run.
+
+    Notes
+    -----
+    * The new content of each file is read and unpacked in chunks of up to `max_bytes`
+      (or a single line if longer), one output file per chunk.
+    * Output files are named after the input file, a hash of its path (files of the
+      same name in different directories) and the range of bytes the unpacked content
+      was read from (`<stem>-<hash>-<start>-<end>.<fmt>`).
+    * The checkpoint is saved after each output file is written: an interrupted run is
+      resumed from the last file written.
+
+    """
+    s = parse_schema(path_schema)
+    c = Checkpoint(checkpoint)
+
+    # controlled rebuild if the schema was modified
+    if c.schema != (digest := hash_schema(s)):
+        c.reset(digest)
+        c.save()
+
+    output = pathlib.Path(output)
+    output.mkdir(parents=True, exist_ok=True)
+
+    def _unpack(content: bytes, lines: int, path: str) -> pl.LazyFrame:
+        """Unpack complete lines, counting rows on from the lines already unpacked."""
+        # quick work
+        df = unpack_text(
+            s,
+            content,
+            separator,
+            row_index=row_index,
+            file_name=file_name,
+            **kwargs,
+        )
+        if row_index is not None:
+            df = df.with_columns(pl.col(row_index) + pl.lit(lines, pl.UInt32))
+        if file_name is not None:
+            df = df.with_columns(pl.lit(path).alias(file_name))
+        return df
+
+    written = []
+    for path in sorted(glob.glob(str(path_data))):
+        stat = os.stat(path)
+        progress = c.files.get(path, {"offset": 0, "lines": 0, "inode": stat.st_ino})
+
+        # untouched since last seen
+        if (stat.st_size, stat.st_mtime, stat.st_ino) == (
+            progress.get("size"),
+            progress.get("mtime"),
+            progress["inode"],
+        ):
+            continue
+
+        stem = pathlib.Path(path).stem
+        tag = hashlib.sha256(path.encode()).hexdigest()[:8]
+
+        with pathlib.Path(path).open("rb") as f:
+            checksum = hash_tail(f, progress["offset"])
+
+            # truncated, replaced or rewritten since last seen: start over
+            if (
+                stat.st_size < progress["offset"]
+                or stat.st_ino != progress["inode"]
+                or progress.get("checksum", checksum) != checksum
+            ):
+                progress = {"offset": 0, "lines": 0}
+
+            start, lines = progress["offset"], progress["lines"]
+            f.seek(start)
+
+            # complete lines only, the rest held back and completed by the next chunk
+            pending = b""
+            while size := min(
+                max_bytes - len(pending) if len(pending) < max_bytes else max_bytes,
+                stat.st_size - f.tell(),
+            ):
+                content = pending + f.read(size)
+                if not (end := content.rfind(b"\n") + 1):
+                    pending = content
+                    continue
+                pending = content[end:]
+
+                out = output / f"{stem}-{tag}-{start}-{start + end}.{fmt}"
+                sink(_unpack(content[:end], lines, path), str(out), fmt)
+                written.append(out)
+
+                start += end
+                lines += content.count(b"\n", 0, end)
+                c.outputs.append(str(out))
+                c.files[path] = {
+                    "offset": start,
+                    "size": stat.st_size,
+                    "mtime": stat.st_mtime,
+                    "inode": stat.st_ino,
+                    "checksum": hash_tail(f, start),
+                    "lines": lines,
+                }
+                c.save()
+
+    return written
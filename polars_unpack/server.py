@@ -0,0 +1,238 @@
+"""Long-running local server keeping `Polars` loaded and parsed schemas in memory.
+
+Each invocation of the command line interface pays for starting the interpreter,
+importing `Polars` and parsing the schema before touching any data. For pipelines
+unpacking many small files, this fixed cost dominates; the server below pays it once:
+
+```shell
+$ polars-unpack serve --socket /tmp/polars-unpack.sock  # or --port 8765
+```
+
+Requests are plain HTTP (over a Unix socket or on `localhost`), the query string
+describing what to unpack:
+
+* `POST /unpack?schema=<path>&data=<path>` unpacks the data file (or glob pattern) and
+  returns the result as an Arrow IPC stream.
+* `POST /unpack?schema=<path>` unpacks the newline-delimited JSON sent as request body.
+* An extra `output=<path>` (and optionally `format=<fmt>`) parameter writes the result to
+  a file instead, and returns its path as JSON.
+* `separator=<char>` sets the separator used to read the data as plain text.
+
+Parsed schemas are cached, and parsed again only if the file was modified since. The
+`client` module of this package talks to the server using the standard library only.
+"""
+
+import http.server
+import json
+import pathlib
+import socketserver
+import threading
+import urllib.parse
+
+import polars as pl
+
+from .unpack import SchemaParser, parse_schema, sink, unpack_text
+
+
+class SchemaCache:
+    """Thread-safe cache of parsed schemas, invalidated on file modification."""
+
+    def __init__(self) -> None:
+        """Instantiate the object.
+
+        Attributes
+        ----------
+        schemas : dict[str, tuple[float, SchemaParser]]
+            Dictionary of schema path -> (modification time, parsed schema) pairs.
+
+        """
+        self.schemas: dict[str, tuple[float, SchemaParser]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, path_schema: str) -> SchemaParser:
+        """Return the parsed schema, parsing it if not cached or modified since.
+
+        Parameters
+        ----------
+        path_schema : str
+            Path to the plain text schema.
+
+        Returns
+        -------
+        : SchemaParser
+            Parsed schema.
+
+        """
+        mtime = pathlib.Path(path_schema).stat().st_mtime
+
+        with self._lock:
+            if path_schema in self.schemas and self.schemas[path_schema][0] == mtime:
+                return self.schemas[path_schema][1]
+
+        s = parse_schema(path_schema)
+
+        with self._lock:
+            self.schemas[path_schema] = (mtime, s)
+
+        return s
+
+
+class UnpackRequestHandler(http.server.BaseHTTPRequestHandler):
+    """Handle unpacking requests, see the module documentation for the protocol."""
+
+    server_version = "polars-unpack"
+
+    def do_POST(self) -> None:
+        """Unpack the data described by the query string, or sent as request body."""
+        url = urllib.parse.urlsplit(self.path)
+        query = dict(urllib.parse.parse_qsl(url.query))
+
+        # read the body before anything else, the client expecting the response only
+        # after sending it whole (otherwise faced with a broken pipe)
+        body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+
+        if url.path != "/unpack" or "schema" not in query:
+            self.respond(404, b"Expected POST /unpack?schema=<path>", "text/plain")
+            return
+
+        try:
+            df = self.unpack(query, body)
+
+            # write to a file
+            if "output" in query:
+                sink(df, query["output"], query.get("format"))
+                body = json.dumps({"output": query["output"]}).encode()
+                self.respond(200, body, "application/json")
+
+            # or stream back as arrow ipc
+            else:
+                body = df.collect().write_ipc_stream(None).getvalue()
+                self.respond(200, body, "application/vnd.apache.arrow.stream")
+
+        except Exception as e:  # noqa: BLE001
+            self.respond(400, str(e).encode(), "text/plain")
+
+    def log_message(self, format: str, *args: object) -> None:
+        """Silence the logging of each request (as done by default on `stderr`)."""
+
+    def respond(self, code: int, body: bytes, content_type: str) -> None:
+        """Send a response.
+
+        Parameters
+        ----------
+        code : int
+            HTTP status code.
+        body : bytes
+            Response content.
+        content_type : str
+            Response content type.
+
+        """
+        self.send_response(code)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def unpack(self, query: dict[str, str], body: bytes) -> pl.LazyFrame:
+        """Build the unpacking pipeline for a request.
+
+        Parameters
+        ----------
+        query : dict[str, str]
+            Parsed query string.
+        body : bytes
+            Request content, the inline data if no path is provided.
+
+        Returns
+        -------
+        : polars.LazyFrame
+            Unpacked JSON content, lazy style.
+
+        """
+        s = self.server.schemas.get(query["schema"])
+
+        # data on disk, or inline
+        data = query.get("data", body)
+
+        return unpack_text(s, data, query.get("separator", "|"))
+
+
+class UnpackServer(http.server.ThreadingHTTPServer):
+    """Serve unpacking requests on `localhost`."""
+
+    def __init__(self, address: tuple[str, int]) -> None:
+        """Instantiate the object.
+
+        Parameters
+        ----------
+        address : tuple[str, int]
+            Host and port to listen to.
+
+        Attributes
+        ----------
+        schemas : SchemaCache
+            Cache of the parsed schemas.
+
+        """
+        super().__init__(address, UnpackRequestHandler)
+        self.schemas: SchemaCache = SchemaCache()
+
+
+class UnixUnpackServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Serve unpacking requests on a Unix socket."""
+
+    daemon_threads = True
+
+    def __init__(self, path: str) -> None:
+        """Instantiate the object.
+
+        Parameters
+        ----------
+        path : str
+            Path to the Unix socket to listen to.
+
+        Attributes
+        ----------
+        schemas : SchemaCache
+            Cache of the parsed schemas.
+
+        """
+        pathlib.Path(path).unlink(missing_ok=True)
+        super().__init__(path, UnpackRequestHandler)
+        self.schemas: SchemaCache = SchemaCache()
+
+    def get_request(self) -> tuple:
+        """Accept a connection, faking a client address for the request handler."""
+        request, _ = super().get_request()
+
+        return request, ("localhost", 0)
+
+
+def serve(
+    host: str = "127.0.0.1",
+    port: int = 8765,
+    socket: str | None = None,
+) -> None:
+    """Serve unpacking requests until interrupted.
+
+    Parameters
+    ----------
+    host : str
+        Host to listen to; defaults to `127.0.0.1`.
+    port : int
+        Port to listen to; defaults to `8765`.
+    socket : str | None
+        Path to a Unix socket to listen to instead; defaults to `None`.
+
+    """
+    server = UnpackServer((host, port)) if socket is None else UnixUnpackServer(socket)
+
+    with server:
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            if socket is not None:
+                pathlib.Path(socket).unlink(missing_ok=True)
@@ -88,12 +88,27 @@ there to check if this is only fantasy. Running is convincing!
 Feel free to cherry-pick and extend the functionalities to your own use cases.
 """
 
+import glob
+import io
+import itertools
+import math
 import pathlib
 import re
 import sys
+import threading
+import urllib.parse
+import uuid
+from collections.abc import Callable, Iterable, Iterator
+from typing import TYPE_CHECKING
 
 import polars as pl
 
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+# in-memory content accepted in place of a path to a file
+Buffer = bytes | bytearray | memoryview | io.IOBase
+
 POLARS_DATATYPES: dict[str, pl.DataType] = {
     "array": pl.List,
     "list": pl.List,
@@ -117,8 +132,611 @@ POLARS_DATATYPES: dict[str, pl.DataType] = {
     "string": pl.String,
 }
 
+# bounds of the values held by each integer datatype
+INTEGER_RANGES: dict[pl.DataType, tuple[int, int]] = {
+    pl.Int8: (-(2**7), 2**7 - 1),
+    pl.Int16: (-(2**15), 2**15 - 1),
+    pl.Int32: (-(2**31), 2**31 - 1),
+    pl.Int64: (-(2**63), 2**63 - 1),
+    pl.UInt8: (0, 2**8 - 1),
+    pl.UInt16: (0, 2**16 - 1),
+    pl.UInt32: (0, 2**32 - 1),
+    pl.UInt64: (0, 2**64 - 1),
+}
+
+# reductions of the values of a list, cast to the datatype of the aggregated values
+AGGREGATIONS: dict[str, Callable[[pl.Expr, pl.DataType], pl.Expr]] = {
+    "count": lambda e, _: (
+        e.list.eval(pl.element().drop_nulls()).list.len().fill_null(0)
+    ),
+    "max": lambda e, d: e.list.max().cast(d, strict=False),
+    "mean": lambda e, _: e.list.mean().cast(pl.Float64),
+    "min": lambda e, d: e.list.min().cast(d, strict=False),
+    "sum": lambda e, d: (
+        e.list.eval(pl.element().cast(aggregated_dtype("sum", d), strict=False))
+        .list.sum()
+        .add(0)
+    ),
+}
+
+SINK_FORMATS: dict[str, str] = {
+    ".arrow": "ipc",
+    ".arrows": "ipc_stream",
+    ".csv": "csv",
+    ".feather": "ipc",
+    ".ipc": "ipc",
+    ".jsonl": "ndjson",
+    ".ndjson": "ndjson",
+    ".parquet": "parquet",
+}
+
+PATTERN_AGGREGATED_ATTR_DTYPE = re.compile(
+    r"([A-Za-z0-9_]+)\s*(?:=\s*([A-Za-z0-9_]+)\s*)?:\s*"
+    rf"({'|'.join(AGGREGATIONS)})\s*[(\[{{<]\s*([A-Za-z0-9]+)\s*[)\]}}>]",
+    re.IGNORECASE,
+)
+PATTERN_RENAMED_ATTR_DTYPE = re.compile(
+    r"([A-Za-z0-9_]+)\s*=\s*([A-Za-z0-9_]+)\s*:\s*([A-Za-z0-9]+)",
+)
+PATTERN_ATTR_DTYPE = re.compile(r"([A-Za-z0-9_]+)\s*:\s*([A-Za-z0-9]+)")
+PATTERN_LONE_DTYPE = re.compile(r"([A-Za-z0-9]+)")
+PATTERN_WIDTH = re.compile(r"([0-9]+)(?=[,\s]*[)\]}>])")
+PATTERN_OPENING_DELIMITER = re.compile(r"[(\[{<]")
+PATTERN_CLOSING_DELIMITER = re.compile(r"[)\]}>]")
+PATTERN_SEPARATOR = re.compile(r"[,\n\s]+")
+PATTERN_ISSUE_END = re.compile(r"[()\[\]{}<>\n]")
+
+
+def aggregated_dtype(function: str, dtype: pl.DataType) -> pl.DataType:
+    """Return the datatype of the aggregation of values of a given datatype.
+
+    Parameters
+    ----------
+    function : str
+        Name of the aggregation function, as listed in `AGGREGATIONS`.
+    dtype : polars.DataType
+        Datatype of the aggregated values.
+
+    Returns
+    -------
+    : polars.DataType
+        Datatype of the aggregated value: `UInt32` for counts, `Float64` for means, and
+        the widest datatype of the same kind for sums (`Float64`, `UInt64` for `UInt64`
+        values, `Int64` for any other integers) as the sum of values holding in their
+        datatype may not; the datatype of the values otherwise.
+
+    """
+    if function == "count":
+        return pl.UInt32
+    if function == "mean" or (function == "sum" and dtype.is_float()):
+        return pl.Float64
+    if function == "sum":
+        return pl.UInt64 if dtype == pl.UInt64 else pl.Int64
+    return dtype
+
+
+def conformer(dtype: pl.DataType) -> Callable[[object], object]:
+    """Compile a function conforming parsed JSON values to a datatype.
+
+    Parameters
+    ----------
+    dtype : polars.DataType
+        Datatype the values are expected to hold.
+
+    Returns
+    -------
+    : collections.abc.Callable[[object], object]
+        Function returning a value fitting the datatype, as decoding it from JSON text
+        would: numbers and booleans are written as text in `String` leaves, floats
+        truncated and booleans counted as `0`/`1` in integer leaves; values that cannot
+        fit (text in numeric leaves, out of range integers, objects in place of
+        lists...) are replaced by `None`.
+
+    Notes
+    -----
+    Datatypes are compared once only, values being checked against their expected
+    Python type; the returned function is cheap enough to be called on each leaf.
+
+    """
+    if type(dtype) in (pl.Array, pl.List):
+        inner = conformer(dtype.inner)
+
+        def _list(value: object) -> list | None:
+            # quick work
+            if value.__class__ is not list:
+                return None
+            return [inner(v) for v in value]
+
+        return _list
+
+    if type(dtype) == pl.Struct:
+        fields = [(f.name, conformer(f.dtype)) for f in dtype.fields]
+
+        def _struct(value: object) -> dict | None:
+            # quick work
+            if value.__class__ is not dict:
+                return None
+            return {name: func(value.get(name)) for name, func in fields}
+
+        return _struct
+
+    if dtype == pl.String:
+
+        def _string(value: object) -> str | None:
+            # quick work
+            if value.__class__ is str or value is None:
+                return value
+            if value.__class__ is bool:
+                return "true" if value else "false"
+            if value.__class__ in (int, float):
+                return str(value)
+            return None
+
+        return _string
+
+    if dtype in (pl.Float32, pl.Float64):
+
+        def _float(value: object) -> float | None:
+            # quick work
+            if value.__class__ is float or value is None:
+                return value
+            if value.__class__ in (bool, int):
+                return float(value)
+            return None
+
+        return _float
+
+    lower, upper = INTEGER_RANGES[dtype]
+
+    def _integer(value: object) -> int | None:
+        # quick work
+        if value.__class__ is float:
+            value = int(value) if math.isfinite(value) else None
+        elif value.__class__ is bool:
+            value = int(value)
+        elif value.__class__ is not int:
+            return None
+        return value if value is not None and lower <= value <= upper else None
+
+    return _integer
+
+
+def decode_leniently(raw: pl.Series, dtype: pl.Struct) -> pl.Series:
+    """Decode JSON objects given a datatype, setting aside the values failing to.
+
+    Parameters
+    ----------
+    raw : polars.Series
+        JSON objects, as plain text.
+    dtype : polars.Struct
+        Datatype of the objects; see `textual()` to only fail on their structure.
+
+    Returns
+    -------
+    : polars.Series
+        `Struct` series of the `decoded` objects, and the JSON paths (dot-separated,
+        lists crossed without being named) of the values that failed the decoding
+        (`mismatches`, `null` if none did; `""` for an object failing altogether).
+
+    Notes
+    -----
+    * `json_decode()` fails the whole series when a single value does not fit (text
+      in numeric leaves, objects or arrays in place of scalars...). The series is then
+      split in 16 slices, recursively, down to the failing objects, each decoded again
+      without the failing values; slices without any failing object are decoded at
+      once, such that the cost of the fallback grows with the number of failing
+      objects (times the logarithm of the length of the series).
+    * A failing value is located by decoding the fields of its object one at a time,
+      nested objects being extracted via `str.json_path_match()`. Values held by lists
+      are not located further: the path of the list is given, and the whole list is
+      left out.
+
+    """
+
+    def _drop(dtype: pl.DataType, names: list[str]) -> pl.DataType:
+        """Drop a field from a datatype."""
+        # quick work
+        if type(dtype) == pl.Array:
+            return pl.Array(_drop(dtype.inner, names), dtype.size)
+        if type(dtype) == pl.List:
+            return pl.List(_drop(dtype.inner, names))
+        return pl.Struct(
+            [
+                f if f.name != names[0] else pl.Field(f.name, _drop(f.dtype, names[1:]))
+                for f in dtype.fields
+                if f.name != names[0] or len(names) > 1
+            ],
+        )
+
+    def _locate(text: str, dtype: pl.Struct, names: list[str]) -> list[str]:
+        """Locate the first value of an object failing to decode."""
+        # quick work
+        line = pl.Series([text])
+        if (
+            not text.lstrip().startswith("{")
+            or line.str.json_path_match("$")[0] is None
+        ):
+            return names
+        for f in dtype.fields:
+            try:
+                line.str.json_decode(pl.Struct([f]))
+            except pl.exceptions.ComputeError:
+                nested = line.str.json_path_match(f"$['{f.name}']")[0]
+                if type(f.dtype) == pl.Struct and nested is not None:
+                    return _locate(nested, f.dtype, [*names, f.name])
+                return [*names, f.name]
+        return names
+
+    return_dtype = pl.Struct({"decoded": dtype, "mismatches": pl.List(pl.String)})
+
+    try:
+        decoded = raw.str.json_decode(dtype)
+    except pl.exceptions.ComputeError:
+        if len(raw) > 1:
+            n = -(-len(raw) // 16)
+            return pl.concat(
+                decode_leniently(raw[i : i + n], dtype) for i in range(0, len(raw), n)
+            )
+    else:
+        return (
+            decoded.to_frame("decoded")
+            .with_columns(mismatches=pl.lit(None, pl.List(pl.String)))
+            .to_struct(raw.name)
+        )
+
+    # failing values left out one at a time, until the object decodes
+    value, mismatches, d = None, [], dtype
+    while names := _locate(raw[0], d, []):
+        mismatches.append(".".join(names))
+        d = _drop(d, names)
+        try:
+            value = pl.Series([raw[0]]).str.json_decode(d)[0]
+            break
+        except pl.exceptions.ComputeError:
+            continue
+    else:
+        mismatches.append("")
+
+    return pl.Series(
+        raw.name,
+        [{"decoded": value, "mismatches": mismatches}],
+        dtype=return_dtype,
+    )
+
+
+def explain_unpack(
+    path_schema: str,
+    path_data: str | None = None,
+    sample: int = 1000,
+    separator: str = "|",
+    **kwargs,
+) -> "UnpackReport":
+    """Describe what unpacking some JSON data given a `Polars` schema is going to cost.
+
+    The schema is walked the same way `UnpackFrame.unpack()` does, to count the
+    `unnest`, `explode` and `rename` nodes it generates and to list the order in which
+    lists are exploded. If data is provided, the first rows are decoded to estimate by
+    how much each explosion multiplies the number of rows (per row of the parent
+    object):
+
+    ```text
+    headers: unnest
+        timestamp: Int64
+        ...
+    payload: unnest
+        ...
+        lines: explode (x2.00)
+            ...
+            discounts: explode (x1.00)
+                ...
+    ```
+
+    Parameters
+    ----------
+    path_schema : str
+        Path to the plain text schema describing the JSON content.
+    path_data : str | None
+        Path to the JSON file (or multiple files via glob patterns); defaults to `None`,
+        in which case no multiplication factor is estimated and the plan is built on an
+        empty `LazyFrame`.
+    sample : int
+        Number of rows (JSON lines) to consider when estimating multiplication factors;
+        defaults to `1000`.
+    separator : str
+        Separator to use when parsing the JSON file as a CSV; see `unpack_text()`.
+
+    Returns
+    -------
+    : UnpackReport
+        Counts, order of explosions, depth of the optimized plan, multiplication factors
+        and a readable tree of the unpacking.
+
+    Notes
+    -----
+    The plan depth is estimated from the indentation of the `LazyFrame.explain()`
+    output, and might not be exact for convoluted (non-linear) plans.
+
+    """
+    s = parse_schema(path_schema)
+    r = UnpackReport()
+
+    # the plan as built by unpack_text(), or on an empty frame if no data is provided
+    if path_data is None:
+        df = pl.LazyFrame(schema=s.struct.to_schema())
+        plan = (
+            df.json.unpack(s.struct, widths=s.widths, aggregations=s.aggregations)
+            .rename(s.json_paths)
+            .explain()
+        )
+        data = None
+    else:
+        plan = unpack_text(path_schema, path_data, separator, **kwargs).explain()
+        data = (
+            scan_text(path_data, separator, **kwargs)
+            .head(sample)
+            .select(pl.col("raw").str.json_decode(s.struct))
+            .collect()
+            .to_series()
+        )
+
+    r.plan_depth = len(
+        {len(line) - len(line.lstrip()) for line in plan.splitlines() if line.strip()},
+    )
+
+    # quick work
+    def _explain(
+        dtype: pl.DataType,
+        json_path: str,
+        column: str | None,
+        series: pl.Series | None,
+        indent: str,
+        extracted: bool = False,
+    ) -> str:
+        """Recursively walk the schema as `UnpackFrame.unpack()` would.
+
+        Parameters
+        ----------
+        dtype : polars.DataType
+            Datatype of the current object.
+        json_path : str
+            Full JSON path to the current field.
+        column : str | None
+            Column the unpacking applies to, if the current object has no field name.
+        series : polars.Series | None
+            Sampled values of the current object, exploded as the parent lists are.
+        indent : str
+            String used to indent the current level of the tree.
+        extracted : bool
+            Whether the current object holds items extracted from a list, already named
+            after their full JSON paths (hence not renamed); defaults to `False`.
+
+        Returns
+        -------
+        : str
+            Readable tree of the operations applied to the current object.
+
+        """
+        tree = ""
+
+        if column is not None:
+            if dtype in (pl.Array, pl.List):
+                jp = f"{json_path}{s.separator}{column}".lstrip(s.separator)
+                if jp != column:
+                    r.renames += 1
+                tree += f"{indent}[]: {_explode(jp, series)}\n"
+                if series is not None:
+                    series = series.explode()
+                tree += _explain(dtype.inner, jp, jp, series, f"{indent}    ")
+            elif dtype == pl.Struct:
+                r.unnests += 1
+                tree += _explain(dtype, json_path, None, series, indent)
+
+        elif hasattr(dtype, "fields"):
+            for f in dtype.fields:
+                jp = f"{json_path}{s.separator}{f.name}".lstrip(s.separator)
+                if jp != f.name and not extracted:
+                    r.renames += 1
+                child = (
+                    series.struct.field(f.name)
+                    if series is not None and series.dtype == pl.Struct
+                    else None
+                )
+                if jp in s.widths:
+                    n = s.widths[jp]
+                    r.unnests += 1
+                    tree += f"{indent}{f.name}: first {n} items\n"
+                    names = [f"{f.name}_{i}" for i in range(n)]
+                    if child is not None:
+                        child = (
+                            child.to_frame("items")
+                            .select(
+                                pl.struct(
+                                    pl.col("items").list.get(i).alias(c)
+                                    for i, c in enumerate(names)
+                                ),
+                            )
+                            .to_series()
+                        )
+                    items = pl.Struct([pl.Field(c, f.dtype.inner) for c in names])
+                    tree += _explain(
+                        items,
+                        json_path,
+                        None,
+                        child,
+                        f"{indent}    ",
+                        extracted=True,
+                    )
+                elif jp in s.aggregations:
+                    r.unnests += 1
+                    tree += f"{indent}{f.name}: aggregate\n"
+                    for p, function in s.aggregations[jp].items():
+                        name = f"{p[len(jp) + len(s.separator) :]} -> {s.json_paths[p]}"
+                        tree += f"{indent}    {name}: {function}\n"
+                elif type(f.dtype) in (pl.Array, pl.List):
+                    tree += f"{indent}{f.name}: {_explode(jp, child)}\n"
+                    if child is not None:
+                        child = child.explode()
+                    tree += _explain(f.dtype.inner, jp, jp, child, f"{indent}    ")
+                elif type(f.dtype) == pl.Struct:
+                    r.unnests += 1
+                    tree += f"{indent}{f.name}: unnest\n"
+                    tree += _explain(f.dtype, jp, None, child, f"{indent}    ")
+                else:
+                    name = s.json_paths.get(jp, jp)
+                    rename = f" -> {name}" if name != f.name else ""
+                    tree += f"{indent}{f.name}{rename}: {f.dtype}\n"
+
+        return tree
+
+    def _explode(json_path: str, series: pl.Series | None) -> str:
+        """Register an explosion and estimate its multiplication factor.
+
+        Parameters
+        ----------
+        json_path : str
+            Full JSON path to the exploded list.
+        series : polars.Series | None
+            Sampled values of the list, exploded as the parent lists are.
+
+        Returns
+        -------
+        : str
+            Description of the operation for the readable tree.
+
+        """
+        r.explodes.append(json_path)
+
+        if series is None or not len(series):
+            return "explode"
+
+        r.factors[json_path] = len(series.explode()) / len(series)
+
+        return f"explode (x{r.factors[json_path]:.2f})"
+
+    r.tree = _explain(s.struct, "", None, data, "").rstrip()
+
+    # sibling lists are exploded one after the other, hence multiply each other
+    if data is not None and len(data):
+        df = (
+            data.to_frame("raw")
+            .unnest("raw")
+            .json.unpack(s.struct, widths=s.widths, aggregations=s.aggregations)
+        )
+        r.factor = df.height / len(data)
+
+    return r
+
+
+def exploded_lists(
+    dtype: pl.DataType,
+    widths: dict[str, int] | None = None,
+    aggregations: dict[str, dict[str, str]] | None = None,
+    separator: str = ".",
+) -> list[str]:
+    """List the JSON paths of the lists exploded when unpacking a datatype.
+
+    Parameters
+    ----------
+    dtype : polars.DataType
+        Datatype of the content to unpack.
+    widths : dict[str, int] | None
+        Dictionary of JSON path -> number of items pairs, for the lists of which the
+        first items are extracted as columns; defaults to `None`.
+    aggregations : dict[str, dict[str, str]] | None
+        Dictionary of JSON path -> aggregations pairs, for the lists of which the values
+        are aggregated; defaults to `None`.
+    separator : str
+        JSON path separator to use when building the full JSON path; defaults to a dot
+        (`.`).
+
+    Returns
+    -------
+    : list[str]
+        JSON paths of the exploded lists, in the order `UnpackFrame.unpack()` explodes
+        them; the columns holding the positions of the items are named after these.
+
+    """
+    paths = []
+
+    # same work list as UnpackFrame.unpack(), without touching any frame
+    stack = [(dtype, "", None, None)]
+    while stack:
+        dtype, json_path, column, name = stack.pop()
+
+        if name is not None:
+            jp = f"{json_path}{separator}{name}".lstrip(separator)
+            if widths and jp in widths:
+                items = [
+                    pl.Field(f"{name}_{i}", dtype.inner) for i in range(widths[jp])
+                ]
+                stack.append((pl.Struct(items), json_path, None, None))
+            elif aggregations and jp in aggregations:
+                continue
+            elif type(dtype) in (pl.Array, pl.List):
+                paths.append(jp)
+                stack.append((dtype.inner, jp, jp, None))
+            elif type(dtype) == pl.Struct:
+                stack.append((dtype, jp, None, None))
+
+        elif column is not None:
+            if dtype in (pl.Array, pl.List):
+                jp = f"{json_path}{separator}{column}".lstrip(separator)
+                paths.append(jp)
+                stack.append((dtype.inner, jp, jp, None))
+            elif dtype == pl.Struct:
+                stack.append((dtype, json_path, None, None))
+
+        elif hasattr(dtype, "fields"):
+            stack.extend(
+                (f.dtype, json_path, None, f.name) for f in reversed(dtype.fields)
+            )
+
+    return paths
+
+
+def from_text(expr: pl.Expr, dtype: pl.DataType) -> pl.Expr:
+    """Convert values decoded as text to a datatype.
 
-def infer_schema(path_data: str) -> str:
+    Parameters
+    ----------
+    expr : polars.Expr
+        Values decoded as text; see `textual()`.
+    dtype : polars.DataType
+        Datatype to convert the values to.
+
+    Returns
+    -------
+    : polars.Expr
+        Values of the given datatype; those not fitting it (see `misfits()`) are
+        `null`.
+
+    Notes
+    -----
+    The values are cast altogether, unless some boolean leaves (text cannot be cast to
+    `Boolean`) require the datatype to be walked through.
+
+    """
+    if all(d != pl.Boolean for _, d in iter_leaves(dtype)):
+        return expr.cast(dtype, strict=False)
+    if type(dtype) == pl.Array:
+        return (
+            expr.arr.to_list()
+            .list.eval(from_text(pl.element(), dtype.inner))
+            .list.to_array(dtype.size)
+        )
+    if type(dtype) == pl.List:
+        return expr.list.eval(from_text(pl.element(), dtype.inner))
+    if type(dtype) == pl.Struct:
+        return pl.when(expr.is_not_null()).then(
+            pl.struct(
+                from_text(expr.struct.field(f.name), f.dtype).alias(f.name)
+                for f in dtype.fields
+            ),
+        )
+    return expr == "true"
+
+
+def infer_schema(path_data: str, **kwargs) -> str:
     """Lazily scan newline-delimited JSON data and print the `Polars`-inferred schema.
 
     We expect the following example JSON:
@@ -153,6 +771,11 @@ def infer_schema(path_data: str) -> str:
     : str
         Pretty-printed `Polars` JSON schema.
 
+    Notes
+    -----
+    Extra parameters are forwarded to `scan_ndjson()`; `infer_schema_length` for
+    instance controls the number of lines sampled to infer the schema.
+
     """
 
     # quick work
@@ -198,132 +821,2608 @@ def infer_schema(path_data: str) -> str:
 
     # generate the pretty-printed schema
     schema = ""
-    for field, dtype in pl.scan_ndjson(path_data).schema.items():
+    for field, dtype in pl.scan_ndjson(path_data, **kwargs).schema.items():
         schema += _pprint(f"{field}: ", dtype)
 
     return schema.strip()
 
 
-def parse_schema(path_schema: str) -> pl.Struct:
+def iter_array(
+    path_schema: "str | pathlib.Path | Buffer | SchemaParser",
+    path_data: str | pathlib.Path | Buffer,
+    batch_size: int = 65536,
+    chunk_size: int = 16777216,
+    row_index: str | None = None,
+    columns: list[str] | None = None,
+    list_index: str | None = None,
+) -> Iterator[pl.DataFrame]:
+    """Iterate over the unpacked elements of a top-level JSON array, batch by batch.
+
+    Parameters
+    ----------
+    path_schema : str | pathlib.Path | Buffer | SchemaParser
+        Path to the plain text schema describing each element of the array, its
+        content, or an already parsed schema; see `parse_schema()`.
+    path_data : str | pathlib.Path | Buffer
+        Path to the JSON file, or its content as `bytes`, `memoryview` or file-like
+        object (`io.BytesIO`...).
+    batch_size : int
+        Maximum number of elements unpacked at once; defaults to `65536`.
+    chunk_size : int
+        Number of bytes read at once; defaults to 16 MiB.
+    row_index : str | None
+        Name of the column holding the 0-based index of the element of the array each
+        row was unpacked from; defaults to `None`.
+    columns : list[str] | None
+        Columns (as named in the output) to unpack, in that order; defaults to `None`,
+        in which case all columns described by the schema are. See `unpack_text()`.
+    list_index : str | None
+        Suffix of the columns holding the 0-based position of each item within its
+        exploded list; defaults to `None`. See `unpack_text()`.
+
+    Yields
+    ------
+    : polars.DataFrame
+        Unpacked content of the next `batch_size` elements of the array.
+
+    Raises
+    ------
+    : UnknownFormatError
+        When the content is neither a JSON array nor a JSON object, or is truncated.
+
+    Notes
+    -----
+    * The content is read chunk by chunk and split into elements at the byte level
+      (only brackets, braces, commas and strings are scanned for, elements are not
+      parsed), such that at most a chunk and a batch of elements are held in memory.
+    * Each batch is then decoded and unpacked as plain text would be; see
+      `unpack_raw()`.
+    * A single top-level JSON object (pretty-printed or not) is unpacked as an array
+      holding that one element.
+
+    """
+    s = parse_schema(path_schema)
+
+    # the next structural token, strings and other bytes skipped over by the regex
+    # engine itself (commas only matter between the elements of the array); a lone
+    # quote is an unterminated string, hence the end of the buffer
+    string = rb'"[^"\\]*(?:\\.[^"\\]*)*"'
+    tokens = {
+        False: re.compile(
+            rb'[^][{}",]*(?:%s[^][{}",]*)*([][{},"])' % string, re.DOTALL
+        ),
+        True: re.compile(rb'[^][{}"]*(?:%s[^][{}"]*)*([][{}"])' % string, re.DOTALL),
+    }
+
+    def _elements(f: io.RawIOBase) -> Iterator[bytes]:
+        """Split the content into its (raw) elements."""
+        # quick work
+        buffer, pos, start, depth, array = b"", 0, None, 0, None
+        while True:
+            chunk = f.read(chunk_size)
+
+            # keep the element being read only
+            cut = pos if start is None else start
+            buffer, pos = buffer[cut:] + chunk, pos - cut
+            start = None if start is None else 0
+
+            while m := tokens[depth > 1].match(buffer, pos):
+                token = m.group(1)
+                if token == b'"':
+                    pos = m.start(1)
+                    break
+                pos = m.end()
+                if token in b"[{":
+                    depth += 1
+                    if array is None:
+                        array = token == b"["
+                        start = pos if array else m.start(1)
+                elif token in b"]}":
+                    depth -= 1
+                    if depth == 0:
+                        element = buffer[start : m.start(1) if array else pos].strip()
+                        if element:
+                            yield element
+                        return
+                elif array:
+                    yield buffer[start : m.start(1)].strip()
+                    start = pos
+
+            if not chunk:
+                message = "Truncated JSON content" if array is not None else "Not JSON"
+                raise UnknownFormatError(f"{message}: expected an array or an object")
+
+    def _unpack(elements: list[bytes], offset: int) -> pl.DataFrame:
+        """Decode and unpack a batch of elements."""
+        # quick work
+        df = pl.LazyFrame({"raw": [e.decode() for e in elements]}, {"raw": pl.String})
+        if row_index is not None:
+            df = df.with_row_index(row_index, offset)
+        return unpack_raw(s, df, columns, list_index).collect()
+
+    # files opened here are closed here, other file-like objects are left open
+    if isinstance(path_data, (str, pathlib.Path)):
+        f = open(path_data, "rb")  # noqa: SIM115
+    elif isinstance(path_data, (bytes, bytearray, memoryview)):
+        f = io.BytesIO(path_data)
+    else:
+        f = path_data
+
+    try:
+        offset, elements = 0, []
+        for element in _elements(f):
+            elements.append(element)
+            if len(elements) == batch_size:
+                yield _unpack(elements, offset)
+                offset, elements = offset + len(elements), []
+        if elements:
+            yield _unpack(elements, offset)
+    finally:
+        if f is not path_data:
+            f.close()
+
+
+def iter_batches(
+    df: pl.LazyFrame, batch_size: int = 65536
+) -> Iterator["pa.RecordBatch"]:
+    """Iterate over unpacked content as Arrow `RecordBatch` objects.
+
+    Parameters
+    ----------
+    df : polars.LazyFrame
+        Unpacked content.
+    batch_size : int
+        Maximum number of rows per batch; defaults to `65536`.
+
+    Yields
+    ------
+    : pyarrow.RecordBatch
+        Batch of unpacked rows, sharing its buffers with the collected `Polars` object.
+
+    Notes
+    -----
+    * This requires `pyarrow` to be installed (`pip install polars_unpack[arrow]`).
+    * The content is pulled from the streaming engine batch by batch (via
+      `LazyFrame.collect_batches()`), such that only a few batches are held in memory
+      at once; versions of `Polars` lacking it collect the content at once instead.
+      Batches are sliced without copying.
+
+    """
+    if hasattr(df, "collect_batches"):
+        chunks = df.collect_batches(chunk_size=batch_size)
+    else:
+        chunks = [df.collect(engine="streaming")]
+
+    for chunk in chunks:
+        for c in chunk.iter_slices(batch_size):
+            yield from c.to_arrow().to_batches()
+
+
+def iter_leaves(
+    dtype: pl.DataType,
+    names: list[str] | None = None,
+) -> Iterator[tuple[list[str], pl.DataType]]:
+    """Iterate over the leaves of a nested datatype.
+
+    Parameters
+    ----------
+    dtype : polars.DataType
+        Datatype to walk through.
+    names : list[str] | None
+        Names of the successive fields leading to the datatype; defaults to `None`.
+
+    Yields
+    ------
+    : tuple[list[str], polars.DataType]
+        Names of the successive fields leading to each leaf (lists are crossed without
+        being named, see `reach_values()`), and its datatype.
+
+    """
+    names = names or []
+
+    if type(dtype) in (pl.Array, pl.List):
+        yield from iter_leaves(dtype.inner, names)
+    elif type(dtype) == pl.Struct:
+        for f in dtype.fields:
+            yield from iter_leaves(f.dtype, [*names, f.name])
+    else:
+        yield names, dtype
+
+
+def misfits(expr: pl.Expr, dtype: pl.DataType) -> tuple[pl.Expr, pl.Expr]:
+    """Flag the values decoded as text not fitting a datatype.
+
+    Parameters
+    ----------
+    expr : polars.Expr
+        Values of a leaf, decoded as text; see `textual()`.
+    dtype : polars.DataType
+        Datatype the values are expected to hold.
+
+    Returns
+    -------
+    : polars.Expr
+        Whether each value is mismatched: text, floats or booleans in integer leaves,
+        text or booleans in float leaves, anything but `true`/`false` in boolean leaves,
+        anything not cast to any other datatype; any value fits `String` leaves.
+    : polars.Expr
+        Whether each value is overflowed: numbers out of the range of an integer
+        datatype (included in the mismatches).
+
+    Notes
+    -----
+    JSON strings and numbers (or booleans) are not told apart once decoded as text: a
+    number quoted as a string fits a numeric leaf.
+
+    """
+    if dtype == pl.String:
+        return pl.lit(False), pl.lit(False)
+    if dtype == pl.Boolean:
+        return expr.is_not_null() & ~expr.is_in(["true", "false"]), pl.lit(False)
+
+    mismatched = expr.is_not_null() & expr.cast(dtype, strict=False).is_null()
+    if dtype not in INTEGER_RANGES:
+        return mismatched, pl.lit(False)
+
+    lower, upper = INTEGER_RANGES[dtype]
+    number = expr.cast(pl.Float64, strict=False)
+    overflowed = number.is_not_null() & ~number.is_between(lower, upper)
+    return mismatched, mismatched & overflowed
+
+
+def pack(
+    df: pl.DataFrame | pl.LazyFrame,
+    path_schema: "str | pathlib.Path | Buffer | SchemaParser",
+    row_index: str | None = None,
+    list_index: str | None = None,
+) -> pl.LazyFrame:
+    """Pack unpacked content back into nested objects, as described by a schema.
+
+    Parameters
+    ----------
+    df : polars.DataFrame | polars.LazyFrame
+        Unpacked content, columns named as in the output of the unpacking.
+    path_schema : str | pathlib.Path | Buffer | SchemaParser
+        Path to the plain text schema describing the JSON content, its content, or an
+        already parsed schema; see `parse_schema()`.
+    row_index : str | None
+        Name of the column holding the 0-based index of the JSON object each row was
+        unpacked from; defaults to `None`. Required if the schema describes lists.
+    list_index : str | None
+        Suffix of the columns holding the 0-based position of each item within its
+        exploded list; defaults to `None`. Required if the schema describes lists.
+
+    Returns
+    -------
+    : polars.LazyFrame
+        Nested content, one row per JSON object and one (`Struct` or `List`) column
+        per top-level attribute, named as in the source; to be written as
+        newline-delimited JSON via `sink()` for instance.
+
+    Raises
+    ------
+    : LineageError
+        When the schema describes lists but lineage columns are not provided.
+
+    Notes
+    -----
+    * Renamed columns are mapped back to their JSON attributes (see
+      `SchemaParser.json_paths`); attributes absent from the content come back as
+      `null` values.
+    * Each list is rebuilt with vectorized operations from the deepest up: rows are
+      grouped by the row index and the positions of the enclosing lists, the items
+      sorted by their position and imploded, then joined to their parent objects.
+    * Empty and missing lists cannot be told apart once unpacked, and both come back
+      as `null` values. Lists given a width are packed back from their first items
+      only, and lists of which the values are aggregated are not packed back (the
+      values being lost).
+
+    """
+    s = parse_schema(path_schema)
+    df = df.lazy()
+    columns = set(df.collect_schema().names())
+
+    def _column(json_path: str, dtype: pl.DataType) -> pl.Expr:
+        """Unpacked column holding the values of a leaf, or nulls if absent."""
+        # quick work
+        c = s.json_paths.get(json_path, json_path)
+        if c in columns:
+            return pl.col(c)
+        return pl.lit(None, dtype)
+
+    def _lists(dtype: pl.DataType, json_path: str) -> Iterator[tuple[str, pl.DataType]]:
+        """List the lists of an object, without entering them."""
+        # quick work
+        for f in dtype.fields:
+            jp = f"{json_path}.{f.name}".lstrip(".")
+            if jp in s.widths or jp in s.aggregations:
+                continue
+            if type(f.dtype) in (pl.Array, pl.List):
+                yield jp, f.dtype
+            elif type(f.dtype) == pl.Struct:
+                yield from _lists(f.dtype, jp)
+
+    def _assemble(dtype: pl.DataType, json_path: str, lists: list[str]) -> pl.Expr:
+        """Assemble an object from its leaves and its already rebuilt lists."""
+        # quick work
+        if json_path in lists:
+            return pl.col(f"{json_path}[]")
+        if type(dtype) != pl.Struct:
+            return _column(json_path, dtype)
+        fields = []
+        for f in dtype.fields:
+            jp = f"{json_path}.{f.name}".lstrip(".")
+            if jp in s.widths:
+                items = [
+                    _assemble(
+                        f.dtype.inner, f"{json_path}.{f.name}_{i}".lstrip("."), []
+                    )
+                    for i in range(s.widths[jp])
+                ]
+                fields.append(pl.concat_list(items).alias(f.name))
+            elif jp in s.aggregations:
+                fields.append(pl.lit(None, f.dtype).alias(f.name))
+            else:
+                fields.append(_assemble(f.dtype, jp, lists).alias(f.name))
+        return pl.struct(fields)
+
+    def _object(dtype: pl.DataType, json_path: str, keys: list[str]) -> pl.LazyFrame:
+        """Rebuild the objects identified by the keys, in a `value` column."""
+        # quick work
+        lists = dict(_lists(dtype, json_path)) if type(dtype) == pl.Struct else {}
+        value = _assemble(dtype, json_path, list(lists))
+        leaves = [c for c in dict.fromkeys(value.meta.root_names()) if c in columns]
+        objects = df.group_by(keys, maintain_order=True).agg(pl.col(leaves).first())
+        for jp, d in lists.items():
+            objects = objects.join(
+                _items(d, jp, keys), on=keys, how="left", coalesce=True
+            )
+        return objects.select(*keys, value.alias("value"))
+
+    def _items(dtype: pl.DataType, json_path: str, keys: list[str]) -> pl.LazyFrame:
+        """Rebuild the lists identified by the keys, in a `<json path>[]` column."""
+        # quick work
+        position = f"{json_path}{list_index}"
+        if type(dtype.inner) in (pl.Array, pl.List):
+            jp = f"{json_path}.{json_path}"
+            items = (
+                df.select(*keys, position)
+                .unique()
+                .join(
+                    _items(dtype.inner, jp, [*keys, position]),
+                    on=[*keys, position],
+                    how="left",
+                    coalesce=True,
+                )
+                .rename({f"{jp}[]": "value"})
+            )
+        else:
+            items = _object(dtype.inner, json_path, [*keys, position])
+        return (
+            items.filter(pl.col(position).is_not_null())
+            .group_by(keys)
+            .agg(pl.col("value").sort_by(position).alias(f"{json_path}[]"))
+        )
+
+    # one row per object already
+    if not dict(_lists(s.struct, "")):
+        value = _assemble(s.struct, "", [])
+        return df.with_columns(value.alias("value")).select("value").unnest("value")
+
+    if row_index is None or list_index is None:
+        msg = "row_index and list_index are required to pack lists back"
+        raise LineageError(msg)
+
+    # objects in the order of their row index, sorted once before anything is nested
+    df = df.sort(row_index, maintain_order=True)
+
+    return _object(s.struct, "", [row_index]).select("value").unnest("value")
+
+
+def parse_schema(
+    path_schema: "str | pathlib.Path | Buffer | SchemaParser",
+) -> "SchemaParser":
     """Parse a plain text JSON schema into a `Polars` `Struct`.
 
     Parameters
     ----------
-    path_schema : str
-        Path to the plain text file describing the JSON schema.
+    path_schema : str | pathlib.Path | Buffer | SchemaParser
+        Path to the plain text file describing the JSON schema, or its content as
+        `bytes`, `memoryview` or file-like object (`io.BytesIO`, `io.StringIO`...), or
+        an already parsed schema (returned as is).
 
     Returns
     -------
-    : polars.Struct
+    : SchemaParser
         JSON schema translated into `Polars` datatypes.
 
     """
-    with pathlib.Path(path_schema).open() as f:
-        sp = SchemaParser(f.read())
+    if isinstance(path_schema, SchemaParser):
+        sp = path_schema
+    elif isinstance(path_schema, (str, pathlib.Path)):
+        with pathlib.Path(path_schema).open() as f:
+            sp = SchemaParser(f.read())
+    else:
+        source = path_schema.read() if hasattr(path_schema, "read") else path_schema
+        sp = SchemaParser(source if isinstance(source, str) else str(source, "utf-8"))
+
+    if sp.struct is None:
         sp.to_struct()
 
-        return sp
+    return sp
 
 
-def unpack_ndjson(path_schema: str, path_data: str) -> pl.LazyFrame:
-    """Lazily scan and unpack newline-delimited JSON file given a `Polars` schema.
+def preview(
+    path_schema: "str | pathlib.Path | Buffer | SchemaParser",
+    path_data: str | pathlib.Path | Buffer,
+    n: int = 10,
+    separator: str = "|",
+    columns: list[str] | None = None,
+    row_index: str | None = None,
+    file_name: str | None = None,
+    list_index: str | None = None,
+    chunk_size: int = 65536,
+) -> pl.DataFrame:
+    """Unpack the first rows of JSON data, reading only as much of it as necessary.
 
     Parameters
     ----------
-    path_schema : str
-        Path to the plain text schema describing the JSON content.
-    path_data : str
-        Path to the JSON file (or multiple files via glob patterns).
+    path_schema : str | pathlib.Path | Buffer | SchemaParser
+        Path to the plain text schema describing the JSON content, its content, or an
+        already parsed schema; see `parse_schema()`.
+    path_data : str | pathlib.Path | Buffer
+        Path to the JSON file (or multiple files via glob patterns), or its content as
+        `bytes`, `memoryview` or file-like object (`io.BytesIO`...).
+    n : int
+        Number of unpacked rows to return; defaults to `10`.
+    separator : str
+        Separator to use when parsing the JSON file as a CSV; see `unpack_text()`.
+    columns : list[str] | None
+        Columns (as named in the output) to unpack, in that order; defaults to `None`,
+        in which case all columns described by the schema are. See `unpack_text()`.
+    row_index : str | None
+        Name of the column holding the 0-based index of the source row each row was
+        unpacked from; defaults to `None`. See `unpack_text()`.
+    file_name : str | None
+        Name of the column holding the path of the file each row was read from;
+        defaults to `None`. See `unpack_text()`.
+    list_index : str | None
+        Suffix of the columns holding the 0-based position of each item within its
+        exploded list; defaults to `None`. See `unpack_text()`.
+    chunk_size : int
+        Number of bytes read first; defaults to 64 KiB.
+
+    Returns
+    -------
+    : polars.DataFrame
+        First `n` rows of `unpack_text()` (fewer if the data holds fewer).
+
+    Notes
+    -----
+    * How many rows a line unpacks into (lists being exploded) is unknown beforehand,
+      hence the data is read in chunks of complete lines, each twice as large as the
+      previous one, and unpacked until `n` rows are: at most about twice the lines
+      necessary are read.
+    * Files matched by a glob pattern are read in lexicographical order.
+
+    """
+    s = parse_schema(path_schema)
+    paths = [path_data]
+    if isinstance(path_data, (str, pathlib.Path)):
+        paths = sorted(glob.glob(str(path_data))) or [str(path_data)]
+
+    def _read(f: io.RawIOBase) -> Iterator[bytes]:
+        """Read complete lines, in growing chunks."""
+        # quick work
+        size, rest = chunk_size, b""
+        while chunk := f.read(size):
+            content, newline, rest = (rest + chunk).rpartition(b"\n")
+            if newline:
+                yield content + newline
+            size *= 2
+        if rest:
+            yield rest
+
+    def _unpack(df: pl.DataFrame, path: str | None, offset: int) -> pl.LazyFrame:
+        """Unpack raw lines, lineage as if the whole data was scanned at once."""
+        # quick work
+        if file_name is not None:
+            df = df.with_columns(pl.lit(path, pl.String).alias(file_name))
+        if row_index is not None:
+            df = df.with_row_index(row_index, offset)
+
+        return unpack_raw(s, df.lazy(), columns, list_index)
+
+    frames, count, offset = [], 0, 0
+    for path in paths:
+        if isinstance(path, str):
+            f = open(path, "rb")  # noqa: SIM115
+        elif isinstance(path, (bytes, bytearray, memoryview)):
+            f = io.BytesIO(path)
+        else:
+            f = path
+
+        try:
+            for content in _read(f):
+                if content.strip():
+                    df = scan_text(content, separator).collect()
+                else:  # blank lines only, refused by polars
+                    lines = [None] * content.count(b"\n")
+                    df = pl.DataFrame({"raw": lines}, {"raw": pl.String})
+                unpacked = _unpack(df, path if isinstance(path, str) else None, offset)
+                frames.append(unpacked.head(n - count).collect())
+                count += len(frames[-1])
+                offset += len(df)
+                if count >= n:
+                    return pl.concat(frames)
+        finally:
+            if f is not path:
+                f.close()
+
+    # no data at all
+    if not frames:
+        return _unpack(pl.DataFrame(schema={"raw": pl.String}), None, 0).collect()
+
+    return pl.concat(frames)
+
+
+def reach_values(
+    expr: pl.Expr,
+    dtype: pl.DataType,
+    names: list[str],
+) -> tuple[pl.Expr, pl.DataType, bool] | None:
+    """Reach the values of a nested object, flattening the lists on the way.
+
+    Parameters
+    ----------
+    expr : polars.Expr
+        Expression of the current object.
+    dtype : polars.DataType
+        Datatype of the current object.
+    names : list[str]
+        Names of the successive fields leading to the values (lists are crossed without
+        being named).
+
+    Returns
+    -------
+    : tuple[polars.Expr, polars.DataType, bool] | None
+        Expression reaching the values, their datatype, and whether these are flattened
+        into a list (one per row) as some list was crossed on the way; `None` if the
+        values are absent from the datatype.
+
+    """
+    if type(dtype) in (pl.Array, pl.List):
+        if type(dtype) == pl.Array:
+            expr = expr.arr.to_list()
+        if (v := reach_values(pl.element(), dtype.inner, names)) is None:
+            return None
+        return expr.list.eval(v[0].explode() if v[2] else v[0]), v[1], True
+    if not names:
+        return expr, dtype, False
+    if type(dtype) == pl.Struct:
+        for f in dtype.fields:
+            if f.name == names[0]:
+                return reach_values(expr.struct.field(f.name), f.dtype, names[1:])
+    return None
+
+
+def scan_files(
+    scan: Callable[..., pl.LazyFrame],
+    path_data: str | pathlib.Path,
+    file_name: str,
+    **kwargs,
+) -> pl.LazyFrame:
+    """Lazily scan each file matching a path (or glob pattern), tagged by its path.
+
+    Parameters
+    ----------
+    scan : collections.abc.Callable[..., polars.LazyFrame]
+        Function scanning a single file; `polars.scan_csv()` for instance.
+    path_data : str | pathlib.Path
+        Path to the file (or multiple files via glob patterns).
+    file_name : str
+        Name of the column holding the path of the file each row was read from.
+    **kwargs
+        Keyword arguments forwarded to the `scan` function.
+
+    Returns
+    -------
+    : polars.LazyFrame
+        Content of all files, lazy style.
+
+    Notes
+    -----
+    Files are scanned in lexicographical order.
+
+    """
+    # no match: let polars complain about the missing file
+    paths = sorted(glob.glob(str(path_data))) or [str(path_data)]
+
+    return pl.concat(
+        [scan(p, **kwargs).with_columns(pl.lit(p).alias(file_name)) for p in paths],
+    )
+
+
+def scan_text(
+    path_data: str | pathlib.Path | Buffer,
+    separator: str = "|",
+    file_name: str | None = None,
+    **kwargs,
+) -> pl.LazyFrame:
+    r"""Lazily scan JSON data as plain text, one line per row in a single `raw` column.
+
+    Parameters
+    ----------
+    path_data : str | pathlib.Path | Buffer
+        Path to the JSON file (or multiple files via glob patterns), or its content as
+        `bytes`, `memoryview` or file-like object (`io.BytesIO`, `io.StringIO`...).
+    separator : str
+        Separator to use when parsing the JSON file as a CSV; defaults to `|`. Note this
+        separator should \*NOT\* be present in the file at all.
+    file_name : str | None
+        Name of the column holding the path of the file each row was read from (`null`
+        for in-memory content); defaults to `None`, in which case no column is added.
+        See `scan_files()`.
+    **kwargs
+        Keyword arguments forwarded to `polars.scan_csv()` (or `polars.read_csv()`).
+
+    Returns
+    -------
+    : polars.LazyFrame
+        Raw JSON content, lazy style.
+
+    Notes
+    -----
+    In-memory content is read eagerly, without going through the disk; `bytes` are
+    handed over to `Polars` as is, other buffers are wrapped into a file-like object.
+
+    """
+    # the column is renamed afterwards, polars otherwise mixing new_columns up with the
+    # row index pushed down into the scan by the optimizer
+    kwargs = {"has_header": False, "separator": separator} | kwargs
+
+    if isinstance(path_data, (str, pathlib.Path)):
+        if file_name is not None:
+            df = scan_files(pl.scan_csv, path_data, file_name, **kwargs)
+        else:
+            df = pl.scan_csv(path_data, **kwargs)
+    else:
+        if isinstance(path_data, (bytearray, memoryview)):
+            path_data = io.BytesIO(path_data)
+        df = pl.read_csv(path_data, **kwargs).lazy()
+        if file_name is not None:
+            df = df.with_columns(pl.lit(None, pl.String).alias(file_name))
+
+    return df.rename({"column_1": "raw"})
+
+
+def sink(
+    df: pl.LazyFrame,
+    path: str,
+    fmt: str | None = None,
+    statistics: bool = False,
+    partition_by: list[str | pl.Expr] | None = None,
+    max_file_size: int = 134217728,
+    **kwargs,
+) -> pl.DataFrame | None:
+    """Write unpacked content to a file (or `stdout`), streaming whenever possible.
+
+    Parameters
+    ----------
+    df : polars.LazyFrame
+        Unpacked content to write.
+    path : str
+        Path to the output file, or `-` for `stdout`.
+    fmt : str | None
+        Output format, one of `csv`, `ipc` (Arrow IPC file), `ipc_stream` (Arrow IPC
+        stream), `ndjson` or `parquet`; defaults to `None`, in which case it is guessed
+        from the extension of the output file.
+    statistics : bool
+        Whether to collect statistics of each column while writing; defaults to
+        `False`. See `ColumnStatistics`.
+    partition_by : list[str | polars.Expr] | None
+        Columns (or expressions deriving new columns, named after their output) to
+        partition the content by, in which case `path` is the root directory of the
+        Hive-style partitions (`source=.../day=.../part-*.parquet`) and `fmt` defaults
+        to `parquet`; defaults to `None`. See `PartitionWriter`.
+    max_file_size : int
+        Size (estimated in memory) of the content written per file when partitioning;
+        defaults to 128 MiB.
+
+    Returns
+    -------
+    : polars.DataFrame | None
+        Statistics of each column of the written content if requested, `None`
+        otherwise; see `ColumnStatistics.to_frame()`.
+
+    Raises
+    ------
+    : UnknownFormatError
+        When the output format is unknown, or cannot be guessed.
+
+    Notes
+    -----
+    * Extra parameters are forwarded to the `sink_*()` (or `write_*()`) methods.
+    * Not all plans are supported by the `Polars` streaming engine (the `unnest()` of
+      nested content read via `scan_ndjson()` for instance); the content is then
+      collected (streaming style, as much as possible) before being written.
+    * Arrow IPC content is written uncompressed unless stated otherwise, such that
+      consumers can map the buffers without copying nor decoding them; writing an
+      `ipc` file under `/dev/shm` makes it available in shared memory for instance.
+    * Statistics are accumulated batch by batch as the content flows to the writer
+      (via `LazyFrame.map_batches()`), without a second pass over the content nor
+      holding more of it in memory.
+    * Partitioned content is pulled from the streaming engine batch by batch (via
+      `LazyFrame.collect_batches()`, or collected at once by versions of `Polars`
+      lacking it) and buffered per partition, up to the file size (and up to four
+      times the file size for all partitions, the largest buffers being written
+      first); several workers can write to the same directories, each naming its
+      files with a random prefix.
+
+    """
+    fmt = fmt or SINK_FORMATS.get(pathlib.Path(path).suffix.lower())
+    if partition_by is not None:
+        fmt = fmt or "parquet"
+
+    if fmt not in ("csv", "ipc", "ipc_stream", "ndjson", "parquet"):
+        raise UnknownFormatError(path)
+
+    # partitioning columns derived before anything else
+    if partition_by is not None:
+        df = df.with_columns(p for p in partition_by if isinstance(p, pl.Expr))
+
+    stats = ColumnStatistics() if statistics else None
+
+    # batches pulled from the streaming engine one by one, sliced by the writer
+    if partition_by is not None:
+        writer = PartitionWriter(
+            path,
+            [p if isinstance(p, str) else p.meta.output_name() for p in partition_by],
+            fmt,
+            max_file_size,
+            **kwargs,
+        )
+        if hasattr(df, "collect_batches"):
+            batches = df.collect_batches()
+        else:
+            batches = df.collect(engine="streaming").iter_slices()
+        for batch in batches:
+            if stats is not None:
+                stats.update(batch)
+            writer.write(batch)
+        writer.flush()
+
+        return None if stats is None else stats.to_frame()
+
+    # statistics tapped into the pipeline, batches left untouched
+    if stats is not None:
+        df = df.map_batches(stats.update, streamable=True)
+
+    # uncompressed arrow ipc as understood by both the sink_ipc() and write_*() methods
+    if fmt in ("ipc", "ipc_stream") and kwargs.get("compression") in (
+        None,
+        "uncompressed",
+    ):
+        kwargs["compression"] = None
+
+    # no streaming sink for stdout nor arrow ipc streams
+    if path == "-":
+        getattr(df.collect(engine="streaming"), f"write_{fmt}")(
+            sys.stdout.buffer,
+            **kwargs,
+        )
+        sys.stdout.buffer.flush()
+    elif fmt == "ipc_stream":
+        df.collect(engine="streaming").write_ipc_stream(path, **kwargs)
+    else:
+        try:
+            getattr(df, f"sink_{fmt}")(path, **kwargs)
+        except pl.exceptions.InvalidOperationError:
+            if stats is not None:
+                stats.columns.clear()
+            getattr(df.collect(engine="streaming"), f"write_{fmt}")(path, **kwargs)
+
+    return None if stats is None else stats.to_frame()
+
+
+def textual(dtype: pl.DataType) -> pl.DataType:
+    """Replace the leaves of a nested datatype by text.
+
+    Parameters
+    ----------
+    dtype : polars.DataType
+        Datatype to walk through.
+
+    Returns
+    -------
+    : polars.DataType
+        Same nested datatype, all leaves being `String`: any scalar value decodes as
+        text (numbers and booleans as written in the JSON content, strings unquoted),
+        to be checked against the original datatype via expressions afterwards; see
+        `misfits()`.
+
+    """
+    if type(dtype) == pl.Array:
+        return pl.Array(textual(dtype.inner), dtype.size)
+    if type(dtype) == pl.List:
+        return pl.List(textual(dtype.inner))
+    if type(dtype) == pl.Struct:
+        return pl.Struct([pl.Field(f.name, textual(f.dtype)) for f in dtype.fields])
+    return pl.String
+
+
+def unpack_columnar(
+    path_schema: "str | pathlib.Path | Buffer | SchemaParser",
+    path_data: str | pathlib.Path | Buffer,
+    fmt: str = "parquet",
+    row_index: str | None = None,
+    file_name: str | None = None,
+    list_index: str | None = None,
+    **kwargs,
+) -> pl.LazyFrame:
+    """Lazily scan and unpack nested columnar content (Parquet or IPC) given a schema.
+
+    Parameters
+    ----------
+    path_schema : str | pathlib.Path | Buffer | SchemaParser
+        Path to the plain text schema describing the nested content, its content, or
+        an already parsed schema; see `parse_schema()`.
+    path_data : str | pathlib.Path | Buffer
+        Path to the file (or multiple files via glob patterns), or its content as
+        `bytes`, `memoryview` or file-like object (`io.BytesIO`...).
+    fmt : str
+        Input format, `parquet` or `ipc` (Arrow IPC file); defaults to `parquet`.
+    row_index : str | None
+        Name of the column holding the 0-based index of the source row each row was
+        unpacked from; defaults to `None`. See `unpack_text()`.
+    file_name : str | None
+        Name of the column holding the path of the file each row was read from;
+        defaults to `None`. See `unpack_text()`.
+    list_index : str | None
+        Suffix of the columns holding the 0-based position of each item within its
+        exploded list; defaults to `None`. See `unpack_text()`.
+    **kwargs
+        Keyword arguments forwarded to `polars.scan_parquet()` or `polars.scan_ipc()`
+        (or their `read_*()` counterparts).
+
+    Returns
+    -------
+    : polars.LazyFrame
+        Unpacked content, lazy style.
+
+    Notes
+    -----
+    * Only the top-level columns described by the schema are selected, and the
+      selection is pushed down into the reader: other columns are never read. Nested
+      fields absent from the schema are however read before being pruned, `Polars`
+      (as of 1.44) not pushing struct field selections down into its readers.
+    * Nested columns are then conformed to the schema, fields matched by name: fields
+      absent from the schema are dropped, fields absent from the content are added as
+      `null` values, and leaves are cast to the datatypes of the schema (`null` if not
+      castable). Lists are conformed item by item, without exploding.
+    * In-memory content is read eagerly.
+
+    """
+    s = parse_schema(path_schema)
+
+    def _conform(expr: pl.Expr, dtype: pl.DataType, target: pl.DataType) -> pl.Expr:
+        """Conform nested content to the datatype given by the schema."""
+        # quick work
+        if type(target) == pl.Struct and type(dtype) == pl.Struct:
+            fields = {f.name: f.dtype for f in dtype.fields}
+            return pl.struct(
+                [
+                    (
+                        _conform(expr.struct.field(f.name), fields[f.name], f.dtype)
+                        if f.name in fields
+                        else pl.lit(None, f.dtype)
+                    ).alias(f.name)
+                    for f in target.fields
+                ],
+            )
+        if type(target) in (pl.Array, pl.List) and type(dtype) in (pl.Array, pl.List):
+            if type(dtype) == pl.Array:
+                expr = expr.arr.to_list()
+            return expr.list.eval(_conform(pl.element(), dtype.inner, target.inner))
+        if type(target) in (pl.Array, pl.List, pl.Struct) or type(dtype) in (
+            pl.Array,
+            pl.List,
+            pl.Struct,
+        ):
+            return pl.lit(None, target)
+        return expr.cast(target, strict=False)
+
+    # scan (in memory content is read eagerly)
+    if isinstance(path_data, (str, pathlib.Path)):
+        scan = getattr(pl, f"scan_{fmt}")
+        if file_name is not None:
+            df = scan_files(scan, path_data, file_name, **kwargs)
+        else:
+            df = scan(path_data, **kwargs)
+    else:
+        if isinstance(path_data, (bytearray, memoryview)):
+            path_data = io.BytesIO(path_data)
+        df = getattr(pl, f"read_{fmt}")(path_data, **kwargs).lazy()
+        if file_name is not None:
+            df = df.with_columns(pl.lit(None, pl.String).alias(file_name))
+    if row_index is not None:
+        df = df.with_row_index(row_index)
+
+    # only the columns described by the schema are read, conformed to their datatypes
+    # literals added as columns, a selection of literals only would hold a single row
+    lineage = [c for c in (row_index, file_name) if c is not None]
+    schema = df.collect_schema()
+    df = df.with_columns(
+        [
+            _conform(pl.col(f.name), schema[f.name], f.dtype).alias(f.name)
+            if f.name in schema
+            else pl.lit(None, f.dtype).alias(f.name)
+            for f in s.struct.fields
+        ],
+    ).select(*lineage, *[f.name for f in s.struct.fields])
+
+    return df.json.unpack(
+        s.struct,
+        list_index=list_index,
+        widths=s.widths,
+        aggregations=s.aggregations,
+    ).rename(s.json_paths)
+
+
+def unpack_ipc(
+    path_schema: "str | pathlib.Path | Buffer | SchemaParser",
+    path_data: str | pathlib.Path | Buffer,
+    row_index: str | None = None,
+    file_name: str | None = None,
+    list_index: str | None = None,
+    **kwargs,
+) -> pl.LazyFrame:
+    """Lazily scan and unpack nested Arrow IPC files given a schema.
+
+    Parameters
+    ----------
+    path_schema : str | pathlib.Path | Buffer | SchemaParser
+        Path to the plain text schema describing the nested content, its content, or
+        an already parsed schema; see `parse_schema()`.
+    path_data : str | pathlib.Path | Buffer
+        Path to the IPC file (or multiple files via glob patterns), or its content.
+    row_index : str | None
+        Name of the column holding the 0-based index of the source row each row was
+        unpacked from; defaults to `None`. See `unpack_text()`.
+    file_name : str | None
+        Name of the column holding the path of the file each row was read from;
+        defaults to `None`. See `unpack_text()`.
+    list_index : str | None
+        Suffix of the columns holding the 0-based position of each item within its
+        exploded list; defaults to `None`. See `unpack_text()`.
+    **kwargs
+        Keyword arguments forwarded to `polars.scan_ipc()`.
+
+    Returns
+    -------
+    : polars.LazyFrame
+        Unpacked content, lazy style.
+
+    Notes
+    -----
+    See `unpack_columnar()`.
+
+    """
+    return unpack_columnar(
+        path_schema, path_data, "ipc", row_index, file_name, list_index, **kwargs
+    )
+
+
+def unpack_ndjson(
+    path_schema: "str | pathlib.Path | Buffer | SchemaParser",
+    path_data: str | pathlib.Path | Buffer,
+    row_index: str | None = None,
+    file_name: str | None = None,
+    list_index: str | None = None,
+) -> pl.LazyFrame:
+    """Lazily scan and unpack newline-delimited JSON file given a `Polars` schema.
+
+    Parameters
+    ----------
+    path_schema : str | pathlib.Path | Buffer | SchemaParser
+        Path to the plain text schema describing the JSON content, its content, or an
+        already parsed schema; see `parse_schema()`.
+    path_data : str | pathlib.Path | Buffer
+        Path to the JSON file (or multiple files via glob patterns), or its content as
+        `bytes`, `memoryview` or file-like object (`io.BytesIO`, `io.StringIO`...).
+    row_index : str | None
+        Name of the column holding the 0-based index of the JSON object each row was
+        unpacked from; defaults to `None`. See `unpack_text()`.
+    file_name : str | None
+        Name of the column holding the path of the file each row was read from;
+        defaults to `None`. See `unpack_text()`.
+    list_index : str | None
+        Suffix of the columns holding the 0-based position of each item within its
+        exploded list; defaults to `None`. See `unpack_text()`.
+
+    Returns
+    -------
+    : polars.LazyFrame
+        Unpacked JSON content, lazy style.
+
+    Notes
+    -----
+    * Fields described in the schema but absent from the JSON source will be added as
+      `null` values.
+    * Fields present in the JSON source but absent from the schema will be dropped.
+
+    """
+    s = parse_schema(path_schema)
+
+    # read as json (in memory content is read eagerly) and unpack the object
+    if isinstance(path_data, (str, pathlib.Path)):
+        if file_name is not None:
+            df = scan_files(pl.scan_ndjson, path_data, file_name)
+        else:
+            df = pl.scan_ndjson(path_data)
+    else:
+        if isinstance(path_data, (bytearray, memoryview)):
+            path_data = io.BytesIO(path_data)
+        df = pl.read_ndjson(path_data).lazy()
+        if file_name is not None:
+            df = df.with_columns(pl.lit(None, pl.String).alias(file_name))
+    if row_index is not None:
+        df = df.with_row_index(row_index)
+    df = df.json.unpack(
+        s.struct,
+        list_index=list_index,
+        widths=s.widths,
+        aggregations=s.aggregations,
+    )
+
+    # add missing columns
+    names = set(df.collect_schema().names())
+    df = df.with_columns(
+        [
+            pl.lit(None).cast(d).alias(p)
+            for p, d in zip(s.json_paths.keys(), s.dtypes, strict=True)
+            if p not in names
+        ],
+    )
+
+    # rename fields (otherwise renamed to their full json paths)
+    df = df.rename(s.json_paths)
+
+    # final selection (drop extra/unwanted columns), list positions last
+    lineage = [c for c in (row_index, file_name) if c is not None]
+    positions = []
+    if list_index is not None:
+        positions = [
+            f"{p}{list_index}"
+            for p in exploded_lists(s.struct, s.widths, s.aggregations, s.separator)
+        ]
+
+    return df.select(*lineage, *s.columns, *positions)
+
+
+def unpack_parquet(
+    path_schema: "str | pathlib.Path | Buffer | SchemaParser",
+    path_data: str | pathlib.Path | Buffer,
+    row_index: str | None = None,
+    file_name: str | None = None,
+    list_index: str | None = None,
+    **kwargs,
+) -> pl.LazyFrame:
+    """Lazily scan and unpack nested Parquet files given a schema.
+
+    Parameters
+    ----------
+    path_schema : str | pathlib.Path | Buffer | SchemaParser
+        Path to the plain text schema describing the nested content, its content, or
+        an already parsed schema; see `parse_schema()`.
+    path_data : str | pathlib.Path | Buffer
+        Path to the Parquet file (or multiple files via glob patterns), or its content.
+    row_index : str | None
+        Name of the column holding the 0-based index of the source row each row was
+        unpacked from; defaults to `None`. See `unpack_text()`.
+    file_name : str | None
+        Name of the column holding the path of the file each row was read from;
+        defaults to `None`. See `unpack_text()`.
+    list_index : str | None
+        Suffix of the columns holding the 0-based position of each item within its
+        exploded list; defaults to `None`. See `unpack_text()`.
+    **kwargs
+        Keyword arguments forwarded to `polars.scan_parquet()`.
+
+    Returns
+    -------
+    : polars.LazyFrame
+        Unpacked content, lazy style.
+
+    Notes
+    -----
+    See `unpack_columnar()`.
+
+    """
+    return unpack_columnar(
+        path_schema, path_data, "parquet", row_index, file_name, list_index, **kwargs
+    )
+
+
+def unpack_raw(
+    path_schema: "str | pathlib.Path | Buffer | SchemaParser",
+    df: pl.LazyFrame,
+    columns: list[str] | None = None,
+    list_index: str | None = None,
+) -> pl.LazyFrame:
+    """Unpack JSON content held as plain text in the `raw` column of a `LazyFrame`.
+
+    Parameters
+    ----------
+    path_schema : str | pathlib.Path | Buffer | SchemaParser
+        Path to the plain text schema describing the JSON content, its content, or an
+        already parsed schema; see `parse_schema()`.
+    df : polars.LazyFrame
+        Raw JSON content, as returned by `scan_text()`; other columns are carried along
+        (as lineage columns), before the decoded content.
+    columns : list[str] | None
+        Columns (as named in the output) to unpack, in that order; defaults to `None`,
+        in which case all columns described by the schema are. See `unpack_text()`.
+    list_index : str | None
+        Suffix of the columns holding the 0-based position of each item within its
+        exploded list; defaults to `None`. See `unpack_text()`.
+
+    Returns
+    -------
+    : polars.LazyFrame
+        Unpacked JSON content, lazy style.
+
+    """
+    s = parse_schema(path_schema)
+    struct = s.struct
+    json_paths = s.json_paths
+
+    def _prune(dtype: pl.DataType, json_path: str) -> pl.DataType | None:
+        """Prune a datatype of the fields not leading to any requested column."""
+        # quick work
+        if type(dtype) in (pl.Array, pl.List):
+            jp = json_path
+            if type(dtype.inner) in (pl.Array, pl.List):
+                jp = f"{json_path}.{json_path}"
+            # outer list first, as the position columns are when unpacking everything
+            n = len(lists)
+            lists.append(json_path)
+            if (inner := _prune(dtype.inner, jp)) is None:
+                del lists[n:]
+                return None
+            return (
+                pl.List(inner)
+                if type(dtype) == pl.List
+                else pl.Array(inner, dtype.size)
+            )
+        if type(dtype) == pl.Struct:
+            fields = []
+            for f in dtype.fields:
+                jp = f"{json_path}.{f.name}".lstrip(".")
+                # first items extracted as columns, kept whole if any is requested
+                if jp in s.widths:
+                    n = s.widths[jp]
+                    items = [pl.Field(f"{f.name}_{i}", f.dtype.inner) for i in range(n)]
+                    if _prune(pl.Struct(items), json_path) is not None:
+                        fields.append(f)
+                # values aggregated within the list, which is not exploded
+                elif jp in s.aggregations:
+                    n = len(lists)
+                    if (d := _prune(f.dtype, jp)) is not None:
+                        fields.append(pl.Field(f.name, d))
+                    del lists[n:]
+                elif (d := _prune(f.dtype, jp)) is not None:
+                    fields.append(pl.Field(f.name, d))
+            return pl.Struct(fields) if fields else None
+        if s.json_paths.get(json_path, json_path) in columns:
+            paths.append(json_path)
+            return dtype
+        return None
+
+    # decode (and unpack) only what leads to the requested columns
+    if columns is not None:
+        lists, paths = [], []
+        if (pruned := _prune(s.struct, "")) is not None:
+            struct = pruned
+            json_paths = {p: c for p, c in s.json_paths.items() if p in paths}
+
+    # unpack object and rename fields (otherwise renamed to their full json paths)
+    # no other transformations are necessary as the schema is already dominant here
+    # lineage columns are carried along, before the decoded content
+    lineage = [c for c in df.collect_schema().names() if c != "raw"]
+
+    df = (
+        df.select(*lineage, pl.col("raw").str.json_decode(struct))
+        .unnest("raw")
+        .json.unpack(
+            struct,
+            list_index=list_index,
+            widths=s.widths,
+            aggregations=s.aggregations,
+        )
+        .rename(json_paths)
+    )
+
+    if columns is None:
+        return df
+
+    # list positions last, as when unpacking everything
+    positions = []
+    if list_index is not None:
+        positions = [f"{p}{list_index}" for p in lists]
+
+    return df.select(*lineage, *columns, *positions)
+
+
+def unpack_records(
+    records: Iterable[dict],
+    path_schema: "str | pathlib.Path | Buffer | SchemaParser",
+    chunk_size: int = 10000,
+    small_batch: int = 50,
+) -> pl.DataFrame:
+    """Unpack already parsed JSON content (Python objects) given a `Polars` schema.
+
+    Parameters
+    ----------
+    records : collections.abc.Iterable[dict]
+        Parsed JSON objects, one per row; can be a generator.
+    path_schema : str | pathlib.Path | Buffer | SchemaParser
+        Path to the plain text schema describing the JSON content, its content, or an
+        already parsed schema; see `parse_schema()`.
+    chunk_size : int
+        Number of records converted to a `Polars` object (and unpacked) at once;
+        defaults to `10000`.
+    small_batch : int
+        Chunks of up to that many records are flattened in Python instead (see
+        `RecordFlattener`); defaults to `50`.
+
+    Returns
+    -------
+    : polars.DataFrame
+        Unpacked JSON content.
+
+    Notes
+    -----
+    * The schema is dominant: attributes absent from the schema are ignored, and
+      attributes absent from the records are added as `null` values.
+    * Values not fitting the schema are handled as when decoding JSON text (see
+      `conformer()`): numbers are written as text in `String` leaves, text in numeric
+      leaves or out of range integers become `null`, instead of failing the batch.
+    * Records are converted to `Polars` objects a chunk at a time, such that the
+      memory needed by the conversion does not depend on the total number of records
+      (when provided by a generator). The unpacked chunks are however all held until
+      concatenated into the returned `DataFrame`.
+    * Records are converted via `pyarrow` if installed (`pip install
+      polars_unpack[arrow]`), several times faster than the `Polars` constructor used
+      otherwise.
+    * Building and running the `Polars` pipeline costs a few milliseconds regardless of
+      the number of records; for a handful of records (request-time enrichment for
+      instance) flattening them in Python is an order of magnitude faster. Pass an
+      already parsed schema to compile the flattener once only.
+    * Flattening in Python costs about 60-90 us per record of the real life-like
+      example (two lines, one discount per line), against 7-9 ms per batch for the
+      `Polars` pipeline: the default `small_batch` sits below the break-even point of
+      about 100 records (see `benchmarks/latency.py`).
+
+    """
+    s = parse_schema(path_schema)
+    schema = s.struct.to_schema()
+    records = iter(records)
+
+    if s.flattener is None:
+        s.flattener = RecordFlattener(s, s.separator)
+
+    conform = s.flattener.conform_record
+
+    # pyarrow builds columns from python objects much faster than polars does
+    try:
+        import pyarrow as pa
+    except ImportError:
+        pa = None
+    arrow_schema = None
+
+    chunks = []
+    while chunk := list(itertools.islice(records, chunk_size)):
+        # fixed overheads of the polars pipeline dominate for small batches
+        if len(chunk) <= small_batch:
+            chunks.append(s.flattener.flatten(chunk))
+            continue
+
+        # built once, and only if needed (a few milliseconds, as much as small batches)
+        if pa is not None and arrow_schema is None:
+            arrow_schema = pl.DataFrame(schema=schema).to_arrow().schema
+
+        # values not fitting the schema are conformed (and the conversion retried) only
+        # when pyarrow fails, leaving clean records untouched; polars casts some of
+        # these values (text to numbers...) instead, hence records always conformed
+        if pa is not None:
+            try:
+                table = pa.Table.from_pylist(chunk, schema=arrow_schema)
+            except (pa.ArrowInvalid, pa.ArrowTypeError):
+                table = pa.Table.from_pylist(
+                    [conform(r) for r in chunk],
+                    schema=arrow_schema,
+                )
+            df = pl.from_arrow(table)
+        else:
+            df = pl.DataFrame([conform(r) for r in chunk], schema=schema)
+
+        chunks.append(
+            UnpackFrame(df, s.separator)
+            .unpack(s.struct, widths=s.widths, aggregations=s.aggregations)
+            .rename(s.json_paths)
+        )
+
+    if not chunks:
+        return s.flattener.flatten([])
+
+    return pl.concat(chunks, rechunk=True)
+
+
+def unpack_routes(
+    path_schemas: "dict[str | None, str | pathlib.Path | Buffer | SchemaParser]",
+    path_data: str | pathlib.Path | Buffer,
+    discriminator: str,
+    separator: str = "|",
+    row_index: str | None = None,
+    file_name: str | None = None,
+    list_index: str | None = None,
+    **kwargs,
+) -> dict[str | None, pl.LazyFrame]:
+    """Lazily scan JSON data mixing several types of objects, unpacked per type.
+
+    Parameters
+    ----------
+    path_schemas : dict[str | None, str | pathlib.Path | Buffer | SchemaParser]
+        Dictionary of discriminator value -> schema pairs, each schema describing the
+        JSON objects of a type (`None` for the objects without discriminator); see
+        `parse_schema()`.
+    path_data : str | pathlib.Path | Buffer
+        Path to the JSON file (or multiple files via glob patterns), or its content;
+        see `scan_text()`.
+    discriminator : str
+        JSON path (dot-separated) to the attribute holding the type of each object.
+    separator : str
+        Separator to use when parsing the JSON file as a CSV; see `unpack_text()`.
+    row_index : str | None
+        Name of the column holding the 0-based index of the JSON object each row was
+        unpacked from, counted across all types; defaults to `None`. See
+        `unpack_text()`.
+    file_name : str | None
+        Name of the column holding the path of the file each row was read from;
+        defaults to `None`. See `unpack_text()`.
+    list_index : str | None
+        Suffix of the columns holding the 0-based position of each item within its
+        exploded list; defaults to `None`. See `unpack_text()`.
+    **kwargs
+        Keyword arguments forwarded to `scan_text()`.
+
+    Returns
+    -------
+    : dict[str | None, polars.LazyFrame]
+        Dictionary of discriminator value -> unpacked JSON content pairs, lazy style.
+
+    Notes
+    -----
+    * The data is scanned once, and only the discriminator is decoded (as a string,
+      numbers included) before the content is cached; each type is then decoded and
+      unpacked given its own schema, for the matching rows only. Collect all frames at
+      once via `polars.collect_all()` to share the cached content.
+    * Objects of which the discriminator matches none of the values are ignored.
+
+    """
+    schemas = {v: parse_schema(p) for v, p in path_schemas.items()}
+
+    # struct leading to the discriminator only, the parser skipping over the rest
+    names = discriminator.split(".")
+    dtype = pl.String
+    for name in reversed(names):
+        dtype = pl.Struct([pl.Field(name, dtype)])
+
+    route = pl.col("raw").str.json_decode(dtype)
+    for name in names:
+        route = route.struct.field(name)
+
+    # read as plain text and decode the discriminator, once for all types
+    df = scan_text(path_data, separator, file_name, **kwargs)
+    if row_index is not None:
+        df = df.with_row_index(row_index)
+    df = df.with_columns(route.alias(discriminator)).cache()
+
+    return {
+        v: unpack_raw(
+            s,
+            df.filter(
+                pl.col(discriminator).is_null()
+                if v is None
+                else pl.col(discriminator) == v,
+            ).drop(discriminator),
+            list_index=list_index,
+        )
+        for v, s in schemas.items()
+    }
+
+
+def unpack_text(
+    path_schema: "str | pathlib.Path | Buffer | SchemaParser",
+    path_data: str | pathlib.Path | Buffer,
+    separator: str = "|",
+    columns: list[str] | None = None,
+    row_index: str | None = None,
+    file_name: str | None = None,
+    list_index: str | None = None,
+    **kwargs,
+) -> pl.LazyFrame:
+    r"""Lazily scan and unpack JSON data read as plain text, given a `Polars` schema.
+
+    Parameters
+    ----------
+    path_schema : str | pathlib.Path | Buffer | SchemaParser
+        Path to the plain text schema describing the JSON content, its content, or an
+        already parsed schema; see `parse_schema()`.
+    path_data : str | pathlib.Path | Buffer
+        Path to the JSON file (or multiple files via glob patterns), or its content as
+        `bytes`, `memoryview` or file-like object (`io.BytesIO`, `io.StringIO`...); see
+        `scan_text()`.
+    separator : str
+        Separator to use when parsing the JSON file as a CSV; defaults to `|` but `#` or
+        `$` could be good candidates too (as are UTF-8 characters?). Note this separator
+        should \*NOT\* be present in the file at all (`,` or `:` are thus out of
+        question given the JSON context).
+    columns : list[str] | None
+        Columns (as named in the output) to unpack, in that order; defaults to `None`,
+        in which case all columns described by the schema are.
+    row_index : str | None
+        Name of the column holding the 0-based index of the JSON object each row was
+        unpacked from; defaults to `None`, in which case no column is added.
+    file_name : str | None
+        Name of the column holding the path of the file each row was read from;
+        defaults to `None`, in which case no column is added. See `scan_text()`.
+    list_index : str | None
+        Suffix of the columns holding the 0-based position of each item within its
+        exploded list; defaults to `None`, in which case no columns are added. See
+        `UnpackFrame.unpack()`.
+    **kwargs
+        Keyword arguments forwarded to `scan_text()`.
+
+    Returns
+    -------
+    : polars.LazyFrame
+        Unpacked JSON content, lazy style.
+
+    Notes
+    -----
+    This is mostly a test, to verify the output would be identical, as this unpacking
+    use case could be applied on a CSV column containing some JSON content for instance.
+    The preferred way for native JSON content remains the `unpack_ndjson()` function
+    defined in this same script.
+
+    In the current `Polars` implementation this function is however better suited for
+    the use case: the provided schema is always dominant, regardless of the content of
+    the JSON file. We do not need to add or remove missing or supplementary columns,
+    everything is taken care of by the `json_extract()` method.
+
+    When only some `columns` are requested, the schema is pruned of all other fields
+    before decoding: the JSON parser skips over their content, and lists none of the
+    requested columns belong to are neither decoded nor exploded. The output thus holds
+    a row per JSON object if all requested columns are out of any list (for instance
+    `timestamp`, `location` and `method` in the `tests/samples/complex.schema` example),
+    and is not a simple selection of the fully unpacked content in general.
+
+    Lineage columns (`row_index`, `file_name` and `list_index`) allow to get back to
+    the JSON objects and lists with cheap integer operations; the row index is assigned
+    right after scanning, before anything is decoded or exploded (and keeps counting
+    across files matched by a glob pattern).
+
+    """
+    # read as plain text, lineage columns carried along before the decoded content
+    df = scan_text(path_data, separator, file_name, **kwargs)
+    if row_index is not None:
+        df = df.with_row_index(row_index)
+
+    return unpack_raw(path_schema, df, columns, list_index)
+
+
+def unpack_tolerant(
+    path_schema: "str | pathlib.Path | Buffer | SchemaParser",
+    path_data: str | pathlib.Path | Buffer,
+    separator: str = "|",
+    max_error_rate: float | None = None,
+    row_index: str | None = None,
+    file_name: str | None = None,
+    list_index: str | None = None,
+    **kwargs,
+) -> tuple[pl.LazyFrame, pl.LazyFrame]:
+    """Lazily scan and unpack JSON data, quarantining the malformed lines aside.
+
+    Parameters
+    ----------
+    path_schema : str | pathlib.Path | Buffer | SchemaParser
+        Path to the plain text schema describing the JSON content, its content, or an
+        already parsed schema; see `parse_schema()`.
+    path_data : str | pathlib.Path | Buffer
+        Path to the JSON file (or multiple files via glob patterns), or its content;
+        see `scan_text()`.
+    separator : str
+        Separator to use when parsing the JSON file as a CSV; see `unpack_text()`.
+    max_error_rate : float | None
+        Maximum share (between `0` and `1`) of malformed lines tolerated; defaults to
+        `None`, in which case any number is.
+    row_index : str | None
+        Name of the column holding the 0-based index of the line each row was unpacked
+        from; defaults to `None`. See `unpack_text()`.
+    file_name : str | None
+        Name of the column holding the path of the file each row was read from;
+        defaults to `None`. See `unpack_text()`.
+    list_index : str | None
+        Suffix of the columns holding the 0-based position of each item within its
+        exploded list; defaults to `None`. See `unpack_text()`.
+    **kwargs
+        Keyword arguments forwarded to `scan_text()`.
+
+    Returns
+    -------
+    : polars.LazyFrame
+        Unpacked JSON content of the valid lines, lazy style.
+    : polars.LazyFrame
+        Malformed lines, lazy style: path of the `file` (`null` for in-memory content),
+        0-based `line` index (counted across files), `raw` content and `reason`.
+
+    Raises
+    ------
+    : ErrorRateExceededError
+        When the share of malformed lines exceeds `max_error_rate`.
+
+    Notes
+    -----
+    * Lines are checked for the reason given being the first met of: `empty line`,
+      `invalid JSON`, `not a JSON object`, and `type mismatch: <json path>` when a
+      value present in the line does not fit the datatype given by the schema; such a
+      value would otherwise be lost once decoded, or fail the decoding of the whole
+      column.
+    * Checks are vectorized: lines are decoded once, all leaves as text (see
+      `textual()`), the values then checked via casts (see `misfits()`) and those of
+      the valid lines converted to the schema (see `from_text()`). Values of the wrong
+      shape (objects or arrays in place of scalars, or the other way around) fail the
+      decoding of their batch: the lines holding such values are then isolated, and
+      the values located, by `decode_leniently()` at a cost growing with their number.
+    * Not caught: numbers (or booleans) quoted as JSON strings, as these cannot be told
+      apart once decoded as text (`"12"` fits an integer leaf, and is unpacked as
+      such); scalars in place of lists of scalars, read as lists of one item (as
+      `json_decode()` does). Mismatches of shape within lists are reported at the path
+      of the list.
+    * Only the valid lines are unpacked; collect both frames at once via
+      `polars.collect_all()` to share the scanned and checked content.
+    * When a `max_error_rate` is given the rate of malformed lines is checked batch by
+      batch as the content streams (via `LazyFrame.collect_batches()`), aborting as
+      soon as the rate over the lines read so far exceeds it, before anything gets
+      unpacked nor written; a burst of malformed lines at the start of the content is
+      then enough. The content is scanned and checked again when the returned frames
+      are collected.
+
+    """
+    s = parse_schema(path_schema)
+    text = textual(s.struct)
+
+    def _check(expr: pl.Expr, dtype: pl.DataType, names: list[str]) -> pl.Expr | None:
+        """Build the expression returning the first mismatch within a value, if any."""
+        # quick work
+        if type(dtype) in (pl.Array, pl.List):
+            if type(dtype) == pl.Array:
+                expr = expr.arr.to_list()
+            if (inner := _check(pl.element(), dtype.inner, names)) is None:
+                return None
+            return expr.list.eval(inner).list.drop_nulls().list.first()
+        if type(dtype) == pl.Struct:
+            reasons = [
+                r
+                for f in dtype.fields
+                if (r := _check(expr.struct.field(f.name), f.dtype, [*names, f.name]))
+                is not None
+            ]
+            return pl.coalesce(reasons) if reasons else None
+        if dtype == pl.String:
+            return None
+        return pl.when(misfits(expr, dtype)[0]).then(
+            pl.lit(f"type mismatch: {'.'.join(names)}"),
+        )
+
+    # read as plain text, lines indexed before anything is filtered out
+    df = scan_text(path_data, separator, "file", **kwargs).with_row_index("line")
+
+    # syntax first, json_decode() failing on the whole column otherwise
+    raw = pl.col("raw")
+    df = df.with_columns(
+        pl.when(raw.is_null() | (raw.str.strip_chars() == ""))
+        .then(pl.lit("empty line"))
+        .when(raw.str.json_path_match("$").is_null())
+        .then(pl.lit("invalid JSON"))
+        .when(~raw.str.strip_chars_start().str.starts_with("{"))
+        .then(pl.lit("not a JSON object"))
+        .alias("reason"),
+    )
+
+    # decoded as text, values of the wrong shape set aside
+    df = df.with_columns(
+        pl.when(pl.col("reason").is_null())
+        .then(raw)
+        .map_batches(
+            lambda r: decode_leniently(r, text),
+            return_dtype=pl.Struct(
+                {"decoded": text, "mismatches": pl.List(pl.String)},
+            ),
+            is_elementwise=True,
+        )
+        .alias("decoded"),
+    ).unnest("decoded")
+
+    # then values not fitting their datatype, in the order of the schema
+    mismatch = pl.col("mismatches").list.first()
+    reasons = [
+        pl.col("reason"),
+        pl.when(mismatch == "")
+        .then(pl.lit("invalid JSON"))
+        .otherwise(pl.concat_str(pl.lit("type mismatch: "), mismatch)),
+    ]
+    if (reason := _check(pl.col("decoded"), s.struct, [])) is not None:
+        reasons.append(reason)
+
+    df = df.with_columns(pl.coalesce(reasons).alias("reason")).cache()
+
+    # the running rate is checked as batches stream, aborting as soon as exceeded
+    if max_error_rate is not None:
+        malformed = df.select(pl.col("reason").is_not_null())
+        if hasattr(malformed, "collect_batches"):
+            batches = malformed.collect_batches()
+        else:
+            batches = [malformed.collect(engine="streaming")]
+        n, total = 0, 0
+        for batch in batches:
+            n += batch["reason"].sum()
+            total += len(batch)
+            if n > max_error_rate * total:
+                rate = n / total
+                msg = (
+                    f"{rate:.2%} of the lines read are malformed "
+                    f"({max_error_rate:.2%} max)"
+                )
+                raise ErrorRateExceededError(msg)
+
+    # lineage columns as requested
+    lineage = []
+    if row_index is not None:
+        lineage.append(pl.col("line").alias(row_index))
+    if file_name is not None:
+        lineage.append(pl.col("file").alias(file_name))
+
+    unpacked = (
+        df.filter(pl.col("reason").is_null())
+        .select(*lineage, from_text(pl.col("decoded"), s.struct).alias("decoded"))
+        .unnest("decoded")
+        .json.unpack(
+            s.struct,
+            list_index=list_index,
+            widths=s.widths,
+            aggregations=s.aggregations,
+        )
+        .rename(s.json_paths)
+    )
+    quarantined = df.filter(pl.col("reason").is_not_null()).select(
+        "file",
+        "line",
+        "raw",
+        "reason",
+    )
+
+    return unpacked, quarantined
+
+
+def unpack_versions(
+    path_schemas: "dict[str | None, str | pathlib.Path | Buffer | SchemaParser]",
+    path_data: str | pathlib.Path | Buffer,
+    version: str,
+    version_name: str = "version",
+    separator: str = "|",
+    row_index: str | None = None,
+    file_name: str | None = None,
+    list_index: str | None = None,
+    **kwargs,
+) -> pl.LazyFrame:
+    """Lazily scan and unpack JSON data mixing several versions of a schema, harmonized.
+
+    Parameters
+    ----------
+    path_schemas : dict[str | None, str | pathlib.Path | Buffer | SchemaParser]
+        Dictionary of version -> schema pairs, from the oldest to the latest version
+        (`None` for the objects without version); see `parse_schema()`.
+    path_data : str | pathlib.Path | Buffer
+        Path to the JSON file (or multiple files via glob patterns), or its content;
+        see `scan_text()`.
+    version : str
+        JSON path (dot-separated) to the attribute holding the version of each object.
+    version_name : str
+        Name of the column holding the version of each row; defaults to `version`.
+    separator : str
+        Separator to use when parsing the JSON file as a CSV; see `unpack_text()`.
+    row_index : str | None
+        Name of the column holding the 0-based index of the JSON object each row was
+        unpacked from; defaults to `None`. See `unpack_text()`.
+    file_name : str | None
+        Name of the column holding the path of the file each row was read from;
+        defaults to `None`. See `unpack_text()`.
+    list_index : str | None
+        Suffix of the columns holding the 0-based position of each item within its
+        exploded list; defaults to `None`. See `unpack_text()`.
+    **kwargs
+        Keyword arguments forwarded to `scan_text()`.
+
+    Returns
+    -------
+    : polars.LazyFrame
+        Unpacked JSON content of all versions, lazy style.
+
+    Notes
+    -----
+    * Each version is unpacked given its own schema, in which renamed attributes are
+      given the name of the column they map to (`amountInclVat=amount: Float64` in an
+      older version for instance); see `unpack_routes()`.
+    * Columns are the union of the columns of all versions, in the order of the latest
+      version first; each column is cast to the datatype given by the latest version
+      describing it, and filled with `null` values for the versions not describing it.
+    * The row count per version is given by `df.group_by(version_name).len()`.
+
+    """
+    schemas = {v: parse_schema(p) for v, p in path_schemas.items()}
+    dfs = unpack_routes(
+        schemas,
+        path_data,
+        version,
+        separator,
+        row_index,
+        file_name,
+        list_index,
+        **kwargs,
+    )
+    lineage = [c for c in (row_index, file_name) if c is not None]
+
+    # list positions named after the exploded lists of each schema
+    positions = set()
+    if list_index is not None:
+        for s in schemas.values():
+            positions.update(
+                f"{p}{list_index}"
+                for p in exploded_lists(s.struct, s.widths, s.aggregations, s.separator)
+            )
+
+    # harmonized columns, the latest version first; lineage first, list positions last
+    schema: dict[str, pl.DataType] = {}
+    names: dict[str | None, set[str]] = {}
+    for v, df in reversed(dfs.items()):
+        for c, d in df.collect_schema().items():
+            schema.setdefault(c, d)
+            names.setdefault(v, set()).add(c)
+    columns = sorted(schema, key=lambda c: (c not in lineage, c in positions))
+
+    # literals added as columns, a selection of literals only would hold a single row
+    return pl.concat(
+        [
+            df.with_columns(
+                pl.lit(v, pl.String).alias(version_name),
+                *[
+                    pl.lit(None, schema[c]).alias(c)
+                    for c in columns
+                    if c not in names[v]
+                ],
+            ).select(
+                *lineage,
+                version_name,
+                *[
+                    pl.col(c).cast(schema[c], strict=False)
+                    for c in columns
+                    if c not in lineage
+                ],
+            )
+            for v, df in dfs.items()
+        ],
+    )
+
+
+def validate(
+    path_schema: "str | pathlib.Path | Buffer | SchemaParser",
+    path_data: str | pathlib.Path | Buffer,
+    separator: str = "|",
+    sample: int | None = None,
+    infer_schema_length: int | None = 100,
+    **kwargs,
+) -> pl.DataFrame:
+    """Report how well JSON data conforms to a schema, leaf by leaf, without unpacking.
+
+    Parameters
+    ----------
+    path_schema : str | pathlib.Path | Buffer | SchemaParser
+        Path to the plain text schema describing the JSON content, its content, or an
+        already parsed schema; see `parse_schema()`.
+    path_data : str | pathlib.Path | Buffer
+        Path to the JSON file (or multiple files via glob patterns), or its content;
+        see `scan_text()`.
+    separator : str
+        Separator to use when parsing the JSON file as a CSV; see `unpack_text()`.
+    sample : int | None
+        Number of lines checked, from the start of the data; defaults to `None`, in
+        which case all lines are.
+    infer_schema_length : int | None
+        Number of lines the datatype of the JSON content is inferred from, to find the
+        fields absent from the schema; defaults to `100`. `None` to use all lines (at
+        the cost of an extra pass over the data).
+    **kwargs
+        Keyword arguments forwarded to `scan_text()`.
+
+    Returns
+    -------
+    : polars.DataFrame
+        One row per leaf: JSON `path`, unpacked `column` (`null` for the fields absent
+        from the schema), `dtype`, whether the field is `in_schema`, number of
+        `values` (one per row, or per list item), and how many of these are `missing`
+        (absent or `null`), `mismatched` (present but not fitting the datatype given
+        by the schema, see `misfits()`: text or floats in integer leaves for
+        instance) or `overflowed` (numbers out of the range of an integer datatype,
+        included in the mismatches), alongside the respective rates.
+
+    Notes
+    -----
+    * Lines are decoded once, all leaves as text (see `textual()`); the values of each
+      leaf (values held by lists included) are checked via casts and counted within
+      each row by expressions, the counts summed in a single, streamed pass. Nothing
+      is exploded.
+    * Not caught: numbers (or booleans) quoted as JSON strings, as these cannot be told
+      apart once decoded as text (`"12"` fits an integer leaf); floats of integral
+      value, written as integers once decoded (`2.0` fits an integer leaf).
+    * Values of the wrong shape (objects or arrays in place of scalars, or the other
+      way around) fail the decoding of their batch; such values are located and left
+      out by `decode_leniently()` at a cost growing with their number, and counted as
+      mismatched. The leaves below an object replaced by a scalar are counted as
+      missing, and none below a list holding values of the wrong shape (the list is
+      left out as a whole); scalars in place of lists of scalars are read as lists of
+      one item (as `json_decode()` does).
+    * Lines are expected to be valid JSON objects, the leaves of any other line being
+      counted as missing; see `unpack_tolerant()` to set the malformed ones aside
+      first. The lines the fields absent from the schema are inferred from are
+      expected to agree on the shape of their values.
+
+    """
+    s = parse_schema(path_schema)
+
+    def _merge(dtype: pl.DataType, inferred: pl.DataType) -> pl.DataType:
+        """Add the fields found in the data only to a datatype."""
+        # quick work
+        if type(dtype) in (pl.Array, pl.List) and type(inferred) == pl.List:
+            if type(dtype) == pl.Array:
+                return pl.Array(_merge(dtype.inner, inferred.inner), dtype.size)
+            return pl.List(_merge(dtype.inner, inferred.inner))
+        if type(dtype) == pl.Struct and type(inferred) == pl.Struct:
+            fields = {f.name: f.dtype for f in inferred.fields}
+            return pl.Struct(
+                [
+                    pl.Field(f.name, _merge(f.dtype, fields.get(f.name)))
+                    for f in dtype.fields
+                ]
+                + [
+                    pl.Field(n, d)
+                    for n, d in fields.items()
+                    if n not in {f.name for f in dtype.fields}
+                ],
+            )
+        return dtype
+
+    df = scan_text(path_data, separator, **kwargs)
+    if sample is not None:
+        df = df.head(sample)
+
+    # fields absent from the schema, as found in the first lines
+    raw = pl.col("raw").drop_nulls()
+    if infer_schema_length is not None:
+        raw = raw.head(infer_schema_length)
+    inferred = df.select(raw).collect()["raw"].str.json_decode(infer_schema_length=None)
+    struct = _merge(s.struct, inferred.dtype)
+
+    # decoded as text, values of the wrong shape set aside
+    text = textual(struct)
+    df = df.select(
+        pl.col("raw")
+        .map_batches(
+            lambda r: decode_leniently(r, text),
+            return_dtype=pl.Struct({"decoded": text, "mismatches": pl.List(pl.String)}),
+            is_elementwise=True,
+        )
+        .alias("decoded"),
+    ).unnest("decoded")
+
+    def _count(
+        expr: pl.Expr,
+        dtype: pl.DataType,
+        names: list[str],
+        predicate: Callable[[pl.Expr], pl.Expr],
+    ) -> pl.Expr:
+        """Count the values of a leaf matching a predicate, within each row."""
+        # quick work
+        if type(dtype) in (pl.Array, pl.List):
+            if type(dtype) == pl.Array:
+                expr = expr.arr.to_list()
+            inner = _count(pl.element(), dtype.inner, names, predicate)
+            return expr.list.eval(inner).list.sum()
+        if names:
+            d = next(f.dtype for f in dtype.fields if f.name == names[0])
+            return _count(expr.struct.field(names[0]), d, names[1:], predicate)
+        return predicate(expr).cast(pl.UInt64)
+
+    # per leaf counts, reduced within each row and summed in a single streamed pass
+    leaves = list(iter_leaves(struct))
+    schema = {tuple(names) for names, _ in iter_leaves(s.struct)}
+    kinds = ("present", "missing", "mismatched", "overflowed")
+
+    exprs = []
+    for i, (names, dtype) in enumerate(leaves):
+        predicates = {"present": pl.Expr.is_not_null, "missing": pl.Expr.is_null}
+        if tuple(names) in schema:
+            predicates["mismatched"] = lambda e, d=dtype: misfits(e, d)[0]
+            predicates["overflowed"] = lambda e, d=dtype: misfits(e, d)[1]
+        exprs += [
+            _count(pl.col("decoded"), text, names, p).sum().alias(f"{i}.{k}")
+            for k, p in predicates.items()
+        ]
+        # values of the wrong shape, left out (hence null) once decoded
+        exprs.append(
+            pl.col("mismatches")
+            .list.contains(".".join(names))
+            .sum()
+            .cast(pl.UInt64)
+            .alias(f"{i}.shape"),
+        )
+
+    counts = df.select(exprs).collect(engine="streaming").row(0, named=True)
+
+    rows = []
+    for i, (names, dtype) in enumerate(leaves):
+        jp = ".".join(names)
+        in_schema = tuple(names) in schema
+        present, missing, mismatched, overflowed = (
+            counts.get(f"{i}.{k}", 0) for k in kinds
+        )
+        shape = counts[f"{i}.shape"]
+        rows.append(
+            {
+                "path": jp,
+                "column": s.json_paths.get(jp, jp) if in_schema else None,
+                "dtype": str(dtype),
+                "in_schema": in_schema,
+                "values": present + missing,
+                "missing": missing - shape,
+                "mismatched": mismatched + shape if in_schema else None,
+                "overflowed": overflowed if in_schema else None,
+            },
+        )
+
+    return pl.DataFrame(
+        rows,
+        schema={
+            "path": pl.String,
+            "column": pl.String,
+            "dtype": pl.String,
+            "in_schema": pl.Boolean,
+            "values": pl.UInt64,
+            "missing": pl.UInt64,
+            "mismatched": pl.UInt64,
+            "overflowed": pl.UInt64,
+        },
+    ).with_columns(
+        (pl.col(c) / pl.col("values")).alias(f"{c}_rate")
+        for c in ("missing", "mismatched", "overflowed")
+    )
+
+
+class ColumnStatistics:
+    """Accumulate statistics of each column over batches of unpacked content."""
+
+    def __init__(self, sketch_size: int = 1024) -> None:
+        """Instantiate the object.
+
+        Parameters
+        ----------
+        sketch_size : int
+            Number of (smallest) hashes of distinct values kept per column to estimate
+            the number of distinct values; defaults to `1024`, for a relative error in
+            the order of 3%.
+
+        Attributes
+        ----------
+        columns : dict[str, dict]
+            Dictionary of column name -> statistics pairs: `dtype`, `count` (number of
+            rows), `null_count`, `min` and `max` values (`None` for unordered or nested
+            datatypes) and `hashes` (sorted smallest hashes of the distinct values).
+        sketch_size : int
+            Number of hashes kept per column.
+
+        """
+        self.columns: dict[str, dict] = {}
+        self.sketch_size: int = sketch_size
+        self._lock = threading.Lock()
+
+    def to_frame(self) -> pl.DataFrame:
+        """Return the accumulated statistics.
+
+        Returns
+        -------
+        : polars.DataFrame
+            One row per column: `column`, `dtype`, `count`, `null_count`, `min` and
+            `max` (as strings) and `distinct` (estimated number of distinct non-null
+            values, exact below `sketch_size`).
+
+        """
+        rows = []
+        for c, stats in self.columns.items():
+            hashes = stats["hashes"]
+            if len(hashes) < self.sketch_size:
+                distinct = len(hashes)
+            else:
+                distinct = round((self.sketch_size - 1) * 2**64 / (hashes[-1] + 1))
+            rows.append(
+                {
+                    "column": c,
+                    "dtype": str(stats["dtype"]),
+                    "count": stats["count"],
+                    "null_count": stats["null_count"],
+                    "min": None if stats["min"] is None else str(stats["min"]),
+                    "max": None if stats["max"] is None else str(stats["max"]),
+                    "distinct": distinct,
+                },
+            )
+
+        return pl.DataFrame(
+            rows,
+            schema={
+                "column": pl.String,
+                "dtype": pl.String,
+                "count": pl.UInt64,
+                "null_count": pl.UInt64,
+                "min": pl.String,
+                "max": pl.String,
+                "distinct": pl.UInt64,
+            },
+        )
+
+    def update(self, df: pl.DataFrame) -> pl.DataFrame:
+        """Accumulate the statistics of a batch.
+
+        Parameters
+        ----------
+        df : polars.DataFrame
+            Batch of unpacked content.
+
+        Returns
+        -------
+        : polars.DataFrame
+            Untouched batch, such that this method can be tapped into a pipeline via
+            `LazyFrame.map_batches()`.
+
+        Notes
+        -----
+        * Statistics of the batch are computed in a single (vectorized) selection
+          before being merged with the accumulated ones; batches may be handed over by
+          several threads at once.
+        * Values of nested datatypes (lists, structs) are serialized as JSON before
+          being hashed, their native hashes not being uniformly distributed (hence
+          skewing the estimated number of distinct values).
+
+        """
+        exprs = []
+        for c, d in df.schema.items():
+            # nested values hashed via their (stable) JSON serialization
+            values = pl.col(c).drop_nulls()
+            if d.is_nested():
+                values = pl.struct(values).struct.json_encode()
+            exprs.extend(
+                [
+                    pl.col(c).null_count().alias(f"{c}.null_count"),
+                    values.hash(0)
+                    .unique()
+                    .bottom_k(self.sketch_size)
+                    .implode()
+                    .alias(f"{c}.hashes"),
+                ],
+            )
+            if d.is_numeric() or d.is_temporal() or d in (pl.Boolean, pl.String):
+                exprs.extend(
+                    [
+                        pl.col(c).min().alias(f"{c}.min"),
+                        pl.col(c).max().alias(f"{c}.max"),
+                    ],
+                )
+        batch = df.select(exprs).row(0, named=True) if exprs else {}
+
+        with self._lock:
+            for c, d in df.schema.items():
+                stats = self.columns.setdefault(
+                    c,
+                    {
+                        "dtype": d,
+                        "count": 0,
+                        "null_count": 0,
+                        "min": None,
+                        "max": None,
+                        "hashes": [],
+                    },
+                )
+                stats["count"] += df.height
+                stats["null_count"] += batch[f"{c}.null_count"]
+                for k, func in (("min", min), ("max", max)):
+                    values = [
+                        v for v in (stats[k], batch.get(f"{c}.{k}")) if v is not None
+                    ]
+                    stats[k] = func(values) if values else None
+                stats["hashes"] = sorted(
+                    set(stats["hashes"]) | set(batch[f"{c}.hashes"])
+                )[: self.sketch_size]
+
+        return df
+
+
+class PartitionWriter:
+    """Write batches of unpacked content to Hive-style partitioned directories."""
+
+    def __init__(
+        self,
+        path: str | pathlib.Path,
+        partition_by: list[str],
+        fmt: str = "parquet",
+        max_file_size: int = 134217728,
+        max_buffer_size: int | None = None,
+        **kwargs,
+    ) -> None:
+        """Instantiate the object.
+
+        Parameters
+        ----------
+        path : str | pathlib.Path
+            Path to the root directory, created if needed.
+        partition_by : list[str]
+            Names of the columns to partition the content by.
+        fmt : str
+            Output format, see `sink()`; defaults to `parquet`.
+        max_file_size : int
+            Size (estimated in memory) of the content buffered for a partition before
+            it is written as a file; defaults to 128 MiB.
+        max_buffer_size : int | None
+            Size (estimated in memory) of the content buffered for all partitions,
+            beyond which the largest buffer is written; defaults to `None`, in which
+            case four times `max_file_size` is.
+        **kwargs
+            Keyword arguments forwarded to the `write_*()` methods.
+
+        Attributes
+        ----------
+        buffers : dict[tuple, list[polars.DataFrame]]
+            Dictionary of partition key -> buffered content pairs.
+        fmt : str
+            Output format.
+        kwargs : dict
+            Keyword arguments forwarded to the `write_*()` methods.
+        max_buffer_size : int
+            Size of the content buffered for all partitions, at most.
+        max_file_size : int
+            Size of the content buffered for a partition, at most.
+        partition_by : list[str]
+            Names of the columns to partition the content by.
+        path : pathlib.Path
+            Path to the root directory.
+        paths : list[pathlib.Path]
+            Paths of the files written so far.
+        prefix : str
+            Random prefix of the names of the files written, such that several writers
+            (processes or hosts) can write to the same directories.
+        sizes : dict[tuple, float]
+            Dictionary of partition key -> size of the buffered content pairs.
+
+        """
+        self.buffers: dict[tuple, list[pl.DataFrame]] = {}
+        self.fmt: str = fmt
+        self.kwargs: dict = kwargs
+        self.max_buffer_size: int = max_buffer_size or 4 * max_file_size
+        self.max_file_size: int = max_file_size
+        self.partition_by: list[str] = partition_by
+        self.path: pathlib.Path = pathlib.Path(path)
+        self.paths: list[pathlib.Path] = []
+        self.prefix: str = uuid.uuid4().hex[:12]
+        self.sizes: dict[tuple, float] = {}
+        self._lock = threading.Lock()
+
+    def flush(self, key: tuple | None = None) -> None:
+        """Write the content buffered for a partition, or for all of them.
+
+        Parameters
+        ----------
+        key : tuple | None
+            Partition key (values of the partitioning columns); defaults to `None`, in
+            which case all partitions are written.
+
+        Notes
+        -----
+        Files are written under a hidden temporary name before being renamed, such that
+        readers never see partially written files.
+
+        """
+        for k in list(self.buffers) if key is None else [key]:
+            df = pl.concat(self.buffers.pop(k))
+            del self.sizes[k]
+
+            directory = self.path.joinpath(
+                *[
+                    f"{c}="
+                    + (
+                        "__HIVE_DEFAULT_PARTITION__"
+                        if v is None
+                        else urllib.parse.quote(str(v), safe="")
+                    )
+                    for c, v in zip(self.partition_by, k, strict=True)
+                ],
+            )
+            directory.mkdir(parents=True, exist_ok=True)
+
+            name = f"part-{self.prefix}-{len(self.paths):05d}.{self.fmt}"
+            tmp = directory / f".{name}.tmp"
+            getattr(df, f"write_{self.fmt}")(tmp, **self.kwargs)
+            tmp.replace(directory / name)
+            self.paths.append(directory / name)
+
+    def write(self, df: pl.DataFrame) -> pl.DataFrame:
+        """Buffer a batch, writing the partitions for which enough content is.
+
+        Parameters
+        ----------
+        df : polars.DataFrame
+            Batch of unpacked content, partitioning columns included.
+
+        Returns
+        -------
+        : polars.DataFrame
+            Empty batch, such that this method can be tapped into a pipeline via
+            `LazyFrame.map_batches()` without anything being held downstream.
+
+        Notes
+        -----
+        * Partitioning columns are dropped from the content, their values being given
+          by the path of the directories; batches may be handed over by several
+          threads at once.
+        * The rows of each partition are sliced given their average (estimated) size,
+          such that no file holds more than `max_file_size` (unless a single row does)
+          whatever the size of the batches.
+
+        """
+        with self._lock:
+            for key, group in df.group_by(self.partition_by, maintain_order=True):
+                group = group.drop(self.partition_by)
+                row_size = group.estimated_size() / max(group.height, 1)
+
+                # sliced to what is left of the file, a single row at least
+                while group.height:
+                    left = self.max_file_size - self.sizes.get(key, 0)
+                    n = max(int(left // row_size) if row_size else group.height, 1)
+                    self.buffers.setdefault(key, []).append(group.head(n))
+                    self.sizes[key] = self.sizes.get(key, 0) + n * row_size
+                    group = group.slice(n)
+                    if group.height or self.sizes[key] >= self.max_file_size:
+                        self.flush(key)
+
+            # bounded memory: largest partitions written first
+            while sum(self.sizes.values()) > self.max_buffer_size:
+                self.flush(max(self.sizes, key=self.sizes.get))
+
+        return df.clear()
+
+
+class RecordFlattener:
+    """Flatten parsed JSON objects into rows, as `UnpackFrame.unpack()` would."""
+
+    def __init__(self, s: "SchemaParser", separator: str = ".") -> None:
+        """Instantiate the object, compiling the schema into nested functions.
+
+        Parameters
+        ----------
+        s : SchemaParser
+            Parsed schema.
+        separator : str
+            JSON path separator to use when building the full JSON path; defaults to a
+            dot (`.`).
+
+        Attributes
+        ----------
+        aggregations : dict[str, dict[str, str]]
+            Dictionary of JSON path -> aggregations pairs, for the lists of which the
+            values are aggregated; see `SchemaParser.aggregations`.
+        conform_record : collections.abc.Callable[[object], object]
+            Function conforming a single record to the schema; see `conformer()`.
+        flatten_record : collections.abc.Callable[[dict | None], list[tuple]]
+            Function flattening a single record into rows.
+        schema : dict[str, polars.DataType]
+            Dictionary of column name -> datatype pairs of the unpacked content.
+        separator : str
+            JSON path separator to use when building the full JSON path.
+        widths : dict[str, int]
+            Dictionary of JSON path -> number of items pairs, for the lists of which
+            the first items are extracted as columns; see `SchemaParser.widths`.
+
+        """
+        self.aggregations: dict[str, dict[str, str]] = s.aggregations
+        self.separator: str = separator
+        self.widths: dict[str, int] = s.widths
+
+        self.conform_record: Callable[[object], object] = conformer(s.struct)
+
+        columns, dtypes, self.flatten_record = self.compile(s.struct)
+        self.schema: dict[str, pl.DataType] = {
+            s.json_paths.get(c, c): d for c, d in zip(columns, dtypes, strict=True)
+        }
+
+    def compile(
+        self,
+        dtype: pl.DataType,
+        column: str = "",
+    ) -> tuple[list[str], list[pl.DataType], Callable[[object], list[tuple]]]:
+        """Compile a datatype into a function flattening values of said datatype.
+
+        Parameters
+        ----------
+        dtype : polars.DataType
+            Datatype of the current object.
+        column : str
+            Name of the column the current object would be unpacked as.
+
+        Returns
+        -------
+        : list[str]
+            Names of the leaf columns, before renaming.
+        : list[polars.DataType]
+            Datatypes of the leaf columns.
+        : collections.abc.Callable[[object], list[tuple]]
+            Function returning the rows (tuples of leaf values) of a value.
+
+        Notes
+        -----
+        Column names and row multiplication mirror `UnpackFrame.unpack()`: each list
+        item yields its own rows, empty or missing lists yield a single row of `null`
+        values, and sibling lists multiply each other's rows. Values not fitting the
+        schema are handled as `unpack_records()` does, see `conformer()`.
+
+        """
+        # lists: rows of each item, one after the other
+        if type(dtype) in (pl.Array, pl.List):
+            if type(dtype.inner) in (pl.Array, pl.List):
+                column = f"{column}{self.separator}{column}"
+            columns, dtypes, inner = self.compile(dtype.inner, column)
+
+            def _list(value: list | None) -> list[tuple]:
+                # quick work
+                if not value or not isinstance(value, list):
+                    return inner(None)
+                return [row for item in value for row in inner(item)]
+
+            return columns, dtypes, _list
+
+        # structs: product of the rows of each field
+        if type(dtype) == pl.Struct:
+            columns, dtypes, fields = [], [], []
+            for f in dtype.fields:
+                jp = f"{column}{self.separator}{f.name}".lstrip(self.separator)
+                if jp in self.widths:
+                    c, d, func = self.compile_items(f, column, self.widths[jp])
+                elif jp in self.aggregations:
+                    c, d, func = self.compile_aggregations(f, jp, self.aggregations[jp])
+                else:
+                    c, d, func = self.compile(f.dtype, jp)
+                columns.extend(c)
+                dtypes.extend(d)
+                fields.append((f.name, func))
+
+            def _struct(value: dict | None) -> list[tuple]:
+                # quick work
+                if not isinstance(value, dict):
+                    value = {}
+                rows = [()]
+                for name, func in fields:
+                    rows_ = func(value.get(name))
+                    if len(rows_) == 1:
+                        rows = [row + rows_[0] for row in rows]
+                    else:
+                        rows = [row + row_ for row in rows for row_ in rows_]
+                return rows
+
+            return columns, dtypes, _struct
+
+        # leaves, values not fitting the datatype conformed as json decoding would
+        conform = conformer(dtype)
+
+        return [column], [dtype], lambda value: [(conform(value),)]
+
+    def compile_aggregations(
+        self,
+        field: pl.Field,
+        column: str,
+        aggregations: dict[str, str],
+    ) -> tuple[list[str], list[pl.DataType], Callable[[object], list[tuple]]]:
+        """Compile a list of which the values are aggregated.
+
+        Parameters
+        ----------
+        field : polars.Field
+            List field.
+        column : str
+            Name of the column the list would be unpacked as.
+        aggregations : dict[str, str]
+            Dictionary of JSON path -> function pairs of the aggregated values.
+
+        Returns
+        -------
+        : list[str]
+            Names of the aggregated columns, before renaming.
+        : list[polars.DataType]
+            Datatypes of the aggregated columns.
+        : collections.abc.Callable[[object], list[tuple]]
+            Function returning the single row of aggregated values of a list.
+
+        Notes
+        -----
+        As done by `UnpackFrame.aggregate()`, `null` values are skipped; the sum of no
+        values is `0` and their count `0`, other aggregations of no values are `null`.
+
+        """
+        functions = {
+            "count": len,
+            "max": lambda v: max(v, default=None),
+            "mean": lambda v: sum(v) / len(v) if v else None,
+            "min": lambda v: min(v, default=None),
+            "sum": sum,
+        }
+
+        columns, dtypes, funcs = [], [], []
+        for jp, function in aggregations.items():
+            names = jp[len(column) + len(self.separator) :].split(self.separator)
+            dtype, values = self.compile_values(field.dtype, names)
+            columns.append(jp)
+            dtypes.append(aggregated_dtype(function, dtype))
+            funcs.append((function, functions[function], values))
+
+        def _aggregations(value: list | None) -> list[tuple]:
+            # quick work
+            if not isinstance(value, list):
+                return [tuple(0 if f == "count" else None for f, _, _ in funcs)]
+            return [
+                tuple(
+                    func([v for v in values(value) if v is not None])
+                    for _, func, values in funcs
+                ),
+            ]
+
+        return columns, dtypes, _aggregations
+
+    def compile_values(
+        self,
+        dtype: pl.DataType,
+        names: list[str],
+    ) -> tuple[pl.DataType, Callable[[object], list]]:
+        """Compile a function reaching the values of a nested object.
+
+        Parameters
+        ----------
+        dtype : polars.DataType
+            Datatype of the current object.
+        names : list[str]
+            Names of the fields leading to the values.
+
+        Returns
+        -------
+        : polars.DataType
+            Datatype of the values.
+        : collections.abc.Callable[[object], list]
+            Function returning the values held by an object, lists flattened.
+
+        """
+        # lists: values of each item, one after the other
+        if type(dtype) in (pl.Array, pl.List):
+            d, inner = self.compile_values(dtype.inner, names)
+
+            def _list(value: list | None) -> list:
+                # quick work
+                if not isinstance(value, list):
+                    return []
+                return [v for item in value for v in inner(item)]
+
+            return d, _list
+
+        # structs: values of the next field
+        if names:
+            name = names[0]
+            d, inner = self.compile_values(
+                next(f.dtype for f in dtype.fields if f.name == name),
+                names[1:],
+            )
 
-    Returns
-    -------
-    : polars.LazyFrame
-        Unpacked JSON content, lazy style.
+            def _struct(value: dict | None) -> list:
+                # quick work
+                return inner(value.get(name) if isinstance(value, dict) else None)
 
-    Notes
-    -----
-    * Fields described in the schema but absent from the JSON source will be added as
-      `null` values.
-    * Fields present in the JSON source but absent from the schema will be dropped.
+            return d, _struct
 
-    """
-    s = parse_schema(path_schema)
+        # values
+        conform = conformer(dtype)
 
-    # read as json and unpack the object
-    df = pl.scan_ndjson(path_data).json.unpack(s.struct)
+        return dtype, lambda value: [conform(value)]
 
-    # add missing columns
-    df = df.with_columns(
-        [
-            pl.lit(None).cast(d).alias(p)
-            for p, d in zip(s.json_paths.keys(), s.dtypes, strict=True)
-            if p not in df.columns
-        ],
-    )
+    def compile_items(
+        self,
+        field: pl.Field,
+        column: str,
+        width: int,
+    ) -> tuple[list[str], list[pl.DataType], Callable[[object], list[tuple]]]:
+        """Compile a list of which the first items are extracted as columns.
 
-    # rename fields (otherwise renamed to their full json paths)
-    df = df.rename(s.json_paths)
+        Parameters
+        ----------
+        field : polars.Field
+            List field.
+        column : str
+            Name of the column the parent object would be unpacked as.
+        width : int
+            Number of items to extract.
 
-    # final selection (drop extra/unwanted columns)
-    return df.select(s.columns)
+        Returns
+        -------
+        : list[str]
+            Names of the leaf columns, before renaming.
+        : list[polars.DataType]
+            Datatypes of the leaf columns.
+        : collections.abc.Callable[[object], list[tuple]]
+            Function returning the rows (tuples of leaf values) of a list.
 
+        Notes
+        -----
+        As done by `UnpackFrame.extract()`, the items are handled as the fields of a
+        struct, siblings of the list suffixed by their 0-based position.
 
-def unpack_text(
-    path_schema: str,
-    path_data: str,
-    separator: str = "|",
-    **kwargs,
-) -> pl.LazyFrame:
-    r"""Lazily scan and unpack JSON data read as plain text, given a `Polars` schema.
+        """
+        names = [f"{field.name}_{i}" for i in range(width)]
+        columns, dtypes, items = self.compile(
+            pl.Struct([pl.Field(n, field.dtype.inner) for n in names]),
+            column,
+        )
 
-    Parameters
-    ----------
-    path_schema : str
-        Path to the plain text schema describing the JSON content.
-    path_data : str
-        Path to the JSON file (or multiple files via glob patterns).
-    separator : str
-        Separator to use when parsing the JSON file as a CSV; defaults to `|` but `#` or
-        `$` could be good candidates too (as are UTF-8 characters?). Note this separator
-        should \*NOT\* be present in the file at all (`,` or `:` are thus out of
-        question given the JSON context).
+        def _items(value: list | None) -> list[tuple]:
+            # quick work
+            if not isinstance(value, list):
+                return items(None)
+            return items(dict(zip(names, value, strict=False)))
 
-    Returns
-    -------
-    : polars.LazyFrame
-        Unpacked JSON content, lazy style.
+        return columns, dtypes, _items
 
-    Notes
-    -----
-    This is mostly a test, to verify the output would be identical, as this unpacking
-    use case could be applied on a CSV column containing some JSON content for instance.
-    The preferred way for native JSON content remains the `unpack_ndjson()` function
-    defined in this same script.
+    def flatten(self, records: list[dict]) -> pl.DataFrame:
+        """Flatten parsed JSON objects into an unpacked `DataFrame`.
 
-    In the current `Polars` implementation this function is however better suited for
-    the use case: the provided schema is always dominant, regardless of the content of
-    the JSON file. We do not need to add or remove missing or supplementary columns,
-    everything is taken care of by the `json_extract()` method.
+        Parameters
+        ----------
+        records : list[dict]
+            Parsed JSON objects, one per row.
 
-    """
-    s = parse_schema(path_schema)
+        Returns
+        -------
+        : polars.DataFrame
+            Unpacked JSON content, identical to the output of `UnpackFrame.unpack()`
+            (and renamed).
 
-    # read as plain text
-    # unpack object and rename fields (otherwise renamed to their full json paths)
-    # no other transformations are necessary as the schema is already dominant here
-    return (
-        pl.scan_csv(
-            path_data,
-            has_header=False,
-            new_columns=["raw"],
-            separator=separator,
-            **kwargs,
+        """
+        return pl.DataFrame(
+            [row for r in records for row in self.flatten_record(r)],
+            schema=self.schema,
+            orient="row",
+            strict=False,
         )
-        .select(pl.col("raw").str.json_decode(s.struct))
-        .unnest("raw")
-        .json.unpack(s.struct)
-        .rename(s.json_paths)
-    )
 
 
 class SchemaParser:
@@ -343,10 +3442,16 @@ class SchemaParser:
 
         Attributes
         ----------
+        aggregations : dict[str, dict[str, str]]
+            Dictionary of JSON path -> aggregations pairs, for the lists of which the
+            values are aggregated instead of being exploded; aggregations are given as
+            a dictionary of JSON path (of the aggregated values) -> function pairs.
         columns : list[str]
             Expected list of columns in the final `Polars` `DataFrame` or `LazyFrame`.
         dtypes : list[polars.DataType]
             Expected list of datatypes in the final `Polars` `DataFrame` or `LazyFrame`.
+        flattener : RecordFlattener | None
+            Schema compiled to flatten parsed JSON objects, once needed.
         json_paths : dit[str, str]
             Dictionary of JSON path -> column name pairs.
         separator : str
@@ -355,17 +3460,123 @@ class SchemaParser:
             JSON schema described in plain text, using `Polars` datatypes.
         struct : polars.Struct
             Plain text schema parsed as a `Polars` `Struct`.
+        widths : dict[str, int]
+            Dictionary of JSON path -> number of items pairs, for the lists of which
+            the first items are extracted as columns instead of being exploded.
 
         """
         self.source = source
         self.separator = separator
 
+        self.aggregations: dict[str, dict[str, str]] = {}
         self.columns: list[str] = []
         self.dtypes: list[pl.DataType] = []
+        self.flattener: RecordFlattener | None = None
         self.json_paths: dict[str, str] = {}
         self.struct: pl.Struct | None = None
+        self.widths: dict[str, int] = {}
+
+    def collect_aggregations(self, path: str) -> None:
+        """Register a list as aggregated if all values it holds are aggregated.
+
+        Parameters
+        ----------
+        path : str
+            JSON path to the list being closed.
+
+        Raises
+        ------
+        : SchemaParsingError
+            When aggregated values share a list with non-aggregated ones (outside of a
+            nested, fully aggregated list).
+
+        """
+        prefix = f"{path}{self.separator}"
+        pending = {
+            p: f for p, f in self.record["aggregates"].items() if p.startswith(prefix)
+        }
+
+        if not pending:
+            return
+
+        # all aggregated: reduced within this list, instead of within the nested ones
+        if len(pending) == sum(p.startswith(prefix) for p in self.json_paths):
+            self.aggregations = {
+                p: a for p, a in self.aggregations.items() if not p.startswith(prefix)
+            }
+            self.aggregations[path] = pending
+            return
+
+        # otherwise each aggregated value should belong to a nested, aggregated list
+        for p in pending:
+            if not any(p.startswith(f"{a}{self.separator}") for a in self.aggregations):
+                raise SchemaParsingError(self.format_error(self.json_paths[p]))
+
+    def current_path(self) -> str:
+        """Build the JSON path of the nested object currently being parsed.
+
+        Returns
+        -------
+        : str
+            JSON path, without any list marker.
+
+        """
+        return (
+            self.separator.join(self.record["path"])
+            .replace("[]", "")
+            .replace(self.separator * 2, self.separator)
+            .rstrip(self.separator)
+        )
+
+    def expand_columns(self, path: str, name: str, dtype: pl.DataType) -> None:
+        """Register a column per item extracted from a list, instead of a single one.
+
+        Parameters
+        ----------
+        path : str
+            JSON path to the list.
+        name : str
+            Name of the list.
+        dtype : polars.DataType
+            Datatype of the items of the list.
+
+        Raises
+        ------
+        : DuplicateColumnError
+            When a column is encountered more than once in the schema.
 
-    def format_error(self, unparsed: str) -> str:
+        """
+        width = self.widths[path]
+        prefix = f"{path}{self.separator}"
+
+        # columns registered for the items: the last ones, or none if scalar items
+        entries = list(zip(self.json_paths.items(), self.dtypes, strict=True))
+        start = next(
+            (i for i, ((p, _), _) in enumerate(entries) if p.startswith(prefix)),
+            len(entries),
+        )
+        items = entries[start:] or [((path, name), dtype)]
+
+        # one set of columns per item
+        expanded = []
+        for i in range(width):
+            for (p, c), d in items:
+                p_ = f"{path}_{i}{p[len(path) :]}"
+                expanded.append(((p_, f"{c}_{i}"), d))
+
+        for (_, c), _ in entries[start:]:
+            self.record["columns"].discard(c)
+        for (_, c), _ in expanded:
+            if c in self.record["columns"]:
+                raise DuplicateColumnError(self.format_error(c))
+            self.record["columns"].add(c)
+
+        entries = entries[:start] + expanded
+        self.json_paths = {p: c for (p, c), _ in entries}
+        self.columns = [c for (_, c), _ in entries]
+        self.dtypes = [d for _, d in entries]
+
+    def format_error(self, unparsed: str, context: int = 5) -> str:
         """Format the message printed in the exception when an issue occurs.
 
         ```text
@@ -380,6 +3591,9 @@ class SchemaParser:
         ----------
         unparsed : str
             Unexpected string that raised the exception.
+        context : int
+            Number of lines preceding the faulty one to include in the message; defaults
+            to `5`.
 
         Returns
         -------
@@ -390,44 +3604,116 @@ class SchemaParser:
         -----
         * In most cases this method will look for the first occurrence of the string
           that raised the exception; and it might not be the _actual_ line that did so.
+        * Only a window of lines around the issue is printed, such that the cost of
+          formatting the message does not depend on the length of the schema.
         * This method is absolutely useless and could be removed.
 
         """
         # start/end of the issue
         issue_start = self.source.index(unparsed)
         issue_end = (
-            issue_start + m.start()
-            if (m := re.search(r"[()\[\]{}<>\n]", self.source[issue_start:]))
-            is not None
+            m.start()
+            if (m := PATTERN_ISSUE_END.search(self.source, issue_start)) is not None
             else len(self.source)
         )
 
         # start/end of the line
-        line_start = (
-            issue_start - self.source[:issue_start][::-1].index("\n") + 1
-            if issue_start and "\n" in self.source[:issue_start]
-            else 1
-        )
+        line_start = self.source.rfind("\n", 0, issue_start) + 1
         line_end = (
-            issue_end + self.source[issue_end:].index("\n")
-            if "\n" in self.source[issue_end:]
-            else len(self.source)
+            i if (i := self.source.find("\n", issue_end)) >= 0 else len(self.source)
         )
 
         # line number at which the issue happens
-        line_number = self.source[:issue_start].count("\n") + 1
+        line_number = self.source.count("\n", 0, issue_start) + 1
+
+        # start of the first line to print
+        first_line_number = max(1, line_number - context)
+        first_line_start = line_start
+        for _ in range(line_number - first_line_number):
+            first_line_start = self.source.rfind("\n", 0, first_line_start - 1) + 1
 
         # captain obvious
         msg = f"Tripped on line {line_number}\n\n"
-        for i, line in enumerate(self.source[:line_end].split("\n")):
-            msg += f"   {i + 1:-3d} │ {line}\n"
+        for i, line in enumerate(
+            self.source[first_line_start:line_end].split("\n"),
+            start=first_line_number,
+        ):
+            msg += f"   {i:-3d} │ {line}\n"
         msg += "     ? │ "
-        msg += " " * (issue_start - line_start + 1)
+        msg += " " * (issue_start - line_start)
         msg += "^" * (issue_end - issue_start)
         msg += "\n"
 
         return msg
 
+    def parse_aggregated_attr_dtype(
+        self,
+        struct: pl.Struct,
+        name: str,
+        renamed_to: str | None,
+        function: str,
+        dtype: str,
+    ) -> pl.Struct:
+        """Parse and register an attribute aggregated over the list(s) it belongs to.
+
+        Parameters
+        ----------
+        struct : polars.Struct
+            Current state of the `Polars` `Struct`.
+        name : str
+            Attribute name.
+        renamed_to : str | None
+            New name for the attribute, if any.
+        function : str
+            Aggregation function, one of `count`, `max`, `mean`, `min` or `sum`.
+        dtype : str
+            Expected `Polars` datatype for this attribute.
+
+        Returns
+        -------
+        : polars.Struct
+            Updated `Polars` `Struct` including the latest parsed addition.
+
+        Raises
+        ------
+        : DuplicateColumnError
+            When a column is encountered more than once in the schema.
+        : SchemaParsingError
+            When the attribute is nested, or does not belong to any list.
+        : UnknownDataTypeError
+            When an unknown/unsupported datatype is encountered.
+
+        """
+        # sanity checks
+        if dtype.lower() not in POLARS_DATATYPES:
+            raise UnknownDataTypeError(self.format_error(dtype))
+        if dtype.lower() in ("array", "list", "struct") or all(
+            d != "list" for _, d in self.record["parents"]
+        ):
+            raise SchemaParsingError(self.format_error(function))
+
+        dtype = POLARS_DATATYPES[dtype.lower()]
+        function = function.lower()
+        column = renamed_to or name
+
+        # add to the lists, with the datatype of the aggregated value
+        if column in self.record["columns"]:
+            raise DuplicateColumnError(self.format_error(column))
+
+        self.record["columns"].add(column)
+        self.columns.append(column)
+        self.dtypes.append(aggregated_dtype(function, dtype))
+
+        # json path and associated column name
+        path = f"{self.current_path()}{self.separator}{name}".lstrip(self.separator)
+        self.json_paths[path] = column
+        self.record["aggregates"][path] = function
+
+        # the values are decoded as any other attribute
+        self.record["structs"][-1].append(pl.Field(name, dtype))
+
+        return struct
+
     def parse_renamed_attr_dtype(
         self,
         struct: pl.Struct,
@@ -470,17 +3756,13 @@ class SchemaParser:
 
         # add to the lists
         if dtype not in ("array", "list", "struct"):
-            if renamed_to not in self.columns:
+            if renamed_to not in self.record["columns"]:
+                self.record["columns"].add(renamed_to)
                 self.columns.append(renamed_to)
                 self.dtypes.append(POLARS_DATATYPES[dtype])
 
                 # json path and associated column name
-                path = (
-                    self.separator.join(self.record["path"])
-                    .replace("[]", "")
-                    .replace(self.separator * 2, self.separator)
-                    .rstrip(self.separator)
-                )
+                path = self.current_path()
                 self.json_paths[
                     f"{path}{self.separator}{name}".lstrip(self.separator)
                 ] = renamed_to
@@ -529,22 +3811,19 @@ class SchemaParser:
         if dtype.lower() not in POLARS_DATATYPES:
             raise UnknownDataTypeError(self.format_error(dtype))
 
-        dtype = dtype.lower()
+        # arrays are parsed (and decoded) as lists
+        dtype = dtype.lower().replace("array", "list")
         field = pl.Field(name, POLARS_DATATYPES[dtype])
 
         # add to the lists
-        if dtype not in ("array", "list", "struct"):
-            if name not in self.columns:
+        if dtype not in ("list", "struct"):
+            if name not in self.record["columns"]:
+                self.record["columns"].add(name)
                 self.columns.append(name)
                 self.dtypes.append(POLARS_DATATYPES[dtype])
 
                 # json path and associated column name
-                path = (
-                    self.separator.join(self.record["path"])
-                    .replace("[]", "")
-                    .replace(self.separator * 2, self.separator)
-                    .rstrip(self.separator)
-                )
+                path = self.current_path()
                 self.json_paths[
                     f"{path}{self.separator}{name}".lstrip(self.separator)
                 ] = name
@@ -629,6 +3908,7 @@ class SchemaParser:
 
         """
         name, dtype = self.record["parents"].pop()
+        path = self.current_path()
 
         # remove a parent from the current path
         if self.record["path"]:
@@ -642,6 +3922,19 @@ class SchemaParser:
             # list within struct or list within list
             field = pl.Field(name, pl.List(d)) if name else pl.List(d)
 
+            # first items extracted as columns
+            if name and path in self.widths:
+                if any(
+                    p.startswith(f"{path}{self.separator}")
+                    for p in self.record["aggregates"]
+                ):
+                    raise SchemaParsingError(self.format_error(name))
+                self.expand_columns(path, name, d)
+
+            # or values aggregated instead of exploded
+            elif name:
+                self.collect_aggregations(path)
+
         # struct
         else:
             field = pl.Field(name, pl.Struct(self.record["structs"].pop()))
@@ -657,6 +3950,31 @@ class SchemaParser:
 
         return struct
 
+    def parse_width(self, width: str) -> None:
+        """Parse and register the number of items to extract from a list as columns.
+
+        Parameters
+        ----------
+        width : str
+            Number of items, found after the datatype of the items of a named list.
+
+        Raises
+        ------
+        : SchemaParsingError
+            When the number of items is not at the end of a named list, or the items
+            are lists themselves.
+
+        """
+        if (
+            not self.record["parents"]
+            or self.record["parents"][-1] != (self.record["path"][-1], "list")
+            or not self.record["lists"]
+            or isinstance(self.record["lists"][-1], pl.List)
+        ):
+            raise SchemaParsingError(self.format_error(width))
+
+        self.widths[self.current_path()] = int(width)
+
     def to_struct(self) -> pl.Struct:
         r"""Parse the plain text schema into a `Polars` `Struct`.
 
@@ -686,6 +4004,11 @@ class SchemaParser:
 
         The following patterns (recognised via regular expressions) are supported:
 
+        * `([A-Za-z0-9_]+)\s*(?:=\s*([A-Za-z0-9_]+)\s*)?:\s*(count|max|mean|min|sum)`
+          followed by a datatype between delimiters for an attribute (optionally
+          renamed) aggregated over the list(s) it belongs to; for instance
+          `amount=total: Sum(Float64)`. Lists holding aggregated attributes only are
+          not exploded, their values being aggregated per row of the parent object.
         * `([A-Za-z0-9_]+)\s*=\s*([A-Za-z0-9_]+)\s*:\s*([A-Za-z0-9]+)` for an attribute
           name, an equal sign (`=`), a new name for the attribute, a column (`:`) and a
           datatype.
@@ -719,39 +4042,51 @@ class SchemaParser:
         struct: list[pl.Datatype] = []
 
         # bookkeeping
-        self.record: dict = {"lists": [], "parents": [], "path": [], "structs": []}
-
-        # continue until everything is parsed
-        while s:
-            if (
-                m := re.match(
-                    r"([A-Za-z0-9_]+)\s*=\s*([A-Za-z0-9_]+)\s*:\s*([A-Za-z0-9]+)",
-                    s,
+        self.record: dict = {
+            "aggregates": {},
+            "columns": set(),
+            "lists": [],
+            "parents": [],
+            "path": [],
+            "structs": [],
+        }
+
+        # continue until everything is parsed; the source is never sliced nor copied,
+        # only a cursor is moved along it to keep parsing linear in the schema length
+        pos = 0
+        while pos < len(s):
+            if (m := PATTERN_AGGREGATED_ATTR_DTYPE.match(s, pos)) is not None:
+                struct = self.parse_aggregated_attr_dtype(
+                    struct,
+                    m.group(1),
+                    m.group(2),
+                    m.group(3),
+                    m.group(4),
                 )
-            ) is not None:
+            elif (m := PATTERN_RENAMED_ATTR_DTYPE.match(s, pos)) is not None:
                 struct = self.parse_renamed_attr_dtype(
                     struct,
                     m.group(1),
                     m.group(2),
                     m.group(3),
                 )
-            elif (
-                m := re.match(r"([A-Za-z0-9_]+)\s*:\s*([A-Za-z0-9]+)", s)
-            ) is not None:
+            elif (m := PATTERN_ATTR_DTYPE.match(s, pos)) is not None:
                 struct = self.parse_attr_dtype(struct, m.group(1), m.group(2))
-            elif (m := re.match(r"([A-Za-z0-9]+)", s)) is not None:
+            elif (m := PATTERN_WIDTH.match(s, pos)) is not None:
+                self.parse_width(m.group(1))
+            elif (m := PATTERN_LONE_DTYPE.match(s, pos)) is not None:
                 struct = self.parse_lone_dtype(struct, m.group(1))
-            elif (m := re.match(r"[(\[{<]", s)) is not None:
+            elif (m := PATTERN_OPENING_DELIMITER.match(s, pos)) is not None:
                 self.parse_opening_delimiter()
-            elif (m := re.match(r"[)\]}>]", s)) is not None:
+            elif (m := PATTERN_CLOSING_DELIMITER.match(s, pos)) is not None:
                 struct = self.parse_closing_delimiter(struct)
-            elif (m := re.match(r"[,\n\s]+", s)) is not None:
+            elif (m := PATTERN_SEPARATOR.match(s, pos)) is not None:
                 pass
             else:
-                raise SchemaParsingError(self.format_error(s))
+                raise SchemaParsingError(self.format_error(s[pos:]))
 
-            # clean up the current match
-            s = s.replace(m.group(0), "", 1)
+            # move on past the current match
+            pos = m.end()
 
         # clean up in case someone checks the object attributes
         delattr(self, "record")
@@ -766,6 +4101,14 @@ class DuplicateColumnError(Exception):
     """When a column is encountered more than once in the schema."""
 
 
+class ErrorRateExceededError(Exception):
+    """When the share of malformed lines exceeds the tolerated rate."""
+
+
+class LineageError(Exception):
+    """When lineage columns required to get back to the JSON objects are missing."""
+
+
 class PathRenamingError(Exception):
     """When a parent (in a JSON path sense) is being renamed."""
 
@@ -778,6 +4121,10 @@ class UnknownDataTypeError(Exception):
     """When an unknown/unsupported datatype is encountered."""
 
 
+class UnknownFormatError(Exception):
+    """When an unknown/unsupported file format is encountered."""
+
+
 @pl.api.register_dataframe_namespace("json")
 @pl.api.register_lazyframe_namespace("json")
 class UnpackFrame:
@@ -797,11 +4144,133 @@ class UnpackFrame:
         self._df: pl.DataFrame | pl.LazyFrame = df
         self.separator: str = separator
 
+    def aggregate(
+        self,
+        column: str,
+        aggregations: dict[str, str],
+        dtype: pl.DataType | None = None,
+    ) -> pl.DataFrame | pl.LazyFrame:
+        """Aggregate the values held by a list column, in place of the list.
+
+        Parameters
+        ----------
+        column : str
+            Name of the list column.
+        aggregations : dict[str, str]
+            Dictionary of JSON path -> function pairs of the aggregated values; see
+            `SchemaParser.aggregations`.
+        dtype : polars.DataType | None
+            Actual datatype of the list column; defaults to `None`, in which case it is
+            resolved from the schema of the `DataFrame` (or `LazyFrame`).
+
+        Returns
+        -------
+        : polars.DataFrame | polars.LazyFrame
+            Updated `Polars` `DataFrame` (or `LazyFrame`) object, the list replaced by
+            the aggregated values named after their full JSON paths.
+
+        Notes
+        -----
+        Values held by nested lists are flattened within each row, and the aggregation
+        functions skip `null` values. Values absent from the actual datatype of the
+        column (when read via `scan_ndjson()` for instance) are skipped, to be added as
+        `null` values later on.
+
+        """
+        if dtype is None:
+            dtype = self._df.collect_schema()[column]
+
+        exprs = []
+        for jp, function in aggregations.items():
+            names = jp[len(column) + len(self.separator) :].split(self.separator)
+            if (v := reach_values(pl.col(column), dtype, names)) is not None:
+                exprs.append(AGGREGATIONS[function](v[0], v[1]).alias(jp))
+
+        if not exprs:
+            return self._df.drop(column)
+
+        # packed in a struct replacing the list, to be unnested at the same position
+        return self._df.with_columns(pl.struct(exprs).alias(column)).unnest(column)
+
+    def explode(
+        self,
+        column: str,
+        dtype: pl.DataType,
+        list_index: str | None = None,
+    ) -> pl.DataFrame | pl.LazyFrame:
+        """Explode a list column, alongside the position of each of its items.
+
+        Parameters
+        ----------
+        column : str
+            Name of the column to explode.
+        dtype : polars.DataType
+            Datatype of the column (`polars.Array` or `polars.List`).
+        list_index : str | None
+            Suffix of the column holding the 0-based position of each item, if any;
+            defaults to `None`.
+
+        Returns
+        -------
+        : polars.DataFrame | polars.LazyFrame
+            Updated [exploded] `Polars` `DataFrame` (or `LazyFrame`) object.
+
+        """
+        if list_index is None:
+            return self._df.explode(column)
+
+        # positions are generated alongside the items, before exploding both at once
+        index = f"{column}{list_index}"
+        items = pl.col(column)
+        if type(dtype) == pl.Array:
+            items = items.arr.to_list()
+
+        return self._df.with_columns(
+            items,
+            pl.int_ranges(0, items.list.len(), dtype=pl.UInt32).alias(index),
+        ).explode(column, index)
+
+    def extract(
+        self,
+        column: str,
+        dtype: pl.DataType,
+        width: int,
+    ) -> pl.DataFrame | pl.LazyFrame:
+        """Extract the first items of a list column as columns, in place of the list.
+
+        Parameters
+        ----------
+        column : str
+            Name of the list column.
+        dtype : polars.DataType
+            Datatype of the column (`polars.Array` or `polars.List`).
+        width : int
+            Number of items to extract; missing items are `null` values.
+
+        Returns
+        -------
+        : polars.DataFrame | polars.LazyFrame
+            Updated `Polars` `DataFrame` (or `LazyFrame`) object, the list replaced by
+            columns named after it and suffixed by the 0-based position of the items.
+
+        """
+        items = pl.col(column).arr if type(dtype) == pl.Array else pl.col(column).list
+
+        # packed in a struct replacing the list, to be unnested at the same position
+        return self._df.with_columns(
+            pl.struct(items.get(i).alias(f"{column}_{i}") for i in range(width)).alias(
+                column,
+            ),
+        ).unnest(column)
+
     def unpack(
         self,
         dtype: pl.DataType,
         json_path: str = "",
         column: str | None = None,
+        list_index: str | None = None,
+        widths: dict[str, int] | None = None,
+        aggregations: dict[str, dict[str, str]] | None = None,
     ) -> pl.DataFrame | pl.LazyFrame:
         """Unpack JSON content into a `DataFrame` (or `LazyFrame`) given a schema.
 
@@ -816,6 +4285,18 @@ class UnpackFrame:
             Column to apply the unpacking on; defaults to `None`. This is used when the
             current object has children but no field name; this is the case for
             convoluted `polars.List` within a `polars.List` for instance.
+        list_index : str | None
+            Suffix of the columns holding the 0-based position of each item within its
+            exploded list, named after the full JSON path of the list; defaults to
+            `None`, in which case no such columns are added.
+        widths : dict[str, int] | None
+            Dictionary of JSON path -> number of items pairs, for the lists of which the
+            first items are extracted as columns (suffixed by their 0-based position)
+            instead of being exploded; see `SchemaParser.widths`. Defaults to `None`.
+        aggregations : dict[str, dict[str, str]] | None
+            Dictionary of JSON path -> aggregations pairs, for the lists of which the
+            values are aggregated instead of being exploded; see
+            `SchemaParser.aggregations`. Defaults to `None`.
 
         Returns
         -------
@@ -826,45 +4307,166 @@ class UnpackFrame:
         -----
         * The `polars.Array` is considered the [obsolete] ancestor of `polars.List` and
           expected to behave identically.
+        * Lists listed in `widths` are not exploded: their first items are extracted
+          as columns instead, unpacked as any other field would be.
+        * Lists listed in `aggregations` are not exploded either: their values are
+          aggregated within each row instead (see `UnpackFrame.aggregate()`).
         * Unpacked columns will be renamed as their full respective JSON paths to avoid
           potential identical names.
+        * The schema is walked via a work list rather than recursively, such that the
+          nesting depth is not bounded by the recursion limit of Python; the plan is
+          built onto this single object, in a time linear in the number of fields.
 
         """
-        # if we are dealing with a nesting column
-        if column is not None:
-            if dtype in (pl.Array, pl.List):
-                # rename column to json path
-                jp = f"{json_path}{self.separator}{column}".lstrip(self.separator)
-                if column in self._df.columns:
-                    self._df = self._df.rename({column: jp})
-                # unpack
-                self._df = self._df.explode(jp).json.unpack(dtype.inner, jp, jp)
-            elif dtype == pl.Struct:
-                self._df = self._df.unnest(column).json.unpack(dtype, json_path)
+        # actual columns and datatypes, tracked along instead of resolving the schema of
+        # the ever growing plan at each step
+        schema = dict(self._df.collect_schema())
+
+        def _rename(name: str, jp: str) -> None:
+            """Rename a column to its json path, if present."""
+            # quick work
+            if name in schema:
+                self._df = self._df.rename({name: jp})
+                schema[jp] = schema.pop(name)
+
+        def _explode(jp: str, dtype: pl.DataType) -> None:
+            """Explode a list column, its items to be unpacked next."""
+            # quick work
+            self._df = self.explode(jp, dtype, list_index)
+            schema[jp] = getattr(schema.get(jp), "inner", None)
+            if list_index is not None:
+                schema[f"{jp}{list_index}"] = pl.UInt32
+            stack.append((dtype.inner, jp, jp, None))
+
+        def _unnest(name: str) -> None:
+            """Unnest a struct column, its fields taking its place."""
+            # quick work
+            self._df = self._df.unnest(name)
+            if type(d := schema.pop(name, None)) == pl.Struct:
+                schema.update({f.name: f.dtype for f in d.fields})
+            else:
+                schema.update(self._df.collect_schema())  # let polars complain
 
-        # unpack nested children columns when encountered
-        elif hasattr(dtype, "fields"):
-            for f in dtype.fields:
+        # work list of (datatype, json path, column, field name) tuples, handled depth
+        # first as a recursive walk would (children before the next sibling) but
+        # without any recursion limit, the plan being built onto a single object
+        stack = [(dtype, json_path, column, None)]
+        while stack:
+            dtype, json_path, column, name = stack.pop()
+
+            # unpack nested children columns when encountered, one at a time
+            if name is not None:
                 # rename column to json path
-                jp = f"{json_path}{self.separator}{f.name}".lstrip(self.separator)
-                if f.name in self._df.columns:
-                    self._df = self._df.rename({f.name: jp})
+                jp = f"{json_path}{self.separator}{name}".lstrip(self.separator)
+                _rename(name, jp)
+                # unpack the first items as siblings of the list
+                if widths and jp in widths:
+                    d = getattr(schema.pop(jp, None), "inner", None)
+                    self._df = self.extract(jp, dtype, widths[jp])
+                    schema.update({f"{jp}_{i}": d for i in range(widths[jp])})
+                    items = pl.Struct(
+                        [
+                            pl.Field(f"{name}_{i}", dtype.inner)
+                            for i in range(widths[jp])
+                        ],
+                    )
+                    stack.append((items, json_path, None, None))
+                # aggregate the values within the list
+                elif aggregations and jp in aggregations:
+                    d = schema.pop(jp, None)
+                    self._df = self.aggregate(jp, aggregations[jp], d)
+                    for p, function in aggregations[jp].items():
+                        names = p[len(jp) + len(self.separator) :].split(self.separator)
+                        if (v := reach_values(pl.col(jp), d, names)) is not None:
+                            schema[p] = aggregated_dtype(function, v[1])
                 # unpack
-                if type(f.dtype) in (pl.Array, pl.List):
-                    self._df = self._df.explode(jp).json.unpack(f.dtype.inner, jp, jp)
-                elif type(f.dtype) == pl.Struct:
-                    self._df = self._df.unnest(jp).json.unpack(f.dtype, jp)
+                elif type(dtype) in (pl.Array, pl.List):
+                    _explode(jp, dtype)
+                elif type(dtype) == pl.Struct:
+                    _unnest(jp)
+                    stack.append((dtype, jp, None, None))
+
+            # if we are dealing with a nesting column
+            elif column is not None:
+                if dtype in (pl.Array, pl.List):
+                    # rename column to json path
+                    jp = f"{json_path}{self.separator}{column}".lstrip(self.separator)
+                    _rename(column, jp)
+                    # unpack
+                    _explode(jp, dtype)
+                elif dtype == pl.Struct:
+                    _unnest(column)
+                    stack.append((dtype, json_path, None, None))
+
+            # children pushed in reverse order, to be popped in order
+            elif hasattr(dtype, "fields"):
+                stack.extend(
+                    (f.dtype, json_path, None, f.name) for f in reversed(dtype.fields)
+                )
 
         return self._df
 
 
+class UnpackReport:
+    """Report of the operations and costs involved in unpacking some JSON content."""
+
+    def __init__(self) -> None:
+        """Instantiate the object.
+
+        Attributes
+        ----------
+        explodes : list[str]
+            JSON paths of the exploded lists, in the order they are exploded.
+        factor : float | None
+            Estimated number of unpacked rows per source row (JSON line), all
+            explosions included; `None` if not estimated.
+        factors : dict[str, float]
+            Estimated number of rows per row of the parent object after exploding each
+            list, indexed by JSON path of the exploded list.
+        plan_depth : int
+            Depth of the optimized `Polars` plan.
+        renames : int
+            Number of `rename` nodes generated by `UnpackFrame.unpack()`.
+        tree : str
+            Readable tree of the unpacking.
+        unnests : int
+            Number of `unnest` nodes generated by `UnpackFrame.unpack()`.
+
+        """
+        self.explodes: list[str] = []
+        self.factor: float | None = None
+        self.factors: dict[str, float] = {}
+        self.plan_depth: int = 0
+        self.renames: int = 0
+        self.tree: str = ""
+        self.unnests: int = 0
+
+    def __str__(self) -> str:
+        """Pretty-print the report.
+
+        Returns
+        -------
+        : str
+            Summary of the node counts followed by the readable tree.
+
+        """
+        msg = (
+            f"{self.unnests} unnest, {len(self.explodes)} explode and {self.renames} "
+            f"rename nodes; optimized plan depth of {self.plan_depth}"
+        )
+        if self.factor is not None:
+            msg += f"; x{self.factor:.2f} rows per source row"
+
+        return f"{msg}\n\n{self.tree}"
+
+
 if __name__ == "__main__":
     # infer schema from ndjson
     if len(sys.argv[1:]) == 1 and sys.argv[1].endswith("ndjson"):
         sys.stdout.write(f"{infer_schema(sys.argv[1])}\n")
     # unpack ndjson given a schema; at the end as plain text fits the use case better...
     elif len(sys.argv[1:]) == 2:
-        sys.stdout.write(f"{unpack_text(sys.argv[1], sys.argv[2]).fetch(3)}\n")
+        sys.stdout.write(f"{preview(sys.argv[1], sys.argv[2], 3)}\n")
     # usage
     else:
         sys.stderr.write(f"Usage: python3.1X {sys.argv[0]} <SCHEMA> <NDJSON>\n")
@@ -5,6 +5,8 @@ import setuptools
 setuptools.setup(
     author="carnarez",
     description=("Automated, schema-based JSON unpacking to Polars objects."),
+    entry_points={"console_scripts": ["polars-unpack=polars_unpack.cli:main"]},
+    extras_require={"arrow": ["pyarrow"]},
     install_requires=["polars"],
     name="polars_unpack",
     packages=["polars_unpack"],
@@ -0,0 +1,143 @@
+"""Assert capabilities of the command line interface."""
+
+import pathlib
+
+import polars as pl
+import pytest
+
+from polars_unpack import unpack_text
+from polars_unpack.cli import main
+
+
+def test_convert(tmp_path: pathlib.Path) -> None:
+    """Test the decoding of JSON data given a schema, without unpacking.
+
+    Parameters
+    ----------
+    tmp_path : pathlib.Path
+        Temporary directory provided by `pytest`.
+
+    """
+    path = tmp_path / "converted.ipc"
+
+    assert (
+        main(
+            [
+                "convert",
+                "tests/samples/complex.schema",
+                "tests/samples/complex.ndjson",
+                "--output",
+                str(path),
+            ],
+        )
+        == 0
+    )
+    assert pl.read_ipc(path).columns == ["headers", "payload"]
+
+
+def test_infer(capsys: pytest.CaptureFixture) -> None:
+    """Test the printing of an inferred schema.
+
+    Parameters
+    ----------
+    capsys : pytest.CaptureFixture
+        Captured standard output/error provided by `pytest`.
+
+    """
+    assert main(["infer", "--sample", "0", "tests/samples/nested-list.ndjson"]) == 0
+
+    with pathlib.Path("tests/samples/nested-list.schema").open() as f:
+        assert capsys.readouterr().out.strip() == f.read().strip()
+
+
+def test_preview(capsys: pytest.CaptureFixture) -> None:
+    """Test the printing of the first unpacked rows.
+
+    Parameters
+    ----------
+    capsys : pytest.CaptureFixture
+        Captured standard output/error provided by `pytest`.
+
+    """
+    argv = ["preview", "tests/samples/complex.schema", "tests/samples/complex.ndjson"]
+    assert main([*argv, "-n", "1", "--columns", "timestamp,product"]) == 0
+
+    out = capsys.readouterr().out
+    assert "shape: (1, 2)" in out
+    assert "76543" in out
+
+
+@pytest.mark.parametrize("fmt", ["csv", "ipc", "ndjson", "parquet"])
+def test_unpack(tmp_path: pathlib.Path, fmt: str) -> None:
+    """Test the unpacking of multiple files, including filtering and selection.
+
+    Parameters
+    ----------
+    tmp_path : pathlib.Path
+        Temporary directory provided by `pytest`.
+    fmt : str
+        Output format.
+
+    """
+    # same file names in different directories
+    for name in ("foo", "bar"):
+        (tmp_path / name).mkdir()
+        (tmp_path / name / "data.ndjson").write_text(
+            pathlib.Path("tests/samples/complex.ndjson").read_text(),
+        )
+
+    df = (
+        unpack_text("tests/samples/complex.schema", "tests/samples/complex.ndjson")
+        .filter(pl.col("quantity") > 1)
+        .select("timestamp", "product")
+        .collect()
+    )
+
+    assert (
+        main(
+            [
+                "unpack",
+                "tests/samples/complex.schema",
+                str(tmp_path / "foo" / "data.ndjson"),
+                str(tmp_path / "bar" / "data.ndjson"),
+                "--output",
+                str(tmp_path / "unpacked"),
+                "--format",
+                fmt,
+                "--columns",
+                "timestamp,product",
+                "--filter",
+                "quantity > 1",
+                "--jobs",
+                "2",
+            ],
+        )
+        == 0
+    )
+
+    for name in ("foo", "bar"):
+        path = tmp_path / "unpacked" / name / f"data.{fmt}"
+        assert getattr(pl, f"read_{fmt}")(path).equals(df)
+
+
+def test_unpack_failure(tmp_path: pathlib.Path) -> None:
+    """Test the exit code when an input file cannot be processed.
+
+    Parameters
+    ----------
+    tmp_path : pathlib.Path
+        Temporary directory provided by `pytest`.
+
+    """
+    assert (
+        main(
+            [
+                "unpack",
+                "tests/samples/complex.schema",
+                str(tmp_path / "missing.ndjson"),
+                "--output",
+                str(tmp_path / "unpacked.parquet"),
+            ],
+        )
+        == 1
+    )
@@ -0,0 +1,195 @@
+"""Assert capabilities of the incremental ingestion."""
+
+import hashlib
+import io
+import pathlib
+import threading
+import time
+
+import polars as pl
+import pytest
+
+from polars_unpack import unpack_text
+from polars_unpack.cli import main
+from polars_unpack.ingest import Checkpoint, follow, ingest
+
+
+def test_follow(tmp_path: pathlib.Path) -> None:
+    """Test following a file written line by line, then rotated.
+
+    Parameters
+    ----------
+    tmp_path : pathlib.Path
+        Temporary directory provided by `pytest`.
+
+    """
+    schema = "tests/samples/complex.schema"
+    line = pathlib.Path("tests/samples/complex.ndjson").read_text().strip()
+    path = tmp_path / "producer.ndjson"
+
+    def _produce() -> None:
+        """Write a line in two steps, then rotate the file."""
+        time.sleep(0.1)
+        with path.open("w") as f:
+            f.write(f"{line}\n{line[:10]}")
+            f.flush()
+            time.sleep(0.3)
+            f.write(f"{line[10:]}\n")
+        time.sleep(0.3)
+        path.rename(tmp_path / "producer.1.ndjson")
+        path.write_text(f"{line}\n" * 100)
+
+    t = threading.Thread(target=_produce)
+    t.start()
+    dfs = list(follow(schema, path, interval=0.05, idle_timeout=1))
+    t.join()
+
+    # partial line held back, rotated file read from the start
+    df = unpack_text(schema, f"{line}\n".encode()).collect()
+    assert dfs[0].equals(df)
+    assert dfs[1].equals(df)
+    assert pl.concat(dfs).equals(pl.concat([df] * 102))
+
+
+def test_follow_cli(tmp_path: pathlib.Path) -> None:
+    """Test following a file from the command line, until idle.
+
+    Parameters
+    ----------
+    tmp_path : pathlib.Path
+        Temporary directory provided by `pytest`.
+
+    """
+    path = tmp_path / "producer.ndjson"
+    path.write_text(f"{pathlib.Path('tests/samples/complex.ndjson').read_text()}\n")
+    args = [
+        "follow",
+        "tests/samples/complex.schema",
+        str(path),
+        "--output",
+        str(tmp_path / "out"),
+        "--interval",
+        "0.01",
+        "--idle-timeout",
+        "0.1",
+    ]
+
+    assert main(args) == 0
+    assert pl.read_parquet(tmp_path / "out" / "*.parquet").equals(
+        unpack_text(
+            "tests/samples/complex.schema",
+            "tests/samples/complex.ndjson",
+        ).collect(),
+    )
+
+
+def test_ingest(tmp_path: pathlib.Path) -> None:
+    """Test unpacking new files and appended lines only, across runs.
+
+    Parameters
+    ----------
+    tmp_path : pathlib.Path
+        Temporary directory provided by `pytest`.
+
+    """
+    schema = "tests/samples/complex.schema"
+    line = pathlib.Path("tests/samples/complex.ndjson").read_text().strip()
+    n = len(line) + 1
+    data, output, checkpoint = tmp_path / "data", tmp_path / "out", tmp_path / "ckpt"
+    data.mkdir()
+
+    def _ingest(**kwargs) -> list[str]:
+        """Run the ingestion, and return the names of the output files written."""
+        paths = ingest(
+            schema,
+            data / "*" / "*.ndjson",
+            output,
+            checkpoint,
+            row_index="row",
+            **kwargs,
+        )
+        return [p.name for p in paths]
+
+    def _name(path: pathlib.Path, start: int, end: int) -> str:
+        """Name of the output file of a range of bytes of an input file."""
+        tag = hashlib.sha256(str(path).encode()).hexdigest()[:8]
+        return f"{path.stem}-{tag}-{start}-{end}.parquet"
+
+    (data / "a").mkdir()
+    foo, bar = data / "a" / "foo.ndjson", data / "a" / "bar.ndjson"
+
+    # new files, the last line not complete yet
+    foo.write_text(f"{line}\n{line}\n")
+    bar.write_text(f"{line}\n{line[:10]}")
+    assert _ingest() == [_name(bar, 0, n), _name(foo, 0, 2 * n)]
+    assert _ingest() == []
+
+    # appended lines only, the row index counting on
+    with bar.open("a") as f:
+        f.write(f"{line[10:]}\n")
+    assert _ingest() == [_name(bar, n, 2 * n)]
+
+    df = pl.read_parquet(output / "*.parquet")
+    expected = unpack_text(schema, f"{line}\n".encode() * 4, row_index="row").collect()
+    assert df.drop("row").equals(expected.drop("row"))
+    assert sorted(df["row"].unique()) == [0, 1]
+
+    c = Checkpoint(checkpoint)
+    assert c.files[str(bar)]["lines"] == 2
+    assert len(c.outputs) == 3
+
+    # truncated file unpacked from the start
+    foo.write_text(f"{line}\n")
+    assert _ingest() == [_name(foo, 0, n)]
+
+    # truncated in place then written over past the offset (copytruncate rotation)
+    with foo.open("r+") as f:
+        f.truncate(0)
+        f.write(f"{line.replace('1', '2')}\n{line}\n")
+    assert _ingest() == [_name(foo, 0, 2 * n)]
+
+    # same file name in another directory, new content read in chunks of lines
+    (data / "b").mkdir()
+    (baz := data / "b" / "foo.ndjson").write_text(f"{line}\n" * 3)
+    assert _ingest(max_bytes=2 * n - 1) == [
+        _name(baz, 0, n),
+        _name(baz, n, 2 * n),
+        _name(baz, 2 * n, 3 * n),
+    ]
+    df = pl.read_parquet(output / f"foo-*-{n}-{2 * n}.parquet")
+    assert df["row"].unique().to_list() == [1]
+
+    # modified schema: everything unpacked again
+    schema = io.BytesIO(pathlib.Path(schema).read_bytes() + b"\nextra: Int8")
+    assert len(_ingest()) == 3
+    assert len(list(output.iterdir())) == 3
+
+
+def test_ingest_cli(
+    tmp_path: pathlib.Path,
+    capsys: pytest.CaptureFixture,
+) -> None:
+    """Test the incremental ingestion from the command line.
+
+    Parameters
+    ----------
+    tmp_path : pathlib.Path
+        Temporary directory provided by `pytest`.
+    capsys : pytest.CaptureFixture
+        Captured standard output/error provided by `pytest`.
+
+    """
+    args = [
+        "ingest",
+        "tests/samples/complex.schema",
+        "tests/samples/*.ndjson",
+        "--output",
+        str(tmp_path / "out"),
+        "--checkpoint",
+        str(tmp_path / "ckpt"),
+    ]
+
+    assert main(args) == 0
+    assert capsys.readouterr().out.strip().endswith(".parquet")
+    assert main(args) == 0
+    assert capsys.readouterr().out == ""
@@ -142,6 +142,125 @@ def test_list_nested_in_struct() -> None:
     assert SchemaParser("Struct(foo: List(Int8))").to_struct() == struct
 
 
+def test_list_aggregation() -> None:
+    """Test the parsing of attributes aggregated over the lists they belong to.
+
+    Test the generation of the following schema:
+
+    ```
+    foo: Int8
+    bar: List(
+        Struct(
+            fox=fax: Sum(Int8)
+            baz: List(Struct(qux: Count(Int8)))
+        )
+    )
+    lol: List(Struct(bil: Int8, bol: List(Struct(bul: Mean(Float32)))))
+    ```
+    """
+    s = SchemaParser(
+        "foo: Int8, "
+        "bar: List(Struct(fox=fax: Sum(Int8), baz: List(Struct(qux: Count(Int8))))), "
+        "lol: List(Struct(bil: Int8, bol: List(Struct(bul: Mean(Float32)))))",
+    )
+
+    assert s.to_struct() == pl.Struct(
+        [
+            pl.Field("foo", pl.Int8),
+            pl.Field(
+                "bar",
+                pl.List(
+                    pl.Struct(
+                        [
+                            pl.Field("fox", pl.Int8),
+                            pl.Field(
+                                "baz",
+                                pl.List(pl.Struct([pl.Field("qux", pl.Int8)])),
+                            ),
+                        ],
+                    ),
+                ),
+            ),
+            pl.Field(
+                "lol",
+                pl.List(
+                    pl.Struct(
+                        [
+                            pl.Field("bil", pl.Int8),
+                            pl.Field(
+                                "bol",
+                                pl.List(pl.Struct([pl.Field("bul", pl.Float32)])),
+                            ),
+                        ],
+                    ),
+                ),
+            ),
+        ],
+    )
+    assert s.aggregations == {
+        "bar": {"bar.fox": "sum", "bar.baz.qux": "count"},
+        "lol.bol": {"lol.bol.bul": "mean"},
+    }
+    assert s.columns == ["foo", "fax", "qux", "bil", "bul"]
+    assert s.dtypes == [pl.Int8, pl.Int64, pl.UInt32, pl.Int8, pl.Float64]
+
+    # only within lists, alongside aggregated attributes only
+    with pytest.raises(SchemaParsingError):
+        SchemaParser("foo: Sum(Int8)").to_struct()
+    with pytest.raises(SchemaParsingError):
+        SchemaParser("foo: List(Struct(bar: Int8, baz: Sum(Int8)))").to_struct()
+    with pytest.raises(SchemaParsingError):
+        SchemaParser("foo: List(Struct(bar: Sum(List)))").to_struct()
+    with pytest.raises(SchemaParsingError):
+        SchemaParser("foo: List(Struct(bar: Sum(Int8)), 2)").to_struct()
+    with pytest.raises(DuplicateColumnError):
+        SchemaParser("foo: List(Struct(bar: Sum(Int8))), bar: Int8").to_struct()
+
+
+def test_list_width() -> None:
+    """Test the parsing of lists of which the first items are extracted as columns.
+
+    Test the generation of the following schema:
+
+    ```
+    foo: Array(Float32, 2)
+    bar: List(
+        Struct(
+            fox=fax: Int8
+        ),
+        3
+    )
+    ```
+    """
+    s = SchemaParser("foo: Array(Float32, 2), bar: List(Struct(fox=fax: Int8), 3)")
+
+    assert s.to_struct() == pl.Struct(
+        [
+            pl.Field("foo", pl.List(pl.Float32)),
+            pl.Field("bar", pl.List(pl.Struct([pl.Field("fox", pl.Int8)]))),
+        ],
+    )
+    assert s.widths == {"foo": 2, "bar": 3}
+    assert s.json_paths == {
+        "foo_0": "foo_0",
+        "foo_1": "foo_1",
+        "bar_0.fox": "fax_0",
+        "bar_1.fox": "fax_1",
+        "bar_2.fox": "fax_2",
+    }
+    assert s.dtypes == [pl.Float32] * 2 + [pl.Int8] * 3
+
+    # only at the end of a named list, of non-list items
+    with pytest.raises(SchemaParsingError):
+        SchemaParser("foo: List(List(Int8, 2))").to_struct()
+    with pytest.raises(SchemaParsingError):
+        SchemaParser("foo: List(List(Int8), 2)").to_struct()
+    with pytest.raises(SchemaParsingError):
+        SchemaParser("foo: Struct(bar: Int8, 2)").to_struct()
+    with pytest.raises(DuplicateColumnError):
+        SchemaParser("foo: List(Int8, 2), foo_1: Int8").to_struct()
+
+
 def test_pretty_printing() -> None:
     """Test whether an inferred schema is correctly printed."""
     with pathlib.Path("tests/samples/nested-list.schema").open() as f:
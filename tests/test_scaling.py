@@ -0,0 +1,234 @@
+"""Assert the schema parser scales (linearly) with the width and depth of a schema.
+
+Wall times depend on the load of the machine: the fastest of several runs is kept for
+each size, and the growth exponent is fitted over several sizes such that a single
+noisy measurement does not fail the gate.
+
+See `python -m benchmarks.parsing` for the full microbenchmark (1k to 100k leaves,
+nesting depth from 1 to 50) instead of the reduced set of sizes used as a gate.
+"""
+
+import gc
+import itertools
+import math
+import pathlib
+import statistics
+import time
+import tracemalloc
+from collections.abc import Callable
+
+import pytest
+
+from polars_unpack import SchemaParser, SchemaParsingError, parse_schema
+
+# maximum tolerated exponent of the growth of time/memory with the number of leaves;
+# linear is 1.0, the previous (quadratic) parser came out at ~1.7
+MAX_EXPONENT: float = 1.3
+
+# wall times come out noisier (load of the machine, cache effects at the largest sizes)
+MAX_TIME_EXPONENT: float = 1.4
+
+
+def generate_schema(leaves: int, depth: int, fanout: int = 100) -> str:
+    """Generate a plain text schema of given width and depth.
+
+    Leaves are grouped by `fanout` under a chain of `depth - 1` nested objects,
+    alternating between `Struct` and `List(Struct)`; one leaf out of two is renamed.
+
+    Parameters
+    ----------
+    leaves : int
+        Number of non-nested attributes in the schema.
+    depth : int
+        Nesting depth of each leaf.
+    fanout : int
+        Number of leaves per innermost nested object; defaults to `100`.
+
+    Returns
+    -------
+    : str
+        Generated plain text schema.
+
+    """
+    lines = []
+
+    for g in range(math.ceil(leaves / fanout)):
+        for d in range(depth - 1):
+            if d % 2:
+                lines.append(f"{'    ' * d}g{g}_{d}: List(Struct(")
+            else:
+                lines.append(f"{'    ' * d}g{g}_{d}: Struct(")
+        indent = "    " * (depth - 1)
+        for i in range(g * fanout, min(leaves, (g + 1) * fanout)):
+            if i % 2:
+                lines.append(f"{indent}f{i}=c{i}: String")
+            else:
+                lines.append(f"{indent}f{i}: Int64")
+        for d in reversed(range(depth - 1)):
+            lines.append(f"{'    ' * d}))" if d % 2 else f"{'    ' * d})")
+
+    return "\n".join(lines)
+
+
+def measure(
+    func: Callable[[], object],
+    repeat: int = 3,
+    memory: bool = True,
+) -> tuple[float, int | None]:
+    """Measure the best wall time and the peak memory allocated by a callable.
+
+    The garbage collector is disabled while timing, to avoid its pauses adding noise.
+
+    Parameters
+    ----------
+    func : collections.abc.Callable
+        Callable to measure.
+    repeat : int
+        Number of timed runs, the fastest is kept; defaults to `3`.
+    memory : bool
+        Whether to measure the peak memory allocated as well; defaults to `True`.
+
+    Returns
+    -------
+    : tuple[float, int | None]
+        Best time in seconds, and peak memory allocated in bytes (`None` if not
+        measured).
+
+    """
+    elapsed = math.inf
+    for _ in range(repeat):
+        gc.collect()
+        gc.disable()
+        try:
+            t = time.perf_counter()
+            func()
+            elapsed = min(elapsed, time.perf_counter() - t)
+        finally:
+            gc.enable()
+
+    if not memory:
+        return elapsed, None
+
+    # measured separately as tracing allocations slows everything down
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return elapsed, peak
+
+
+def exponent(sizes: tuple[int, ...], measurements: tuple[float, ...]) -> float:
+    """Estimate the growth exponent `k` of `y ~ x^k` from several measurements.
+
+    The exponent is the median of the slopes between each pair of measurements (in
+    log-log space), such that a single noisy measurement barely moves it.
+
+    Parameters
+    ----------
+    sizes : tuple[int, ...]
+        Sizes of the inputs.
+    measurements : tuple[float, ...]
+        Measurement for each input.
+
+    Returns
+    -------
+    : float
+        Growth exponent.
+
+    """
+    return statistics.median(
+        math.log(m2 / m1) / math.log(n2 / n1)
+        for (n1, m1), (n2, m2) in itertools.combinations(
+            zip(sizes, measurements, strict=True),
+            2,
+        )
+    )
+
+
+def parse_text(text: str, _: pathlib.Path) -> Callable[[], object]:
+    """Return a callable parsing the given schema via `SchemaParser.to_struct()`."""
+    return lambda: SchemaParser(text).to_struct()
+
+
+def parse_file(text: str, tmp: pathlib.Path) -> Callable[[], object]:
+    """Return a callable parsing the given schema from a file via `parse_schema()`."""
+    path = tmp / "generated.schema"
+    path.write_text(text)
+
+    return lambda: parse_schema(str(path))
+
+
+def parse_error(text: str, _: pathlib.Path) -> Callable[[], object]:
+    """Return a callable formatting the error raised by a schema faulty on its end."""
+
+    def _parse() -> None:
+        try:
+            SchemaParser(f"{text}\n!@#$%^&*").to_struct()
+        except SchemaParsingError as e:
+            return str(e)
+
+    return _parse
+
+
+@pytest.mark.parametrize("depth", [1, 10, 50])
+@pytest.mark.parametrize("parse", [parse_text, parse_file, parse_error])
+def test_scaling_memory(
+    parse: Callable[[str, pathlib.Path], Callable[[], object]],
+    depth: int,
+    tmp_path: pathlib.Path,
+) -> None:
+    """Test the peak memory allocated while parsing does not grow superlinearly.
+
+    Parameters
+    ----------
+    parse : collections.abc.Callable
+        Callable generating the function to measure from a plain text schema.
+    depth : int
+        Nesting depth of the generated schema.
+    tmp_path : pathlib.Path
+        Temporary directory provided by `pytest`.
+
+    """
+    sizes = (1000, 8000)
+    _, m = zip(
+        *[measure(parse(generate_schema(n, depth), tmp_path), repeat=1) for n in sizes],
+        strict=True,
+    )
+
+    assert exponent(sizes, m) < MAX_EXPONENT
+
+
+@pytest.mark.parametrize("depth", [1, 10, 50])
+@pytest.mark.parametrize("parse", [parse_text, parse_file, parse_error])
+def test_scaling_time(
+    parse: Callable[[str, pathlib.Path], Callable[[], object]],
+    depth: int,
+    tmp_path: pathlib.Path,
+) -> None:
+    """Test the parsing time does not grow superlinearly with the width.
+
+    Parameters
+    ----------
+    parse : collections.abc.Callable
+        Callable generating the function to measure from a plain text schema.
+    depth : int
+        Nesting depth of the generated schema.
+    tmp_path : pathlib.Path
+        Temporary directory provided by `pytest`.
+
+    """
+    sizes = (1000, 2000, 4000, 8000)
+    t, _ = zip(
+        *[
+            measure(
+                parse(generate_schema(n, depth), tmp_path),
+                repeat=max(5, 16000 // n),
+                memory=False,
+            )
+            for n in sizes
+        ],
+        strict=True,
+    )
+
+    assert exponent(sizes, t) < MAX_TIME_EXPONENT
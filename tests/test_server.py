@@ -0,0 +1,115 @@
+"""Assert capabilities of the unpacking server and its thin client."""
+
+import pathlib
+import threading
+from collections.abc import Iterator
+
+import polars as pl
+import pytest
+
+from polars_unpack import unpack_text
+from polars_unpack.client import ServerError, request_unpack
+from polars_unpack.server import UnixUnpackServer, UnpackServer
+
+
+@pytest.fixture(params=["tcp", "unix"])
+def server(
+    request: pytest.FixtureRequest,
+    tmp_path: pathlib.Path,
+) -> Iterator[tuple[UnpackServer | UnixUnpackServer, dict]]:
+    """Start a server in a background thread, listening on a port or a Unix socket.
+
+    Parameters
+    ----------
+    request : pytest.FixtureRequest
+        Parametrization provided by `pytest`.
+    tmp_path : pathlib.Path
+        Temporary directory provided by `pytest`.
+
+    Yields
+    ------
+    : tuple[UnpackServer | UnixUnpackServer, dict]
+        Running server, and connection parameters to forward to the client.
+
+    """
+    if request.param == "tcp":
+        s = UnpackServer(("127.0.0.1", 0))
+        kwargs = {"port": s.server_address[1]}
+    else:
+        s = UnixUnpackServer(str(tmp_path / "polars-unpack.sock"))
+        kwargs = {"socket": s.server_address}
+
+    t = threading.Thread(target=s.serve_forever, daemon=True)
+    t.start()
+
+    yield s, kwargs
+
+    s.shutdown()
+    s.server_close()
+
+
+def test_request(server: tuple[UnpackServer | UnixUnpackServer, dict]) -> None:
+    """Test unpacking data from a file, from the request body, and to a file.
+
+    Parameters
+    ----------
+    server : tuple[UnpackServer | UnixUnpackServer, dict]
+        Running server, and connection parameters to forward to the client.
+
+    """
+    s, kwargs = server
+    schema = "tests/samples/complex.schema"
+    data = "tests/samples/complex.ndjson"
+    df = unpack_text(schema, data).collect()
+
+    # data read by the server
+    assert pl.read_ipc_stream(request_unpack(schema, data, **kwargs)).equals(df)
+
+    # inline data
+    inline = pathlib.Path(data).read_bytes()
+    assert pl.read_ipc_stream(request_unpack(schema, data=inline, **kwargs)).equals(df)
+
+    # schema parsed once only
+    assert list(s.schemas.schemas) == [str(pathlib.Path(schema).resolve())]
+
+
+def test_request_output(
+    server: tuple[UnpackServer | UnixUnpackServer, dict],
+    tmp_path: pathlib.Path,
+) -> None:
+    """Test unpacking data to a file written by the server.
+
+    Parameters
+    ----------
+    server : tuple[UnpackServer | UnixUnpackServer, dict]
+        Running server, and connection parameters to forward to the client.
+    tmp_path : pathlib.Path
+        Temporary directory provided by `pytest`.
+
+    """
+    _, kwargs = server
+    schema = "tests/samples/complex.schema"
+    data = "tests/samples/complex.ndjson"
+    path = tmp_path / "unpacked.parquet"
+
+    assert request_unpack(schema, data, output=str(path), **kwargs) == str(path)
+    assert pl.read_parquet(path).equals(unpack_text(schema, data).collect())
+
+
+def test_request_failure(server: tuple[UnpackServer | UnixUnpackServer, dict]) -> None:
+    """Test the failure of a request is reported by the client.
+
+    Parameters
+    ----------
+    server : tuple[UnpackServer | UnixUnpackServer, dict]
+        Running server, and connection parameters to forward to the client.
+
+    """
+    _, kwargs = server
+
+    with pytest.raises(ServerError):
+        request_unpack("tests/samples/missing.schema", data=b"{}", **kwargs)
+
+    # the error is reported even if the request is larger than the socket buffers
+    with pytest.raises(ServerError, match="missing.schema"):
+        request_unpack("tests/samples/missing.schema", data=b"{}\n" * 2**22, **kwargs)
@@ -1,11 +1,39 @@
 """Assert capabilities of the `DataFrame` / `LazyFrame` flattener."""
 
+import io
 import json
+import pathlib
+import sys
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 
 import polars as pl
 import pytest
 
-from polars_unpack import SchemaParser, unpack_ndjson, unpack_text
+from polars_unpack import (
+    ColumnStatistics,
+    ErrorRateExceededError,
+    LineageError,
+    RecordFlattener,
+    SchemaParser,
+    UnknownFormatError,
+    explain_unpack,
+    iter_array,
+    iter_batches,
+    pack,
+    parse_schema,
+    preview,
+    sink,
+    unpack_ipc,
+    unpack_ndjson,
+    unpack_parquet,
+    unpack_records,
+    unpack_routes,
+    unpack_text,
+    unpack_tolerant,
+    unpack_versions,
+    validate,
+)
 
 
 def test_datatype() -> None:
@@ -37,6 +65,206 @@ def test_datatype() -> None:
     assert df.json.unpack(dtype).equals(df)
 
 
+def test_deep_nesting() -> None:
+    """Test schemas nested deeper than the recursion limit of Python."""
+    depth = 1000
+    assert depth >= sys.getrecursionlimit()
+
+    # plans built without recursion (collecting plans that deep is up to polars)
+    for kind in (pl.Struct, pl.List):
+        dtype = pl.Int64
+        for _ in range(depth):
+            if kind == pl.Struct:
+                dtype = pl.Struct({"attr": pl.Int64, "next": dtype})
+            else:
+                dtype = pl.List(pl.Struct({"next": dtype}))
+        df = pl.LazyFrame({"root": [None]}).select(pl.col("root").cast(dtype))
+        assert isinstance(df.json.unpack(pl.Struct({"root": dtype})), pl.LazyFrame)
+
+    # same walk as a recursive one would do, a few levels deep
+    depth = 5
+    dtype = pl.Int64
+    for _ in range(depth):
+        dtype = pl.Struct({"attr": pl.Int64, "next": pl.List(dtype)})
+    text = "".join(f'{{"attr": {i}, "next": [' for i in range(depth)) + "0, 1"
+    df = pl.Series([text + "]}" * depth]).str.json_decode(dtype).to_frame("root")
+
+    unpacked = df.json.unpack(pl.Struct({"root": dtype}), list_index="_i")
+    paths = [f"root{'.next' * i}" for i in range(depth)]
+    assert unpacked.columns == [
+        *[f"{p}.attr" for p in paths],
+        f"{paths[-1]}.next",
+        *[f"{p}.next_i" for p in paths],
+    ]
+    assert unpacked.rows() == [
+        (0, 1, 2, 3, 4, 0, 0, 0, 0, 0, 0),
+        (0, 1, 2, 3, 4, 1, 0, 0, 0, 0, 1),
+    ]
+
+
+def test_explain_unpack() -> None:
+    """Test the report describing the unpacking of the complex real life-like example.
+
+    The node counts are checked against the operations of the unoptimized plan, and the
+    multiplication factors against the sample data (two lines, one discount per line).
+    """
+    s = SchemaParser(pathlib.Path("tests/samples/complex.schema").read_text())
+    s.to_struct()
+    plan = (
+        pl.LazyFrame(schema=s.struct.to_schema())
+        .json.unpack(s.struct)
+        .explain(optimized=False)
+        .splitlines()
+    )
+
+    r = explain_unpack("tests/samples/complex.schema", "tests/samples/complex.ndjson")
+
+    assert r.unnests == sum(line.strip().startswith("UNNEST") for line in plan)
+    # renames show as RENAME nodes, or as aliases in SELECT nodes in recent versions
+    assert r.renames == sum(
+        line.strip().startswith("RENAME")
+        or (line.strip().startswith("SELECT") and ".alias(" in line)
+        for line in plan
+    )
+    assert len(r.explodes) == sum(line.strip().startswith("EXPLODE") for line in plan)
+    assert r.explodes == ["payload.lines", "payload.lines.discounts"]
+    assert r.factors == {"payload.lines": 2.0, "payload.lines.discounts": 1.0}
+    assert r.factor == 2.0
+    assert r.plan_depth > 0
+    assert "lines: explode (x2.00)" in str(r)
+
+    # without data, nothing to estimate
+    r = explain_unpack("tests/samples/complex.schema")
+
+    assert r.factor is None
+    assert r.factors == {}
+    assert r.explodes == ["payload.lines", "payload.lines.discounts"]
+
+
+@pytest.mark.parametrize(
+    "wrap",
+    [bytes, bytearray, memoryview, io.BytesIO, lambda b: io.StringIO(b.decode())],
+)
+def test_in_memory(wrap: Callable[[bytes], object]) -> None:
+    """Test unpacking schemas and JSON content provided in memory rather than as paths.
+
+    Parameters
+    ----------
+    wrap : collections.abc.Callable[[bytes], object]
+        Function wrapping the content of the files into an in-memory object.
+
+    """
+    schema = pathlib.Path("tests/samples/complex.schema").read_bytes()
+    data = pathlib.Path("tests/samples/complex.ndjson").read_bytes()
+
+    for f in (unpack_ndjson, unpack_text):
+        df = f("tests/samples/complex.schema", "tests/samples/complex.ndjson").collect()
+
+        assert f(wrap(schema), wrap(data)).collect().equals(df)
+        assert f(parse_schema(wrap(schema)), wrap(data)).collect().equals(df)
+
+
+def test_iter_array() -> None:
+    """Test unpacking the elements of a top-level JSON array, read chunk by chunk."""
+    schema = "tests/samples/complex.schema"
+    element = pathlib.Path("tests/samples/complex.json").read_text()
+    data = f"[{element}, {element},{element}\n]".encode()
+
+    df = unpack_text(schema, f"{json.dumps(json.loads(element))}\n".encode() * 3)
+    df = df.with_row_index("row").collect()
+    df = df.with_columns(pl.col("row") // 2)
+
+    # tiny chunks splitting tokens, strings and elements alike
+    for chunk_size in (1, 7, len(data)):
+        batches = list(iter_array(schema, data, 2, chunk_size, row_index="row"))
+        assert [len(b) for b in batches] == [4, 2]
+        assert pl.concat(batches).equals(df)
+
+    # a single object is an array of one
+    batches = list(iter_array(schema, "tests/samples/complex.json", row_index="row"))
+    assert pl.concat(batches).equals(df.filter(pl.col("row") == 0))
+
+    # structural characters within strings
+    data = b'[{"a": "]}\\"[{,"}, {"a": null} ,{"a": "\\\\"}]'
+    batches = list(iter_array(b"a: String", data, chunk_size=3))
+    assert pl.concat(batches)["a"].to_list() == [']}"[{,', None, "\\"]
+    assert not list(iter_array(b"a: String", b" [ ] "))
+
+    for data in (b"", b"1", b'[{"a": 1}', b'[{"a": "1'):
+        with pytest.raises(UnknownFormatError):
+            list(iter_array(b"a: String", data))
+
+
+def test_iter_batches() -> None:
+    """Test the iteration over unpacked content as Arrow `RecordBatch` objects."""
+    pa = pytest.importorskip("pyarrow")
+
+    df = unpack_text("tests/samples/complex.schema", "tests/samples/complex.ndjson")
+    batches = list(iter_batches(df, batch_size=1))
+
+    assert len(batches) == 2
+    assert all(isinstance(b, pa.RecordBatch) for b in batches)
+    assert pl.from_arrow(pa.Table.from_batches(batches)).equals(df.collect())
+
+
+@pytest.mark.parametrize("unpack", [unpack_ndjson, unpack_text])
+def test_lineage(
+    tmp_path: pathlib.Path,
+    unpack: Callable[..., pl.LazyFrame],
+) -> None:
+    """Test the source row index, file name and list positions columns.
+
+    Parameters
+    ----------
+    tmp_path : pathlib.Path
+        Temporary directory provided by `pytest`.
+    unpack : collections.abc.Callable[..., polars.LazyFrame]
+        Unpacking function.
+
+    """
+    content = pathlib.Path("tests/samples/complex.ndjson").read_text()
+    for name in ("bar", "foo"):
+        (tmp_path / f"{name}.ndjson").write_text(content)
+
+    df = unpack(
+        "tests/samples/complex.schema",
+        str(tmp_path / "*.ndjson"),
+        row_index="row",
+        file_name="file",
+        list_index="#",
+    )
+
+    # lineage columns around the usual ones
+    names = df.collect_schema().names()
+    assert names[:2] == ["row", "file"]
+    assert names[-2:] == ["payload.lines#", "payload.lines.discounts#"]
+
+    # identical with the streaming engine
+    assert df.collect().equals(df.collect(engine="streaming"))
+
+    assert df.select(
+        "row",
+        "file",
+        "payload.lines#",
+        "payload.lines.discounts#",
+    ).collect().rows() == [
+        (0, str(tmp_path / "bar.ndjson"), 0, 0),
+        (0, str(tmp_path / "bar.ndjson"), 1, None),
+        (1, str(tmp_path / "foo.ndjson"), 0, 0),
+        (1, str(tmp_path / "foo.ndjson"), 1, None),
+    ]
+
+    # data columns sharing the suffix of the positions are left alone
+    df = unpack(
+        io.BytesIO(b"user_id: Int64\nitems: List(Struct(sku: String))"),
+        b'{"user_id": 1, "items": [{"sku": "a"}, {"sku": "b"}]}',
+        list_index="_id",
+    )
+
+    assert df.collect().rows() == [(1, "a", 0), (1, "b", 1)]
+    assert df.collect_schema().names() == ["user_id", "sku", "items_id"]
+
+
 def test_list() -> None:
     """Test a simple `polars.List` containing a standalone datatype.
 
@@ -238,6 +466,278 @@ def test_list_nested_in_struct() -> None:
     )
 
 
+def test_list_aggregation() -> None:
+    """Test the aggregation of the values of lists, without exploding.
+
+    Aggregations are checked against the explosion of the lists of the
+    `tests/samples/complex.ndjson` sample, grouped back per JSON object.
+    """
+    s = SchemaParser(
+        """
+        headers: Struct(timestamp: Int64)
+        payload: Struct(
+            lines: List(
+                Struct(
+                    product=products: Count(Int64)
+                    quantity: Sum(Int64)
+                    vatRate=vat_rate: Max(Float64)
+                    amount: Struct(includingVat=amount: Sum(Float64))
+                    discounts: List(Struct(promotion=discounts: Count(Int64)))
+                )
+            )
+        )
+        """,
+    )
+    s.to_struct()
+    data = "tests/samples/complex.ndjson"
+    records = [
+        json.loads(line)
+        for line in pathlib.Path(data).read_text().splitlines()
+        if line.strip()
+    ]
+
+    # each line is repeated once per discount when exploded
+    line = pl.col("payload.lines.discounts_i").fill_null(0) == 0
+    df = (
+        unpack_text(
+            "tests/samples/complex.schema",
+            data,
+            row_index="row",
+            list_index="_i",
+        )
+        .group_by("row", maintain_order=True)
+        .agg(
+            pl.col("timestamp").first(),
+            pl.col("product").filter(line).count().alias("products"),
+            pl.col("quantity").filter(line).sum(),
+            pl.col("vat_rate").filter(line).max(),
+            pl.col("line_amount_including_vat").filter(line).sum().alias("amount"),
+            pl.col("promotion").count().alias("discounts"),
+        )
+        .drop("row")
+        .collect()
+    )
+
+    for f in (unpack_ndjson, unpack_text):
+        assert f(s, data).collect().equals(df)
+    assert RecordFlattener(s).flatten(records).equals(df)
+
+    # empty, missing and null values
+    records = [
+        {"payload": {"lines": []}},
+        {},
+        {"payload": {"lines": [{"quantity": None}, {"quantity": 2, "discounts": []}]}},
+    ]
+    df = pl.DataFrame(
+        {
+            "timestamp": [None, None, None],
+            "products": [0, 0, 0],
+            "quantity": [0, None, 2],
+            "vat_rate": [None, None, None],
+            "amount": [0.0, None, 0.0],
+            "discounts": [0, 0, 0],
+        },
+        schema=dict(zip(s.columns, s.dtypes, strict=True)),
+    )
+
+    assert (
+        unpack_text(s, "\n".join(json.dumps(r) for r in records).encode())
+        .collect()
+        .equals(df)
+    )
+    assert RecordFlattener(s).flatten(records).equals(df)
+
+    # sums widened beyond the datatype of the summed values
+    s = SchemaParser("foo: List(Struct(bar: Sum(UInt8)))")
+    s.to_struct()
+    records = [{"foo": [{"bar": 200}, {"bar": 200}]}]
+    text = json.dumps(records[0]).encode()
+    df = pl.DataFrame({"bar": [400]}, schema={"bar": pl.Int64})
+
+    for f in (unpack_ndjson, unpack_text):
+        assert f(s, text).collect().equals(df)
+    assert RecordFlattener(s).flatten(records).equals(df)
+
+
+def test_list_width() -> None:
+    """Test the extraction of the first items of lists as columns, without exploding.
+
+    Test the following nested JSON content:
+
+    ```json
+    {
+        "location": [4.35, 50.85, 13.0, 0.0],
+        "lines": [
+            {"product": 1, "discounts": [{"amount": 0.5}, {"amount": 0.25}]},
+            {"product": 2}
+        ]
+    }
+    ```
+
+    as described by the following schema:
+
+    ```
+    location: Array(Float64, 3)
+    lines: List(
+        Struct(
+            product: Int64
+            discounts: List(Struct(amount: Float64), 2)
+        )
+    )
+    ```
+    """
+    s = SchemaParser(
+        "location: Array(Float64, 3), "
+        "lines: List(Struct(product: Int64, discounts: List(Struct(amount: Float64), 2)))",
+    )
+    s.to_struct()
+    records = [
+        {
+            "location": [4.35, 50.85, 13.0, 0.0],
+            "lines": [
+                {"product": 1, "discounts": [{"amount": 0.5}, {"amount": 0.25}]},
+                {"product": 2},
+            ],
+        },
+    ]
+    df = pl.DataFrame(
+        {
+            "location_0": [4.35, 4.35],
+            "location_1": [50.85, 50.85],
+            "location_2": [13.0, 13.0],
+            "product": [1, 2],
+            "amount_0": [0.5, None],
+            "amount_1": [0.25, None],
+        },
+    )
+
+    for f in (unpack_ndjson, unpack_text):
+        assert f(s, json.dumps(records[0]).encode()).collect().equals(df)
+    assert RecordFlattener(s).flatten(records).equals(df)
+
+
+def test_pack(tmp_path: pathlib.Path) -> None:
+    """Test packing unpacked content back into nested JSON objects.
+
+    Parameters
+    ----------
+    tmp_path : pathlib.Path
+        Temporary directory provided by `pytest`.
+
+    """
+    schema = parse_schema(
+        io.BytesIO(
+            b"""
+            a: List(List(Int8))
+            b: List(String)
+            c: List(Struct(d=dee: Int8, e: List(Int8)))
+            f: Struct(g=gee: String)
+            """,
+        ),
+    )
+    objects = [
+        {"a": [[1, 2], [3]], "b": ["x"], "c": [{"d": 1, "e": [5, 6]}], "f": {"g": "h"}},
+        {"a": [[4], None], "b": None, "c": [{"d": 2, "e": None}, {"d": 3, "e": [7]}]},
+    ]
+    data = "\n".join(json.dumps(o) for o in objects).encode()
+
+    # rows shuffled, renamed columns mapped back to their attributes
+    df = unpack_text(schema, data, row_index="row", list_index="_i").collect()
+    packed = pack(df.reverse(), schema, "row", "_i")
+    sink(packed, str(tmp_path / "packed.ndjson"))
+    assert [
+        json.loads(line) for line in (tmp_path / "packed.ndjson").read_text().split()
+    ] == [objects[0], objects[1] | {"f": {"g": None}}]
+
+    # round trip
+    for path_schema, path_data in (
+        ("tests/samples/complex.schema", "tests/samples/complex.ndjson"),
+        (schema, data),
+    ):
+        df = unpack_text(path_schema, path_data, row_index="row", list_index="_i")
+        packed = pack(df, path_schema, "row", "_i").collect().write_ndjson().encode()
+        assert (
+            unpack_text(path_schema, packed, row_index="row", list_index="_i")
+            .collect()
+            .equals(df.collect())
+        )
+
+    # lineage required to pack lists, not otherwise
+    with pytest.raises(LineageError):
+        pack(df, schema)
+    assert pack(
+        pl.DataFrame({"gee": ["h", None]}),
+        io.BytesIO(b"f: Struct(g=gee: String)"),
+    ).collect().to_dicts() == [{"f": {"g": "h"}}, {"f": {"g": None}}]
+
+
+def test_preview(tmp_path: pathlib.Path) -> None:
+    """Test unpacking the first rows of JSON data only, read in growing chunks.
+
+    Parameters
+    ----------
+    tmp_path : pathlib.Path
+        Fixture pointing to a temporary directory, unique to the test.
+
+    """
+    schema = "tests/samples/complex.schema"
+    line = pathlib.Path("tests/samples/complex.ndjson").read_bytes().strip()
+    for name in ("foo", "bar"):
+        (tmp_path / f"{name}.ndjson").write_bytes(b"\n" + (line + b"\n\n") * 10)
+    path = tmp_path / "*.ndjson"
+
+    # lineage as if the whole data was unpacked
+    kwargs = {"row_index": "row", "file_name": "file", "list_index": "_i"}
+    df = unpack_text(schema, path, **kwargs).collect()
+    for n in (1, 3, 41, 100):
+        assert preview(schema, path, n, chunk_size=16, **kwargs).equals(df.head(n))
+
+    # only as much as necessary is read
+    content = io.BytesIO(line + b"\n" + b"nope\n" * 100)
+    assert preview(schema, content, 2, chunk_size=len(line) + 1).height == 2
+
+    # no data at all
+    empty = preview(schema, b"", **kwargs)
+    assert empty.is_empty()
+    assert empty.schema == df.schema
+
+
+@pytest.mark.parametrize(
+    "name",
+    ["complex", "nested-list", "nested-struct", "simple"],
+)
+def test_record_flattener(name: str) -> None:
+    """Test flattening parsed JSON objects in Python, as `Polars` would unpack them.
+
+    Parameters
+    ----------
+    name : str
+        Name of the sample (schema and data) in `tests/samples`.
+
+    """
+    s = parse_schema(f"tests/samples/{name}.schema")
+    data = f"tests/samples/{name}.ndjson"
+    records = [
+        json.loads(line)
+        for line in pathlib.Path(data).read_text().splitlines()
+        if line.strip()
+    ]
+    df = unpack_text(s, data).collect()
+
+    # identical names, datatypes and rows
+    assert RecordFlattener(s).flatten(records).equals(df)
+    assert unpack_records(records, s, chunk_size=2).equals(df)
+
+    # empty and missing lists/structs
+    assert (
+        RecordFlattener(s)
+        .flatten([{}])
+        .equals(
+            unpack_text(s, b"{}").collect(),
+        )
+    )
+
+
 @pytest.mark.parametrize(
     ("df"),
     [
@@ -508,6 +1008,130 @@ def test_rename_fields() -> None:
     )
 
 
+@pytest.mark.parametrize(
+    ("fmt", "read"),
+    [
+        ("csv", pl.read_csv),
+        ("ipc", pl.read_ipc),
+        ("ipc_stream", pl.read_ipc_stream),
+        ("ndjson", pl.read_ndjson),
+        ("parquet", pl.read_parquet),
+    ],
+)
+def test_sink(
+    tmp_path: pathlib.Path,
+    fmt: str,
+    read: Callable[[pathlib.Path], pl.DataFrame],
+) -> None:
+    """Test writing unpacked content to a file, in all supported formats.
+
+    Parameters
+    ----------
+    tmp_path : pathlib.Path
+        Temporary directory provided by `pytest`.
+    fmt : str
+        Output format.
+    read : collections.abc.Callable[[pathlib.Path], polars.DataFrame]
+        Function reading the output file back.
+
+    """
+    for f in (unpack_ndjson, unpack_text):
+        df = f("tests/samples/complex.schema", "tests/samples/complex.ndjson")
+        path = tmp_path / f"{f.__name__}.{fmt}"
+        sink(df, str(path), fmt)
+
+        assert read(path).equals(df.collect())
+
+
+def test_sink_partitioned(tmp_path: pathlib.Path) -> None:
+    """Test writing Hive-style partitions, from several workers at once.
+
+    Parameters
+    ----------
+    tmp_path : pathlib.Path
+        Temporary directory provided by `pytest`.
+
+    """
+    line = pathlib.Path("tests/samples/complex.ndjson").read_text().strip()
+    df = unpack_text("tests/samples/complex.schema", f"{line}\n".encode() * 1000)
+    day = pl.from_epoch("timestamp").dt.date().alias("day")
+
+    # two workers writing to the same directories
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        for f in [
+            executor.submit(
+                sink,
+                df,
+                str(tmp_path),
+                partition_by=["source", day],
+                max_file_size=10000,
+            )
+            for _ in range(2)
+        ]:
+            f.result()
+
+    # partitioning columns given by the directories, files of bounded size
+    paths = sorted(tmp_path.glob("**/*.parquet"))
+    assert {p.parent.relative_to(tmp_path) for p in paths} == {
+        pathlib.Path("source=Online.Transactions/day=2013-06-25"),
+    }
+    assert len(paths) > 2
+    assert all(pl.read_parquet(p).estimated_size() <= 10000 for p in paths)
+    assert len({p.name.split("-")[1] for p in paths}) == 2
+    assert not list(tmp_path.glob("**/*.tmp"))
+
+    written = pl.read_parquet(tmp_path / "**/*.parquet", hive_partitioning=True)
+    expected = pl.concat([df.collect()] * 2)
+    assert written.height == expected.height
+    assert written.drop("source", "day").equals(expected.drop("source"))
+
+
+def test_sink_statistics(tmp_path: pathlib.Path) -> None:
+    """Test collecting statistics of each column while writing.
+
+    Parameters
+    ----------
+    tmp_path : pathlib.Path
+        Temporary directory provided by `pytest`.
+
+    """
+    df = unpack_text("tests/samples/complex.schema", "tests/samples/*.ndjson")
+    stats = sink(df, str(tmp_path / "unpacked.parquet"), statistics=True)
+
+    # identical to the statistics computed on the written content
+    written = pl.read_parquet(tmp_path / "unpacked.parquet")
+    assert stats["column"].to_list() == written.columns
+    assert stats["count"].to_list() == [written.height] * written.width
+    assert stats["null_count"].to_list() == list(written.null_count().row(0))
+    assert stats["distinct"].to_list() == [
+        written[c].drop_nulls().n_unique() for c in written.columns
+    ]
+    assert stats.filter(column="product").select("min", "max").row(0) == (
+        str(written["product"].min()),
+        str(written["product"].max()),
+    )
+
+    # accumulated over batches, distinct values estimated beyond the sketch
+    s = ColumnStatistics(sketch_size=256)
+    for batch in pl.DataFrame({"a": range(100000)}).iter_slices(1000):
+        s.update(
+            batch.with_columns(
+                b=pl.col("a") % 10,
+                c=pl.concat_list(pl.col("a") // 10, pl.col("a") % 10),
+            ),
+        )
+    stats = s.to_frame()
+    assert stats["count"].to_list() == [100000, 100000, 100000]
+    assert stats.select("min", "max").rows() == [
+        ("0", "99999"),
+        ("0", "9"),
+        (None, None),
+    ]
+    assert abs(stats["distinct"][0] / 100000 - 1) < 0.2
+    assert stats["distinct"][1] == 10
+    assert abs(stats["distinct"][2] / 100000 - 1) < 0.2
+
+
 def test_struct() -> None:
     """Test a simple `polars.Struct` containing a few fields.
 
@@ -721,3 +1345,330 @@ def test_struct_nested_in_struct() -> None:
             },
         ),
     )
+
+
+@pytest.mark.parametrize(
+    ("unpack", "write"),
+    [
+        (unpack_ipc, pl.DataFrame.write_ipc),
+        (unpack_parquet, pl.DataFrame.write_parquet),
+    ],
+)
+def test_unpack_columnar(
+    tmp_path: pathlib.Path,
+    unpack: Callable,
+    write: Callable,
+) -> None:
+    """Test unpacking nested columnar content, as if unpacking JSON content.
+
+    Parameters
+    ----------
+    tmp_path : pathlib.Path
+        Fixture pointing to a temporary directory, unique to the test.
+    unpack : Callable
+        Function unpacking the columnar content.
+    write : Callable
+        Method writing the columnar content.
+
+    """
+    schema = "tests/samples/complex.schema"
+    path = "tests/samples/complex.ndjson"
+
+    # nested content, with an extra column and a missing field
+    df = pl.read_ndjson(path).with_columns(
+        pl.struct(
+            pl.col("headers").struct.field("timestamp"),
+            pl.col("headers").struct.field("offset"),
+        ).alias("headers"),
+        extra=pl.lit(1),
+    )
+    write(df, tmp_path / "complex")
+
+    unpacked = unpack(schema, tmp_path / "complex", row_index="row", list_index="_i")
+    expected = unpack_text(schema, path, row_index="row", list_index="_i").collect()
+    assert unpacked.collect().equals(
+        expected.with_columns(pl.lit(None, pl.String).alias("source")),
+    )
+
+    # extra top-level column never read, only the columns of the schema projected
+    plan = unpacked.explain()
+    fields = parse_schema(schema).struct.fields
+    assert "extra" not in plan
+    assert f"PROJECT {len(fields)}/{df.width} COLUMNS" in plan
+
+    # in memory content
+    unpacked = unpack(schema, (tmp_path / "complex").read_bytes(), file_name="file")
+    assert unpacked.collect()["file"].is_null().all()
+
+
+@pytest.mark.parametrize("arrow", [True, False])
+def test_unpack_records(monkeypatch: pytest.MonkeyPatch, arrow: bool) -> None:
+    """Test unpacking parsed JSON objects, with or without `pyarrow`.
+
+    Parameters
+    ----------
+    monkeypatch : pytest.MonkeyPatch
+        Patching utilities provided by `pytest`.
+    arrow : bool
+        Whether `pyarrow` can be imported.
+
+    """
+    if arrow:
+        pytest.importorskip("pyarrow")
+    else:
+        monkeypatch.setitem(sys.modules, "pyarrow", None)
+
+    schema = "tests/samples/complex.schema"
+    data = "tests/samples/complex.ndjson"
+    lines = pathlib.Path(data).read_text().splitlines()
+    records = (json.loads(line) for line in lines if line.strip())
+    df = unpack_text(schema, data).collect()
+
+    # generator consumed chunk by chunk
+    assert unpack_records(records, schema, chunk_size=2, small_batch=0).equals(df)
+
+    # nothing to unpack
+    assert unpack_records([], schema).equals(df.clear())
+
+    # values not fitting the schema, handled as json decoding does
+    schema = parse_schema(io.BytesIO(b"a: String\nb: Int64\nc: UInt8\nd: List(Int8)"))
+    records = [
+        {"a": 1, "b": 2.7, "c": 300, "d": [1, 200]},
+        {"a": True, "b": 2, "c": 3, "d": [-1]},
+    ]
+    data = "\n".join(json.dumps(r) for r in records).encode()
+    df = unpack_text(schema, data).collect()
+
+    # identical outcome whether the batch is flattened in python or not
+    for small_batch in (0, 50):
+        assert unpack_records(records, schema, small_batch=small_batch).equals(df)
+
+        # text in numeric leaves, objects in place of lists
+        assert unpack_records(
+            [{"a": "x", "b": "q", "c": "1", "d": {"e": 1}}],
+            schema,
+            small_batch=small_batch,
+        ).rows() == [("x", None, None, None)]
+
+    # json paths built with the separator of the schema
+    schema = SchemaParser("a: Struct(b=bee: Int64, c: List(Int64))", separator="/")
+    schema.to_struct()
+    records = [{"a": {"b": 1, "c": [2, 3]}}]
+    for small_batch in (0, 50):
+        df = unpack_records(records, schema, small_batch=small_batch)
+        assert df.rows() == [(1, 2), (1, 3)]
+        assert df.columns == ["bee", "a/c"]
+
+
+def test_unpack_routes() -> None:
+    """Test unpacking JSON objects of several types, each given its own schema."""
+    transaction = pathlib.Path("tests/samples/complex.ndjson").read_text().strip()
+    heartbeat = '{"headers": {"source": 42}, "uptime": 3600}'
+    unknown = '{"headers": {"source": "unknown"}, "foo": "bar"}'
+    data = f"{heartbeat}\n{transaction}\n{unknown}\n{transaction}".encode()
+
+    schemas = {
+        "Online.Transactions": "tests/samples/complex.schema",
+        "42": io.BytesIO(b"uptime: Int64"),
+    }
+    dfs = pl.collect_all(
+        unpack_routes(schemas, data, "headers.source", row_index="row").values(),
+    )
+
+    # each type unpacked given its schema, rows counted across types
+    df = unpack_text(schemas["Online.Transactions"], f"{transaction}\n".encode() * 2)
+    assert dfs[0].drop("row").equals(df.collect())
+    assert dfs[0]["row"].unique().to_list() == [1, 3]
+    assert dfs[1].equals(
+        pl.DataFrame(
+            {"row": [0], "uptime": [3600]}, schema_overrides={"row": pl.UInt32}
+        ),
+    )
+
+
+def test_unpack_text_columns() -> None:
+    """Test unpacking only some columns, out of any list or not."""
+    schema = "tests/samples/complex.schema"
+    data = "tests/samples/complex.ndjson"
+    df = unpack_text(schema, data).collect()
+
+    # out of any list: one row per json object
+    assert (
+        unpack_text(schema, data, columns=["method", "timestamp"])
+        .collect()
+        .equals(
+            df.select("method", "timestamp").unique(maintain_order=True),
+        )
+    )
+
+    # innermost list: identical to a selection of the fully unpacked content
+    assert (
+        unpack_text(schema, data, columns=["timestamp", "promotion"])
+        .collect()
+        .equals(df.select("timestamp", "promotion"))
+    )
+
+    # list positions last, outermost list first
+    df = unpack_text(schema, data, list_index="#").collect()
+    assert (
+        unpack_text(schema, data, columns=["timestamp", "promotion"], list_index="#")
+        .collect()
+        .equals(
+            df.select(
+                "timestamp",
+                "promotion",
+                "payload.lines#",
+                "payload.lines.discounts#",
+            ),
+        )
+    )
+
+    # unknown column
+    with pytest.raises(pl.exceptions.ColumnNotFoundError):
+        unpack_text(schema, data, columns=["unknown"]).collect()
+
+
+def test_unpack_tolerant() -> None:
+    """Test quarantining malformed lines, and aborting when too many are."""
+    schema = "tests/samples/complex.schema"
+    line = pathlib.Path("tests/samples/complex.ndjson").read_text().strip()
+    mismatch = line.replace('"location": 765', '"location": "here"')
+    nested = line.replace('"quantity": 2', '"quantity": 2.5')
+    shaped = line.replace('"type": "REGISTERED"', '"type": ["REGISTERED"]')
+    quoted = line.replace('"quantity": 2', '"quantity": "2"')
+    data = (
+        f"{line}\n\nnope\n[1, 2]\n{mismatch}\n{nested}\n{shaped}\n{line}\n{quoted}\n"
+    ).encode()
+
+    unpacked, quarantined = pl.collect_all(
+        unpack_tolerant(schema, data, row_index="row"),
+    )
+
+    # valid lines unpacked as usual, quoted numbers not told apart
+    df = unpack_text(schema, f"{line}\n".encode() * 3).collect()
+    assert unpacked.drop("row").equals(df)
+    assert unpacked["row"].unique().to_list() == [0, 7, 8]
+
+    # malformed lines set aside, with the reason why
+    assert quarantined.columns == ["file", "line", "raw", "reason"]
+    assert quarantined["line"].to_list() == [1, 2, 3, 4, 5, 6]
+    assert quarantined["reason"].to_list() == [
+        "empty line",
+        "invalid JSON",
+        "not a JSON object",
+        "type mismatch: payload.location",
+        "type mismatch: payload.lines.quantity",
+        "type mismatch: payload.customer.type",
+    ]
+
+    # error rate, checked before anything is unpacked
+    with pytest.raises(ErrorRateExceededError):
+        unpack_tolerant(schema, data, max_error_rate=0.6)
+    unpacked, _ = unpack_tolerant(schema, data, max_error_rate=0.7)
+    assert isinstance(unpacked, pl.LazyFrame)
+
+
+def test_unpack_versions() -> None:
+    """Test unpacking JSON objects of several versions into harmonized columns."""
+    data = b"""{"id": 1, "amount": "1.5", "lines": [{"product": 1}, {"product": 2}]}
+{"meta": {"version": 2}, "id": 2, "amountInclVat": 2.5, "lines": []}
+{"meta": {"version": "3"}, "id": 3, "total": 3.5, "currency": "EUR"}
+{"meta": {"version": "4"}, "id": 4}"""
+    schemas = {
+        None: b"id: Int32, amount: String, lines: List(Struct(product: Int8))",
+        "2": b"id: Int64, amountInclVat=amount: Float64",
+        "3": b"id: Int64, total=amount: Float64, currency: String",
+    }
+    df = unpack_versions(schemas, data, "meta.version", row_index="row")
+
+    # renamed, cast and missing columns, unknown versions ignored
+    assert df.collect().equals(
+        pl.DataFrame(
+            {
+                "row": [0, 0, 1, 2],
+                "version": [None, None, "2", "3"],
+                "id": [1, 1, 2, 3],
+                "amount": [1.5, 1.5, 2.5, 3.5],
+                "currency": [None, None, None, "EUR"],
+                "product": [1, 2, None, None],
+            },
+            schema_overrides={"row": pl.UInt32, "product": pl.Int8},
+        ),
+    )
+
+    # rows per version
+    assert df.group_by("version").len().sort("version").collect().rows() == [
+        (None, 2),
+        ("2", 1),
+        ("3", 1),
+    ]
+
+    # list positions last, named after the lists of the schemas
+    df = unpack_versions(schemas, data, "meta.version", list_index="id")
+    assert df.collect_schema().names() == [
+        "version",
+        "id",
+        "amount",
+        "currency",
+        "product",
+        "linesid",
+    ]
+
+
+def test_validate() -> None:
+    """Test reporting the conformance of JSON data to a schema, leaf by leaf."""
+    schema = io.BytesIO(b"a: UInt8\nb=bee: String\nc: List(Struct(d: Int64))")
+    data = (
+        b'{"a": 1, "b": "x", "c": [{"d": 1}, {"d": "x"}], "e": 1}\n'
+        b'{"a": 300, "c": [{"d": 2}]}\n'
+        b'{"a": "x", "b": "y", "c": [{"d": 3, "f": true}]}'
+    )
+
+    df = validate(schema, data)
+
+    # mismatches (overflows included) and missing values, or fields out of the schema
+    assert df.select(
+        "path", "column", "in_schema", "values", "missing", "mismatched", "overflowed"
+    ).rows() == [
+        ("a", "a", True, 3, 0, 2, 1),
+        ("b", "bee", True, 3, 1, 0, 0),
+        ("c.d", "d", True, 4, 0, 1, 0),
+        ("c.f", None, False, 4, 3, None, None),
+        ("e", None, False, 3, 2, None, None),
+    ]
+    assert df["mismatched_rate"].to_list()[:3] == [2 / 3, 0, 1 / 4]
+    assert df["values"].dtype == pl.UInt64
+
+    # sample of the data only, extra fields inferred from the sample too
+    schema.seek(0)
+    df = validate(schema, data, sample=1)
+    assert df.select("path", "values").rows() == [
+        ("a", 1),
+        ("b", 1),
+        ("c.d", 2),
+        ("e", 1),
+    ]
+
+    # ranges checked on numbers, floats mismatching integer datatypes; quoted numbers
+    # are not told apart from numbers
+    data = b'{"a": "12", "c": [{"d": 1.5}]}\n{"a": 256.0, "c": [{"d": 2}]}'
+    schema.seek(0)
+    df = validate(schema, data)
+    assert df.select("path", "mismatched", "overflowed").rows()[::2] == [
+        ("a", 1, 1),
+        ("c.d", 1, 0),
+    ]
+
+    # values of the wrong shape mismatched, lists holding any left out
+    data = (
+        b'{"a": 1, "b": "x", "c": [{"d": 1}]}\n'
+        b'{"a": {"x": 1}, "b": ["x"], "c": {"d": 1}}\n'
+        b'{"a": 2, "c": [{"d": 1}, {"d": [2]}]}'
+    )
+    schema.seek(0)
+    df = validate(schema, data, infer_schema_length=1)
+    assert df.select("path", "values", "missing", "mismatched").rows() == [
+        ("a", 3, 0, 1),
+        ("b", 3, 1, 1),
+        ("c.d", 1, 0, 0),
+    ]